@@ -1,57 +1,110 @@
 """Initialize the Ookla Speedtest integration."""
 
+import asyncio
 import json
 import logging
 import subprocess
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import replace
 from datetime import datetime, timedelta
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.event import async_call_later, async_track_point_in_time
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_point_in_time,
+    async_track_time_change,
+)
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 from .const import (
-    ATTR_BUFFERBLOAT_GRADE,
-    ATTR_DATE_LAST_TEST,
-    ATTR_DL_PCT,
-    ATTR_DOWNLOAD,
-    ATTR_DOWNLOAD_LATENCY_IQM,
-    ATTR_DOWNLOAD_LATENCY_LOW,
-    ATTR_DOWNLOAD_LATENCY_HIGH,
-    ATTR_DOWNLOAD_LATENCY_JITTER,
-    ATTR_ISP,
-    ATTR_JITTER,
-    ATTR_PING,
-    ATTR_PING_LOW,
-    ATTR_PING_HIGH,
-    ATTR_RESULT_URL,
-    ATTR_SERVER,
-    ATTR_UL_PCT,
-    ATTR_UPLOAD,
-    ATTR_UPLOAD_LATENCY_IQM,
-    ATTR_UPLOAD_LATENCY_LOW,
-    ATTR_UPLOAD_LATENCY_HIGH,
-    ATTR_UPLOAD_LATENCY_JITTER,
+    CONF_ADAPTIVE_SCHEDULING,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_LIVE_BANDWIDTH,
+    ATTR_TEST_PHASE,
+    ATTR_TEST_PROGRESS,
     CONF_FALLBACK_TO_CLOSEST,
+    CONF_CPU_AFFINITY,
+    CONF_DEGRADATION_RETEST,
+    CONF_HISTORY_RETENTION,
+    CONF_IONICE_CLASS,
     CONF_ISP_DL_SPEED,
     CONF_ISP_UL_SPEED,
+    CONF_LIVE_PROGRESS,
     CONF_MANUAL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MONTHLY_DATA_BUDGET,
+    CONF_NICE,
+    CONF_PROBE_INTERVAL,
+    CONF_PROBE_TARGETS,
     CONF_SCAN_INTERVAL,
     CONF_SERVER_ID,
+    CONF_SKIP_CPU_BOUND,
     CONF_START_TIME,
+    CONF_TEST_TIMEOUT,
+    CPU_SAMPLE_INTERVAL,
+    DEFAULT_ADAPTIVE_SCHEDULING,
+    DEFAULT_CPU_AFFINITY,
+    DEFAULT_DEGRADATION_RETEST,
     DEFAULT_FALLBACK_TO_CLOSEST,
+    DEFAULT_HISTORY_RETENTION,
+    DEFAULT_IONICE_CLASS,
+    DEFAULT_LIVE_PROGRESS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_MONTHLY_DATA_BUDGET,
+    DEFAULT_NICE,
+    DEFAULT_PROBE_INTERVAL,
+    DEFAULT_PROBE_TARGETS,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SKIP_CPU_BOUND,
+    DEFAULT_TEST_TIMEOUT,
+    DEGRADATION_RETEST_DELAY,
     DOMAIN,
-    SPEEDTEST_BIN_PATH,
+    EVENT_DEGRADATION,
+    KILL_GRACE_PERIOD,
+    LOOP_LAG_SAMPLE_INTERVAL,
+    PHASE_IDLE,
+    PHASE_STARTING,
+    PRIORITY_MANUAL,
+    PRIORITY_SCHEDULED,
+    PROGRESS_PHASES,
+    PROGRESS_UPDATE_INTERVAL,
+    ROLLING_EWMA_ALPHA,
+    ROLLING_WINDOW_SIZE,
     SERVICE_RUN_SPEEDTEST,
+    SIGNAL_RUN_TIMING,
     STARTUP_DELAY,
+    TIMING_HISTORY_SIZE,
 )
-from .binary_manager import async_setup_speedtest
+from .adaptive import AdaptiveInterval
+from .binary_manager import async_setup_speedtest, speedtest_bin_path
+from .cpu_monitor import VALIDITY_CPU_BOUND, CpuMonitor
+from .degradation import DegradationDetector
 from .helpers import validate_server_id
+from .history import ResultHistory
+from .probe import ProbeCoordinator, parse_probe_targets
+from .process_priority import log_priority_warnings, parse_cpu_list, priority_command
+from .result import SpeedtestResult
+from .scheduler import async_get_scheduler
+from .sketch import LatencyTrends
+from .stats import ResultStatistics
+from .timing import LoopLagMonitor, RunTiming, elapsed_ms
+from .usage import PERIOD_MONTH, DataUsage
+from .websocket_api import async_register_websocket_commands
 from .www_manager import (
     async_setup_cards,
     async_register_resources_service,
@@ -63,19 +116,31 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.SENSOR]
 
+STORAGE_VERSION = 1
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+RUN_SPEEDTEST_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Ookla Speedtest component."""
+    async_register_websocket_commands(hass)
+    # Static paths can only be registered once per run, so not per entry
+    await async_setup_cards(hass)
+    return True
+
 
 async def async_setup_cards_and_resources(hass: HomeAssistant) -> None:
     """Set up custom cards and register resources.
     
     This function:
-    1. Copies card files to www folder for accessibility
-    2. Registers the service to add resources to dashboards
-    3. Automatically registers resources on startup
+    1. Registers the service to add resources to dashboards
+    2. Automatically registers resources on startup
+
+    The card files themselves are served by async_setup.
     """
     try:
-        # Copy cards to www folder
-        await async_setup_cards(hass)
-        
         # Register service for manual resource registration
         await async_register_resources_service(hass)
 
@@ -98,7 +163,7 @@ async def async_setup_cards_and_resources(hass: HomeAssistant) -> None:
         _LOGGER.error("Failed to set up cards: %s", e)
 
 
-class SpeedtestCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+class SpeedtestCoordinator(DataUpdateCoordinator[SpeedtestResult | None]):
     """Coordinator to manage Speedtest updates."""
 
     def __init__(
@@ -112,6 +177,18 @@ class SpeedtestCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         isp_dl_speed: float | None = None,
         isp_ul_speed: float | None = None,
         fallback_to_closest: bool = DEFAULT_FALLBACK_TO_CLOSEST,
+        test_timeout: int = DEFAULT_TEST_TIMEOUT,
+        live_progress: bool = DEFAULT_LIVE_PROGRESS,
+        history_retention: int = DEFAULT_HISTORY_RETENTION,
+        nice: int = DEFAULT_NICE,
+        ionice_class: str = DEFAULT_IONICE_CLASS,
+        cpu_affinity: set[int] | None = None,
+        skip_cpu_bound: bool = DEFAULT_SKIP_CPU_BOUND,
+        degradation_retest: bool = DEFAULT_DEGRADATION_RETEST,
+        adaptive_scheduling: bool = DEFAULT_ADAPTIVE_SCHEDULING,
+        min_scan_interval: int = DEFAULT_MIN_SCAN_INTERVAL,
+        max_scan_interval: int = DEFAULT_MAX_SCAN_INTERVAL,
+        monthly_data_budget: int = DEFAULT_MONTHLY_DATA_BUDGET,
     ) -> None:
         """Initialize the coordinator."""
         self.server_id = server_id
@@ -121,12 +198,56 @@ class SpeedtestCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.isp_dl_speed = isp_dl_speed
         self.isp_ul_speed = isp_ul_speed
         self.fallback_to_closest = fallback_to_closest
+        self.test_timeout = test_timeout
+        self.live_progress = live_progress
+        self.nice = nice
+        self.ionice_class = ionice_class
+        self.cpu_affinity = cpu_affinity
+        # Applied by a wrapper before the CLI is exec'd
+        self._priority_prefix = priority_command(nice, ionice_class, cpu_affinity)
+        self.skip_cpu_bound = skip_cpu_bound
+        self.degradation_retest = degradation_retest
+        self.monthly_data_budget = monthly_data_budget
+        self.progress: dict[str, Any] = {}
+        # True while a run is queued or running; the last result stays in data
+        self.testing = False
+        self._last_progress_update = 0.0
+        self._reset_progress()
         self._unsub_schedule = None
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"
+        )
+        self.history = ResultHistory(hass, entry.entry_id, history_retention)
+        self._process: asyncio.subprocess.Process | None = None
+        self._shutting_down = False
+        # Phase timings of recent runs, newest last
+        self.timings: deque[RunTiming] = deque(maxlen=TIMING_HISTORY_SIZE)
+        self._timing: RunTiming | None = None
+        self._cpu_monitor: CpuMonitor | None = None
+        # Latency probes between tests, when enabled
+        self.probe: ProbeCoordinator | None = None
+        self.latency_trends = LatencyTrends()
+        self.rolling_stats = ResultStatistics(ROLLING_WINDOW_SIZE, ROLLING_EWMA_ALPHA)
+        self.degradation = DegradationDetector()
+        self.data_usage = DataUsage()
+        # Alarms the next result confirms or clears, while a re-test is due
+        self._suspected_degradation: list[dict[str, Any]] | None = None
+        self._unsub_retest = None
+        # When the next scheduled run is due, if one is scheduled
+        self.next_run: datetime | None = None
+        self._pending_timing: RunTiming | None = None
+        self._queued_at = 0.0
 
         # If start_time is set, we handle scheduling manually to prevent drift and align to clock
         update_interval = None
+        self.adaptive: AdaptiveInterval | None = None
         if not manual and not start_time:
             update_interval = timedelta(minutes=scan_interval)
+            if adaptive_scheduling:
+                self.adaptive = AdaptiveInterval(
+                    scan_interval, min_scan_interval, max_scan_interval
+                )
+                update_interval = timedelta(minutes=self.adaptive.interval)
 
         super().__init__(
             hass,
@@ -167,6 +288,7 @@ class SpeedtestCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             next_run += timedelta(minutes=intervals * self.scan_interval)
             
         _LOGGER.debug("Scheduling next speedtest for %s", next_run)
+        self.next_run = next_run
 
         if self._unsub_schedule:
             self._unsub_schedule()
@@ -175,15 +297,177 @@ class SpeedtestCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self.hass, self._async_scheduled_refresh, next_run
         )
 
+    async def async_restore_state(self) -> None:
+        """Restore the last result and statistics saved before a restart."""
+        stored = await self._store.async_load()
+        if not stored:
+            return
+
+        if latency_trends := stored.get("latency_trends"):
+            self.latency_trends = LatencyTrends.from_dict(latency_trends)
+        if rolling_stats := stored.get("rolling_stats"):
+            self.rolling_stats = ResultStatistics(
+                ROLLING_WINDOW_SIZE, ROLLING_EWMA_ALPHA, rolling_stats
+            )
+        if degradation := stored.get("degradation"):
+            self.degradation = DegradationDetector(degradation)
+        if data_usage := stored.get("data_usage"):
+            self.data_usage = DataUsage(data_usage)
+        if self.adaptive and (adaptive := stored.get("adaptive")):
+            self.adaptive = AdaptiveInterval(
+                self.scan_interval, self.adaptive.minimum, self.adaptive.maximum, adaptive
+            )
+            self.update_interval = timedelta(minutes=self.adaptive.interval)
+        if last_result := stored.get("last_result"):
+            self.data = SpeedtestResult.from_dict(last_result)
+            _LOGGER.debug("Restored speedtest result from %s", self.data.timestamp)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Persist coordinator state shortly after it changes."""
+        self._store.async_delay_save(self._data_to_store, 10)
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the coordinator state to persist."""
+        return {
+            "last_result": self.data.as_dict() if self.data else None,
+            "latency_trends": self.latency_trends.as_dict(),
+            "rolling_stats": self.rolling_stats.as_dict(),
+            "degradation": self.degradation.as_dict(),
+            "data_usage": self.data_usage.as_dict(),
+            "adaptive": self.adaptive.as_dict() if self.adaptive else None,
+        }
+
+    def first_run_delay(self) -> float:
+        """Return seconds until the first run after startup is due.
+
+        A restored result postpones the run until a full scan interval (the
+        adaptive one, if enabled) has passed since that test, but never
+        sooner than STARTUP_DELAY.
+        """
+        if self.data is None or self.data.timestamp is None:
+            return STARTUP_DELAY
+        interval = self.adaptive.interval if self.adaptive else self.scan_interval
+        due = self.data.timestamp + timedelta(minutes=interval)
+        return max(STARTUP_DELAY, (due - dt_util.now()).total_seconds())
+
     async def _async_scheduled_refresh(self, _):
         """Refresh data."""
         await self.async_request_refresh()
 
-    async def _async_update_data(self) -> dict[str, Any] | None:
-        """Fetch new data from speedtest-cli."""
+    async def async_request_manual_refresh(self) -> None:
+        """Run a test now, queued ahead of scheduled runs.
+
+        The run goes straight to the run queue with manual priority rather
+        than through the debounced refresh, which drops requests while
+        another refresh is in progress. A scheduled run of this entry that
+        is already queued is promoted and shared. Manual runs ignore the
+        monthly data budget.
+        """
+        if self.budget_exhausted:
+            _LOGGER.warning(
+                "The monthly data budget of %s MB is used up; running the manual "
+                "speedtest anyway",
+                self.monthly_data_budget,
+            )
+        # Keep the last result and flag it as being re-tested; clearing it
+        # would make every sensor write state twice per test
+        self.testing = True
+        self.async_update_listeners()
+        try:
+            data = await self._async_queue_run(PRIORITY_MANUAL)
+        finally:
+            # Already cleared when the run started; not when it was cancelled
+            self.testing = False
+        self.async_set_updated_data(data)
+
+    async def _async_update_data(self) -> SpeedtestResult | None:
+        """Run a scheduled test through the shared run queue.
+
+        Scheduled runs, including degradation re-tests, are skipped while
+        the monthly data budget is used up, keeping the last result.
+        """
         if self.start_time:
             self._schedule_next()
+        if self.budget_exhausted:
+            _LOGGER.info(
+                "Skipping scheduled speedtest; the monthly data budget of %s MB "
+                "is used up",
+                self.monthly_data_budget,
+            )
+            if self._suspected_degradation:
+                _LOGGER.info("Dropping the degradation re-test with the skipped run")
+                self._suspected_degradation = None
+            if self.update_interval is not None:
+                self.next_run = dt_util.now() + self.update_interval
+            return self.data
+        return await self._async_queue_run(PRIORITY_SCHEDULED)
+
+    async def _async_queue_run(self, priority: int) -> SpeedtestResult | None:
+        """Queue a test at the given priority and return its result."""
+        self._queued_at = time.perf_counter()
+        return await async_get_scheduler(self.hass).async_run(
+            self.entry.entry_id, self._async_execute_test, priority
+        )
+
+    async def _async_execute_test(self) -> SpeedtestResult | None:
+        """Run a queued speedtest while tracking live progress and timing."""
+        timing = self._timing = RunTiming(dt_util.now(), elapsed_ms(self._queued_at))
+        lag_monitor = LoopLagMonitor(LOOP_LAG_SAMPLE_INTERVAL)
+        lag_task = self.hass.async_create_background_task(
+            lag_monitor.async_run(), name=f"{DOMAIN} event loop lag"
+        )
+        cpu_monitor = self._cpu_monitor = CpuMonitor(CPU_SAMPLE_INTERVAL)
+        cpu_task = self.hass.async_create_background_task(
+            cpu_monitor.async_run(self.hass), name=f"{DOMAIN} CPU sampling"
+        )
+        self.testing = True
+        self._async_set_progress(PHASE_STARTING, 0, None, force=True)
+        try:
+            data = await self._async_run_test()
+        finally:
+            # Listeners are notified with the final result right after this
+            self.testing = False
+            self._reset_progress()
+            self._timing = None
+            self._cpu_monitor = None
+            lag_task.cancel()
+            cpu_task.cancel()
+            timing.loop_lag_max = lag_monitor.max_ms
+            timing.loop_lag_avg = lag_monitor.avg_ms
+
+        if data is not None:
+            data = self._apply_cpu_usage(data, cpu_monitor)
+            self.data_usage.add(data)
+            self.latency_trends.add(data)
+            if self.adaptive:
+                # Compared with the rolling statistics before they include it
+                self.adaptive.add(data, self.rolling_stats)
+            self.rolling_stats.add(data)
+            self._check_degradation(data)
+            timing.download_elapsed = data.download_elapsed
+            timing.upload_elapsed = data.upload_elapsed
+            timing.success = True
+        # Completed by async_update_listeners once the result is written
+        self._pending_timing = timing
+
+        if self.adaptive and not self._shutting_down:
+            if data is None:
+                self.adaptive.failed()
+            self._apply_adaptive_interval()
+        if self.update_interval is not None:
+            # The coordinator schedules the next run once this one returns
+            self.next_run = dt_util.now() + self.update_interval
 
+        if data is not None:
+            # The store reads self.data when it writes, after the update lands
+            self._async_schedule_save()
+            await self.history.async_append(data)
+        return data
+
+    async def _async_run_test(self) -> SpeedtestResult | None:
+        """Run a speedtest, falling back to the closest server if configured."""
         server_id = (
             self.server_id
             if self.server_id != "closest" and validate_server_id(self.server_id)
@@ -192,8 +476,7 @@ class SpeedtestCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         cmd = self._build_speedtest_cmd(server_id)
 
         try:
-            process = await self._async_run_speedtest(cmd)
-            result = json.loads(process.stdout)
+            result = await self._async_fetch_result(cmd)
 
             _LOGGER.debug("Result from speedtest invocation: %s", result)
             return self._process_speedtest_result(result)
@@ -205,8 +488,7 @@ class SpeedtestCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 )
                 fallback_cmd = self._build_speedtest_cmd(None)
                 try:
-                    process = await self._async_run_speedtest(fallback_cmd)
-                    result = json.loads(process.stdout)
+                    result = await self._async_fetch_result(fallback_cmd)
                     _LOGGER.debug("Result from fallback speedtest invocation: %s", result)
                     return self._process_speedtest_result(result)
                 except subprocess.CalledProcessError as fallback_error:
@@ -222,11 +504,18 @@ class SpeedtestCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                         " ".join(fallback_cmd),
                     )
                     return None
+                except TimeoutError:
+                    _LOGGER.error(
+                        "Fallback speedtest timed out after %s seconds. Command: %s",
+                        self.test_timeout,
+                        " ".join(fallback_cmd),
+                    )
+                    return None
                 except json.JSONDecodeError as fallback_json_error:
                     _LOGGER.error(
                         "Failed to parse fallback Speedtest JSON output: %s. Output: %s",
                         fallback_json_error,
-                        process.stdout if "process" in locals() else "N/A",
+                        fallback_json_error.doc,
                     )
                     return None
                 except (KeyError, TypeError) as fallback_data_error:
@@ -236,14 +525,25 @@ class SpeedtestCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     )
                     return None
 
+            if self._shutting_down:
+                _LOGGER.debug("Speedtest aborted because the integration is unloading")
+                return None
+
             error_msg = e.stderr or e.stdout or "No error output"
             _LOGGER.error("Speedtest failed (exit code %s): %s. Command: %s", e.returncode, error_msg, " ".join(cmd))
             return None
+        except TimeoutError:
+            _LOGGER.error(
+                "Speedtest timed out after %s seconds. Command: %s",
+                self.test_timeout,
+                " ".join(cmd),
+            )
+            return None
         except json.JSONDecodeError as e:
             _LOGGER.error(
                 "Failed to parse Speedtest JSON output: %s. Output: %s",
                 e,
-                process.stdout if "process" in locals() else "N/A",
+                e.doc,
             )
             return None
         except (KeyError, TypeError) as e:
@@ -255,21 +555,202 @@ class SpeedtestCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             return None
 
-    @staticmethod
-    def _build_speedtest_cmd(server_id: str | None) -> list[str]:
+    def _build_speedtest_cmd(self, server_id: str | None) -> list[str]:
         """Build the speedtest command for an optional server ID."""
-        cmd = [SPEEDTEST_BIN_PATH, "--accept-license", "--accept-gdpr", "--format=json"]
+        cmd = [speedtest_bin_path(), "--accept-license", "--accept-gdpr"]
+        if self.live_progress:
+            cmd.extend(["--format=jsonl", "--progress=yes"])
+        else:
+            cmd.append("--format=json")
         if server_id:
             cmd.extend(["-s", server_id])
         return cmd
 
+    async def _async_fetch_result(self, cmd: list[str]) -> dict[str, Any]:
+        """Run speedtest and return the CLI's result payload.
+
+        In live progress mode every JSONL line is parsed exactly once as it
+        arrives; progress events update the live sensors and the final
+        "result" event is returned.
+        """
+        if not self.live_progress:
+            process = await self._async_run_speedtest(cmd)
+            start = time.perf_counter()
+            try:
+                return json.loads(process.stdout)
+            finally:
+                self._timing.parse += elapsed_ms(start)
+
+        result: dict[str, Any] | None = None
+
+        def handle_line(line: str) -> bool:
+            nonlocal result
+            start = time.perf_counter()
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                return False
+            finally:
+                self._timing.parse += elapsed_ms(start)
+            if not isinstance(event, dict):
+                return False
+
+            event_type = event.get("type")
+            if event_type == "result":
+                result = event
+                return True
+            if event_type in PROGRESS_PHASES:
+                self._handle_progress_event(event_type, event.get(event_type) or {})
+                return True
+            return event_type == "testStart"
+
+        await self._async_run_speedtest(cmd, handle_line)
+        if result is None:
+            raise KeyError("result")
+        return result
+
+    def _handle_progress_event(self, phase: str, payload: dict[str, Any]) -> None:
+        """Translate a CLI progress event into live progress values."""
+        phase_progress = min(max(payload.get("progress", 0), 0), 1)
+        overall = (PROGRESS_PHASES.index(phase) + phase_progress) / len(PROGRESS_PHASES)
+        bandwidth = payload.get("bandwidth")
+        if bandwidth is not None:
+            bandwidth = round(bandwidth * 8 / 1000000, 2)
+        self._async_set_progress(phase, round(overall * 100, 1), bandwidth)
+
+    @callback
+    def _async_set_progress(
+        self,
+        phase: str,
+        progress: float | None,
+        bandwidth: float | None,
+        force: bool = False,
+    ) -> None:
+        """Store live progress and notify listeners at most every 500 ms.
+
+        A phase change is always pushed so the phase sensor never lags.
+        """
+        phase_changed = phase != self.progress[ATTR_TEST_PHASE]
+        self.progress[ATTR_TEST_PHASE] = phase
+        self.progress[ATTR_TEST_PROGRESS] = progress
+        self.progress[ATTR_LIVE_BANDWIDTH] = bandwidth
+
+        now = time.monotonic()
+        if (
+            force
+            or phase_changed
+            or now - self._last_progress_update >= PROGRESS_UPDATE_INTERVAL
+        ):
+            self._last_progress_update = now
+            self.async_update_listeners()
+
+    def _reset_progress(self) -> None:
+        """Return live progress to idle without notifying listeners."""
+        self.progress[ATTR_TEST_PHASE] = PHASE_IDLE
+        self.progress[ATTR_TEST_PROGRESS] = None
+        self.progress[ATTR_LIVE_BANDWIDTH] = None
+
     async def _async_run_speedtest(
-        self, cmd: list[str]
+        self, cmd: list[str], on_line: Callable[[str], bool] | None = None
     ) -> subprocess.CompletedProcess[str]:
-        """Run speedtest in the executor."""
-        return await self.hass.async_add_executor_job(
-            lambda: subprocess.run(cmd, capture_output=True, text=True, check=True)
+        """Run speedtest as an asyncio subprocess with a hard deadline.
+
+        When on_line is given, stdout is consumed line by line and only the
+        lines it does not handle are kept in the returned output.
+
+        Raises subprocess.CalledProcessError on a non-zero exit code and
+        TimeoutError when the run exceeds test_timeout. The process is
+        terminated (SIGTERM, then SIGKILL) on timeout or cancellation.
+        """
+        start = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            *self._priority_prefix,
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
+        self._timing.spawn += elapsed_ms(start)
+        # The wrapper execs the CLI, which keeps its process ID
+        self._cpu_monitor.pid = process.pid
+        start = time.perf_counter()
+        self._process = process
+        try:
+            async with asyncio.timeout(self.test_timeout):
+                if on_line is None:
+                    stdout, stderr = await process.communicate()
+                    stdout_text = stdout.decode(errors="replace")
+                else:
+                    stdout_text, stderr = await asyncio.gather(
+                        self._async_stream_lines(process.stdout, on_line),
+                        process.stderr.read(),
+                    )
+                    await process.wait()
+        except (TimeoutError, asyncio.CancelledError):
+            await self._async_terminate_process(process)
+            raise
+        finally:
+            self._process = None
+            self._timing.cli_run += elapsed_ms(start)
+
+        stderr_text = stderr.decode(errors="replace")
+        log_priority_warnings(stderr_text)
+        if process.returncode:
+            raise subprocess.CalledProcessError(
+                process.returncode, cmd, output=stdout_text, stderr=stderr_text
+            )
+        return subprocess.CompletedProcess(
+            cmd, process.returncode, stdout=stdout_text, stderr=stderr_text
+        )
+
+    @staticmethod
+    async def _async_stream_lines(
+        stream: asyncio.StreamReader, on_line: Callable[[str], bool]
+    ) -> str:
+        """Feed each line of a stream to on_line and return the unhandled ones."""
+        unhandled = []
+        while line := await stream.readline():
+            text = line.decode(errors="replace").strip()
+            if text and not on_line(text):
+                unhandled.append(text)
+        return "\n".join(unhandled)
+
+    @staticmethod
+    async def _async_terminate_process(process: asyncio.subprocess.Process) -> None:
+        """Stop a running speedtest, escalating from SIGTERM to SIGKILL."""
+        if process.returncode is not None:
+            return
+        try:
+            process.terminate()
+            try:
+                async with asyncio.timeout(KILL_GRACE_PERIOD):
+                    await process.wait()
+                return
+            except TimeoutError:
+                _LOGGER.warning(
+                    "Speedtest did not exit %s seconds after SIGTERM; killing it",
+                    KILL_GRACE_PERIOD,
+                )
+            process.kill()
+        except ProcessLookupError:
+            return
+        await process.wait()
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled runs and stop any speedtest still in progress."""
+        self._shutting_down = True
+        if self._unsub_schedule:
+            self._unsub_schedule()
+            self._unsub_schedule = None
+        if self._unsub_retest:
+            self._unsub_retest()
+            self._unsub_retest = None
+        async_get_scheduler(self.hass).async_cancel(self.entry.entry_id)
+        await super().async_shutdown()
+        if self.probe is not None:
+            await self.probe.async_shutdown()
+        if self._process is not None:
+            await self._async_terminate_process(self._process)
 
     def _should_fallback_to_closest(
         self, error: subprocess.CalledProcessError, server_id: str | None
@@ -283,84 +764,143 @@ class SpeedtestCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "NoServersException" in error_msg or "No servers defined" in error_msg
         )
 
-    def _process_speedtest_result(self, result: dict[str, Any]) -> dict[str, Any]:
+    def _process_speedtest_result(self, result: dict[str, Any]) -> SpeedtestResult:
         """Convert speedtest JSON output into coordinator data."""
-        ping = result["ping"]
-        download = result["download"]
-        upload = result["upload"]
-        download_latency = download.get("latency") or {}
-        upload_latency = upload.get("latency") or {}
-
-        data = {
-            # ping { jitter, latency, low, high}
-            ATTR_PING: round(ping["latency"], 2),
-            ATTR_JITTER: round(ping["jitter"], 2),
-            ATTR_PING_LOW: round(ping.get("low", 0), 2),
-            ATTR_PING_HIGH: round(ping.get("high", 0), 2),
-            # download { bandwidth, bytes, elapsed, latency { iqm, low, high, jitter }}
-            ATTR_DOWNLOAD: round(download["bandwidth"] * 8 / 1000000, 2),
-            ATTR_DOWNLOAD_LATENCY_IQM: round(download_latency.get("iqm", 0), 2),
-            ATTR_DOWNLOAD_LATENCY_LOW: round(download_latency.get("low", 0), 2),
-            ATTR_DOWNLOAD_LATENCY_HIGH: round(download_latency.get("high", 0), 2),
-            ATTR_DOWNLOAD_LATENCY_JITTER: round(download_latency.get("jitter", 0), 2),
-            # upload { bandwidth, bytes, elapsed, latency { iqm, low, high, jitter }}
-            ATTR_UPLOAD: round(upload["bandwidth"] * 8 / 1000000, 2),
-            ATTR_UPLOAD_LATENCY_IQM: round(upload_latency.get("iqm", 0), 2),
-            ATTR_UPLOAD_LATENCY_LOW: round(upload_latency.get("low", 0), 2),
-            ATTR_UPLOAD_LATENCY_HIGH: round(upload_latency.get("high", 0), 2),
-            ATTR_UPLOAD_LATENCY_JITTER: round(upload_latency.get("jitter", 0), 2),
-            # isp
-            ATTR_ISP: result["isp"],
-            # interface { internalIp, name, macAddr, isVpn, externalIp }
-            # server { id, host, port, name, location, country, ip }
-            ATTR_SERVER: (
-                # produces: Boost Mobile (Chicago, IL, United States)
-                f"{result['server']['name']} "
-                f"({result['server']['location']}, {result['server']['country']})"
-            ),
-            # result { id, url, persisted }
-            ATTR_RESULT_URL: result.get("result", {}).get("url", ""),
-            ATTR_DATE_LAST_TEST: dt_util.now(),
-        }
+        start = time.perf_counter()
+        try:
+            return SpeedtestResult.from_cli(result, self.isp_dl_speed, self.isp_ul_speed)
+        finally:
+            self._timing.parse += elapsed_ms(start)
 
-        if self.isp_dl_speed and data[ATTR_DOWNLOAD] > 0:
-            data[ATTR_DL_PCT] = round(
-                (data[ATTR_DOWNLOAD] / self.isp_dl_speed) * 100, 1
+    def _apply_cpu_usage(
+        self, data: SpeedtestResult, cpu_monitor: CpuMonitor
+    ) -> SpeedtestResult:
+        """Add CPU use to a result, dropping compliance if it was CPU bound."""
+        fields = cpu_monitor.result_fields()
+        if fields.get("result_validity") == VALIDITY_CPU_BOUND:
+            _LOGGER.info(
+                "Speedtest was limited by host CPU (busiest core peaked at %s%%); "
+                "the result may not reflect the connection speed",
+                fields["cpu_core_peak"],
             )
+            if self.skip_cpu_bound:
+                fields["download_percent"] = None
+                fields["upload_percent"] = None
+        return replace(data, **fields)
 
-        if self.isp_ul_speed and data[ATTR_UPLOAD] > 0:
-            data[ATTR_UL_PCT] = round(
-                (data[ATTR_UPLOAD] / self.isp_ul_speed) * 100, 1
+    def _apply_adaptive_interval(self) -> None:
+        """Use the adaptive interval for the next scheduled run."""
+        interval = timedelta(minutes=self.adaptive.interval)
+        if interval != self.update_interval:
+            _LOGGER.info(
+                "Speedtest interval is now %s (%s)", interval, self.adaptive.reason
             )
+        self.update_interval = interval
 
-        # Bufferbloat Calculation
-        # Calculate the increase in latency under load
-        ping_idle = data[ATTR_PING]
-        # Handle potential 0/None values if test failed partially
-        ping_dl = data.get(ATTR_DOWNLOAD_LATENCY_IQM, 0)
-        ping_ul = data.get(ATTR_UPLOAD_LATENCY_IQM, 0)
-
-        if ping_dl and ping_ul:
-            max_loaded = max(ping_dl, ping_ul)
-            # Ensure we don't get negative delta due to variance
-            delta = max(0, max_loaded - ping_idle)
-
-            if delta <= 30:
-                grade = "A"
-            elif delta <= 60:
-                grade = "B"
-            elif delta <= 120:
-                grade = "C"
-            elif delta <= 300:
-                grade = "D"
-            else:
-                grade = "F"
+    def _check_degradation(self, data: SpeedtestResult) -> None:
+        """Feed a result to the degradation detector and report what it finds.
 
-            data[ATTR_BUFFERBLOAT_GRADE] = grade
-        else:
-            data[ATTR_BUFFERBLOAT_GRADE] = None
+        With confirmation re-tests enabled, an alarm schedules another run
+        and is only reported if that run on its own is also clearly worse
+        than the baseline. CPU-bound results are left out, since they
+        measure the host rather than the line.
+        """
+        if data.result_validity == VALIDITY_CPU_BOUND:
+            return
 
-        return data
+        suspected, self._suspected_degradation = self._suspected_degradation, None
+        if suspected:
+            confirmed = self.degradation.confirm(data, suspected)
+            self.degradation.add(data)
+            if not confirmed:
+                _LOGGER.info("Re-test did not confirm the suspected degradation")
+                return
+            self._report_degradation(data, confirmed, True)
+            return
+
+        alarms = self.degradation.add(data)
+        if not alarms:
+            return
+
+        if self.degradation_retest:
+            _LOGGER.info(
+                "Possible degradation of %s; re-testing in %s seconds",
+                ", ".join(alarm["metric"] for alarm in alarms),
+                DEGRADATION_RETEST_DELAY,
+            )
+            # Judged by the re-test alone, so the drop is not counted twice
+            self.degradation.reset([alarm["metric"] for alarm in alarms])
+            self._suspected_degradation = alarms
+            if self._unsub_retest:
+                self._unsub_retest()
+            self._unsub_retest = async_call_later(
+                self.hass, DEGRADATION_RETEST_DELAY, self._async_degradation_retest
+            )
+            return
+
+        self._report_degradation(data, alarms, False)
+
+    def _report_degradation(
+        self, data: SpeedtestResult, alarms: list[dict[str, Any]], confirmed: bool
+    ) -> None:
+        """Fire a degradation event for each alarm and restart its CUSUM."""
+        for alarm in alarms:
+            _LOGGER.warning(
+                "Detected degradation of %s: %s against a baseline of %s",
+                alarm["metric"],
+                alarm["value"],
+                alarm["baseline"],
+            )
+            self.hass.bus.async_fire(
+                EVENT_DEGRADATION,
+                {
+                    ATTR_CONFIG_ENTRY_ID: self.entry.entry_id,
+                    **alarm,
+                    "confirmed": confirmed,
+                    "server": data.server_name,
+                    "timestamp": data.timestamp.isoformat(),
+                },
+            )
+        self.degradation.reset([alarm["metric"] for alarm in alarms])
+
+    @callback
+    def async_new_period(self, _now: datetime) -> None:
+        """Update listeners at local midnight, when usage counters roll over.
+
+        Data usage starts a new day or month and latency trends drop a day
+        whether or not a test runs, so their sensors are re-read now.
+        """
+        self.async_update_listeners()
+
+    async def _async_degradation_retest(self, _now) -> None:
+        """Run the confirmation re-test for a suspected degradation."""
+        self._unsub_retest = None
+        await self.async_request_refresh()
+
+    @property
+    def budget_exhausted(self) -> bool:
+        """Return true when this month's tests used up the data budget."""
+        return bool(self.monthly_data_budget) and (
+            self.data_usage.get(PERIOD_MONTH) >= self.monthly_data_budget * 1_000_000
+        )
+
+    @property
+    def last_timing(self) -> RunTiming | None:
+        """Return the timing of the last completed run."""
+        return self.timings[-1] if self.timings else None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, timing the state writes that finish a run."""
+        timing, self._pending_timing = self._pending_timing, None
+        start = time.perf_counter()
+        super().async_update_listeners()
+        if timing is None:
+            return
+
+        timing.state_write = elapsed_ms(start)
+        self.timings.append(timing)
+        async_dispatcher_send(self.hass, SIGNAL_RUN_TIMING.format(self.entry.entry_id))
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -391,6 +931,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         CONF_FALLBACK_TO_CLOSEST,
         entry.data.get(CONF_FALLBACK_TO_CLOSEST, DEFAULT_FALLBACK_TO_CLOSEST),
     )
+    test_timeout = entry.options.get(
+        CONF_TEST_TIMEOUT, entry.data.get(CONF_TEST_TIMEOUT, DEFAULT_TEST_TIMEOUT)
+    )
+    live_progress = entry.options.get(
+        CONF_LIVE_PROGRESS, entry.data.get(CONF_LIVE_PROGRESS, DEFAULT_LIVE_PROGRESS)
+    )
+    history_retention = entry.options.get(
+        CONF_HISTORY_RETENTION,
+        entry.data.get(CONF_HISTORY_RETENTION, DEFAULT_HISTORY_RETENTION),
+    )
+    nice = entry.options.get(CONF_NICE, entry.data.get(CONF_NICE, DEFAULT_NICE))
+    ionice_class = entry.options.get(
+        CONF_IONICE_CLASS, entry.data.get(CONF_IONICE_CLASS, DEFAULT_IONICE_CLASS)
+    )
+    cpu_affinity = entry.options.get(
+        CONF_CPU_AFFINITY, entry.data.get(CONF_CPU_AFFINITY, DEFAULT_CPU_AFFINITY)
+    )
+    skip_cpu_bound = entry.options.get(
+        CONF_SKIP_CPU_BOUND, entry.data.get(CONF_SKIP_CPU_BOUND, DEFAULT_SKIP_CPU_BOUND)
+    )
+    probe_interval = entry.options.get(
+        CONF_PROBE_INTERVAL, entry.data.get(CONF_PROBE_INTERVAL, DEFAULT_PROBE_INTERVAL)
+    )
+    probe_targets = entry.options.get(
+        CONF_PROBE_TARGETS, entry.data.get(CONF_PROBE_TARGETS, DEFAULT_PROBE_TARGETS)
+    )
+    degradation_retest = entry.options.get(
+        CONF_DEGRADATION_RETEST,
+        entry.data.get(CONF_DEGRADATION_RETEST, DEFAULT_DEGRADATION_RETEST),
+    )
+    adaptive_scheduling = entry.options.get(
+        CONF_ADAPTIVE_SCHEDULING,
+        entry.data.get(CONF_ADAPTIVE_SCHEDULING, DEFAULT_ADAPTIVE_SCHEDULING),
+    )
+    min_scan_interval = entry.options.get(
+        CONF_MIN_SCAN_INTERVAL,
+        entry.data.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+    )
+    max_scan_interval = entry.options.get(
+        CONF_MAX_SCAN_INTERVAL,
+        entry.data.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+    )
+    monthly_data_budget = entry.options.get(
+        CONF_MONTHLY_DATA_BUDGET,
+        entry.data.get(CONF_MONTHLY_DATA_BUDGET, DEFAULT_MONTHLY_DATA_BUDGET),
+    )
 
     # Validate server_id during setup
     if not validate_server_id(server_id):
@@ -399,6 +985,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
         server_id = "closest"
 
+    cpus = None
+    if cpu_affinity:
+        try:
+            cpus = parse_cpu_list(cpu_affinity)
+        except ValueError:
+            _LOGGER.warning(
+                "Invalid cpu_affinity '%s' in config entry; using all CPUs", cpu_affinity
+            )
+
     coordinator = SpeedtestCoordinator(
         hass,
         entry,
@@ -409,31 +1004,85 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         isp_dl_speed,
         isp_ul_speed,
         fallback_to_closest,
+        test_timeout,
+        live_progress,
+        history_retention,
+        nice,
+        ionice_class,
+        cpus,
+        skip_cpu_bound,
+        degradation_retest,
+        adaptive_scheduling,
+        min_scan_interval,
+        max_scan_interval,
+        monthly_data_budget,
     )
     hass.data[DOMAIN][entry.entry_id] = coordinator
-
-    # Register service to manually run a speed test
-    async def run_speedtest_service(call: ServiceCall) -> None:
-        """Service to manually run a speedtest."""
-        # Clear sensor data before running test to avoid confusion with old data
-        coordinator.async_set_updated_data(None)
-        await coordinator.async_request_refresh()
-
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RUN_SPEEDTEST,
-        run_speedtest_service,
+    await coordinator.async_restore_state()
+    entry.async_on_unload(
+        async_track_time_change(
+            hass, coordinator.async_new_period, hour=0, minute=0, second=0
+        )
     )
 
+    if probe_interval:
+        try:
+            targets = parse_probe_targets(probe_targets)
+        except ValueError:
+            _LOGGER.warning(
+                "Invalid probe_targets '%s' in config entry; probing the test server only",
+                probe_targets,
+            )
+            targets = []
+        # Starts probing once its sensors subscribe
+        coordinator.probe = ProbeCoordinator(
+            hass, entry, coordinator, probe_interval, targets
+        )
+
+    # Register service to manually run a speed test (shared by all entries)
+    if not hass.services.has_service(DOMAIN, SERVICE_RUN_SPEEDTEST):
+        async def run_speedtest_service(call: ServiceCall) -> None:
+            """Service to manually run a speedtest on one or all entries."""
+            coordinators: dict[str, SpeedtestCoordinator] = hass.data[DOMAIN]
+            entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+            if entry_id is None:
+                targets = list(coordinators.values())
+            elif entry_id in coordinators:
+                targets = [coordinators[entry_id]]
+            else:
+                raise HomeAssistantError(
+                    f"No loaded Ookla Speedtest entry with id {entry_id}"
+                )
+
+            # Runs are serialised by the scheduler, so waiting together is safe
+            await asyncio.gather(
+                *(target.async_request_manual_refresh() for target in targets)
+            )
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_RUN_SPEEDTEST,
+            run_speedtest_service,
+            schema=RUN_SPEEDTEST_SCHEMA,
+        )
+
     # Delay first speedtest in interval mode to avoid blocking HA startup
     if not manual:
         async def schedule_first_refresh(_):
             """Schedule the first speedtest after HA has started."""
-            # Wait for configured delay after HA startup before running first test
+            delay = coordinator.first_run_delay()
+            if start_time and delay > STARTUP_DELAY:
+                # Restored result is recent; wait for the next aligned slot
+                coordinator._schedule_next()
+                return
+
+            # Wait until the restored result is due (at least the startup delay)
             async def run_first_refresh(_):
                 await coordinator.async_request_refresh()
 
-            async_call_later(hass, STARTUP_DELAY, run_first_refresh)
+            _LOGGER.debug("First speedtest scheduled in %.0f seconds", delay)
+            coordinator.next_run = dt_util.now() + timedelta(seconds=delay)
+            entry.async_on_unload(async_call_later(hass, delay, run_first_refresh))
 
         # If HA is already started, schedule immediately; otherwise wait for start event
         if hass.is_running:
@@ -443,8 +1092,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Set up custom cards and register resources service
-    # Copies cards to www folder and provides service for auto-registration
+    # Register card resources and the service for manual registration
     await async_setup_cards_and_resources(hass)
 
     # Register options update listener
@@ -462,14 +1110,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.services.async_remove(DOMAIN, SERVICE_RUN_SPEEDTEST)
         if entry.entry_id in hass.data[DOMAIN]:
-            hass.data[DOMAIN].pop(entry.entry_id)
+            coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+            await coordinator.async_shutdown()
+        if not hass.data[DOMAIN]:
+            hass.services.async_remove(DOMAIN, SERVICE_RUN_SPEEDTEST)
 
     return unload_ok
 
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle removal of an entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+    await ResultHistory(hass, entry.entry_id, 0).async_remove()
+
     # Remove custom cards and unregister resources
     await async_remove_cards_and_resources(hass)
@@ -0,0 +1,84 @@
+"""Adaptive test interval driven by how much results change."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .const import (
+    ADAPTIVE_CHANGE_THRESHOLD,
+    ADAPTIVE_MIN_SAMPLES,
+    ADAPTIVE_STABILITY_BAND,
+    ADAPTIVE_STRETCH_FACTOR,
+)
+from .result import SpeedtestResult
+from .stats import ResultStatistics
+
+REASON_FIXED = "fixed"
+REASON_WARMUP = "warmup"
+REASON_STABLE = "stable"
+REASON_VARIABLE = "variable"
+REASON_CHANGED = "changed"
+REASON_FAILED = "failed"
+
+# Result fields compared with their rolling mean, with the smallest mean
+# a change is measured against so a few ms on a very low ping is not large
+_COMPARED_FIELDS = {"download": 1.0, "upload": 1.0, "ping": 20.0}
+
+
+class AdaptiveInterval:
+    """Stretch the test interval while results are stable, shrink it on change.
+
+    A result within ADAPTIVE_STABILITY_BAND of the rolling mean for every
+    compared field multiplies the interval by ADAPTIVE_STRETCH_FACTOR, up
+    to the maximum. A change beyond ADAPTIVE_CHANGE_THRESHOLD, or a failed
+    test, drops it to the minimum so an incident is followed closely;
+    anything in between keeps the interval. Intervals are in minutes.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        minimum: float,
+        maximum: float,
+        stored: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize at the configured interval, or the saved one."""
+        self.minimum = minimum
+        self.maximum = maximum
+        self.interval = min(max(interval, minimum), maximum)
+        self.reason = REASON_WARMUP
+        if stored:
+            self.interval = min(max(stored["interval"], minimum), maximum)
+            self.reason = stored["reason"]
+
+    def add(self, result: SpeedtestResult, stats: ResultStatistics) -> None:
+        """Adapt to a result, given statistics that do not include it yet."""
+        if stats.samples("download") < ADAPTIVE_MIN_SAMPLES:
+            self.reason = REASON_WARMUP
+            return
+
+        change = 0.0
+        for field, floor in _COMPARED_FIELDS.items():
+            value = getattr(result, field)
+            mean = stats.get(field, "mean")
+            if value is None or mean is None:
+                continue
+            change = max(change, abs(value - mean) / max(mean, floor))
+
+        if change > ADAPTIVE_CHANGE_THRESHOLD:
+            self.interval = self.minimum
+            self.reason = REASON_CHANGED
+        elif change <= ADAPTIVE_STABILITY_BAND:
+            self.interval = min(self.interval * ADAPTIVE_STRETCH_FACTOR, self.maximum)
+            self.reason = REASON_STABLE
+        else:
+            self.reason = REASON_VARIABLE
+
+    def failed(self) -> None:
+        """Adapt to a failed test."""
+        self.interval = self.minimum
+        self.reason = REASON_FAILED
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the interval and reason for storage."""
+        return {"interval": self.interval, "reason": self.reason}
@@ -1,5 +1,7 @@
 """Setup module for Ookla Speedtest binary — replaces setup_speedtest.sh."""
 
+import hashlib
+import json
 import logging
 import os
 import platform
@@ -8,15 +10,18 @@ import stat
 import subprocess
 import tarfile
 import tempfile
+import time
 import urllib.request
 
 from homeassistant.core import HomeAssistant
 
-from .const import SPEEDTEST_BIN_PATH
+from .const import DATA_BINARY_STATS, SPEEDTEST_BIN_ENV, SPEEDTEST_BIN_PATH
+from .timing import elapsed_ms
 
 _LOGGER = logging.getLogger(__name__)
 
 BIN_DIR = os.path.dirname(SPEEDTEST_BIN_PATH)
+STAMP_PATH = os.path.join(BIN_DIR, "speedtest.stamp")
 SPEEDTEST_VERSION = "1.2.0"
 DOWNLOAD_BASE = "https://install.speedtest.net/app/cli"
 
@@ -24,6 +29,14 @@ DOWNLOAD_BASE = "https://install.speedtest.net/app/cli"
 _OLD_SHELL_DIR = "/config/shell"
 
 
+def speedtest_bin_path() -> str:
+    """Return the speedtest executable to run.
+
+    SPEEDTEST_BIN_ENV overrides the managed binary when set.
+    """
+    return os.environ.get(SPEEDTEST_BIN_ENV) or SPEEDTEST_BIN_PATH
+
+
 def detect_arch() -> str:
     """Detect system architecture and return Ookla's naming convention.
 
@@ -110,6 +123,50 @@ def _accept_license() -> None:
         _LOGGER.warning("Could not accept Ookla license: %s", exc)
 
 
+def _binary_fingerprint() -> dict[str, object]:
+    """Return the size, mtime, SHA-256 and host architecture of the binary."""
+    st = os.stat(SPEEDTEST_BIN_PATH)
+    sha256 = hashlib.sha256()
+    with open(SPEEDTEST_BIN_PATH, "rb") as binary:
+        for chunk in iter(lambda: binary.read(1024 * 1024), b""):
+            sha256.update(chunk)
+    return {
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "sha256": sha256.hexdigest(),
+        "arch": platform.machine().lower(),
+    }
+
+
+def _stamp_matches() -> bool:
+    """Check whether the binary is unchanged since it was last validated."""
+    try:
+        with open(STAMP_PATH, encoding="utf-8") as stamp_file:
+            stamp = json.load(stamp_file)
+        return stamp == _binary_fingerprint()
+    except (OSError, ValueError):
+        return False
+
+
+def _write_stamp() -> None:
+    """Record the validated binary so later setups can skip the checks."""
+    try:
+        with open(STAMP_PATH, "w", encoding="utf-8") as stamp_file:
+            json.dump(_binary_fingerprint(), stamp_file)
+    except OSError as exc:
+        _LOGGER.debug("Could not write %s: %s", STAMP_PATH, exc)
+
+
+def _remove_stamp() -> None:
+    """Invalidate the validation stamp."""
+    try:
+        os.remove(STAMP_PATH)
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        _LOGGER.debug("Could not remove %s: %s", STAMP_PATH, exc)
+
+
 _ORPHANED_FILES = [
     os.path.join(_OLD_SHELL_DIR, name)
     for name in ("launch_speedtest.sh", "list_servers.sh", "setup_speedtest.sh", "speedtest.bin")
@@ -127,23 +184,51 @@ def _cleanup_legacy_files() -> None:
             _LOGGER.debug("Could not remove %s: %s", path, exc)
 
 
-def _setup_speedtest_sync() -> None:
-    """Synchronous setup: download binary if needed, accept license."""
+def _setup_speedtest_sync(queued_at: float, timings: dict[str, float]) -> bool:
+    """Synchronous setup: download binary if needed, accept license.
+
+    Records the executor wait and the duration of each spawned process
+    in timings, in ms. Returns True when the validation stamp matched and
+    the binary was trusted without spawning any process.
+    """
+    timings["executor_wait"] = elapsed_ms(queued_at)
+
+    # Fast path: binary unchanged and validated on this architecture before
+    if os.path.isfile(SPEEDTEST_BIN_PATH) and _stamp_matches():
+        _LOGGER.debug("Speedtest binary matches validation stamp")
+        return True
+
     os.makedirs(BIN_DIR, exist_ok=True)
     _cleanup_legacy_files()
 
     # If binary exists, verify it works (catches arch mismatch after migration)
     if os.path.isfile(SPEEDTEST_BIN_PATH):
-        if _binary_is_valid():
+        start = time.perf_counter()
+        valid = _binary_is_valid()
+        timings["version_check"] = elapsed_ms(start)
+        if valid:
             _LOGGER.debug("Existing speedtest binary is valid")
-            _accept_license()
-            return
+            _timed_accept_license(timings)
+            _write_stamp()
+            return False
         _LOGGER.warning("Existing speedtest binary is invalid, re-downloading")
+        _remove_stamp()
         os.remove(SPEEDTEST_BIN_PATH)
 
     arch = detect_arch()
+    start = time.perf_counter()
     _download_and_extract(arch)
+    timings["download"] = elapsed_ms(start)
+    _timed_accept_license(timings)
+    _write_stamp()
+    return False
+
+
+def _timed_accept_license(timings: dict[str, float]) -> None:
+    """Accept the license, recording how long the spawn took."""
+    start = time.perf_counter()
     _accept_license()
+    timings["accept_license"] = elapsed_ms(start)
 
 
 async def async_setup_speedtest(hass: HomeAssistant) -> None:
@@ -151,6 +236,21 @@ async def async_setup_speedtest(hass: HomeAssistant) -> None:
 
     Creates the bin directory inside the integration folder, downloads the
     correct binary if missing or invalid, cleans up legacy /config/shell/ files,
-    and accepts the Ookla license/GDPR.
+    and accepts the Ookla license/GDPR. These checks are skipped while the
+    binary still matches the stamp written after its last validation.
+    A binary named through SPEEDTEST_BIN_ENV is used as is.
     """
-    await hass.async_add_executor_job(_setup_speedtest_sync)
+    if override := os.environ.get(SPEEDTEST_BIN_ENV):
+        _LOGGER.warning("Using speedtest executable %s from %s", override, SPEEDTEST_BIN_ENV)
+        return
+
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    fast_path = await hass.async_add_executor_job(
+        _setup_speedtest_sync, start, timings
+    )
+    timings["total"] = elapsed_ms(start)
+    stats = hass.data.setdefault(DATA_BINARY_STATS, {"fast_path": 0, "full_check": 0})
+    stats["fast_path" if fast_path else "full_check"] += 1
+    # Timings of the last setup (ms), shown in diagnostics
+    stats["last_setup_timings"] = timings
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
 from typing import Any
 
 import voluptuous as vol
@@ -13,37 +12,88 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 
 from .const import (
+    CONF_ADAPTIVE_SCHEDULING,
+    CONF_CPU_AFFINITY,
+    CONF_DEGRADATION_RETEST,
     CONF_ENABLE_COMPLIANCE_SENSORS,
     CONF_FALLBACK_TO_CLOSEST,
     CONF_ENABLE_LATENCY_SENSORS,
+    CONF_HISTORY_RETENTION,
+    CONF_IONICE_CLASS,
     CONF_ISP_DL_SPEED,
     CONF_ISP_UL_SPEED,
+    CONF_LIVE_PROGRESS,
     CONF_MANUAL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MONTHLY_DATA_BUDGET,
+    CONF_NICE,
+    CONF_PROBE_INTERVAL,
+    CONF_PROBE_TARGETS,
     CONF_SCAN_INTERVAL,
     CONF_SERVER_ID,
+    CONF_SERVER_SEARCH,
+    CONF_SKIP_CPU_BOUND,
     CONF_START_TIME,
+    CONF_TEST_TIMEOUT,
+    DEFAULT_ADAPTIVE_SCHEDULING,
+    DEFAULT_CPU_AFFINITY,
+    DEFAULT_DEGRADATION_RETEST,
     DEFAULT_ENABLE_COMPLIANCE,
     DEFAULT_FALLBACK_TO_CLOSEST,
     DEFAULT_ENABLE_LATENCY,
+    DEFAULT_HISTORY_RETENTION,
+    DEFAULT_IONICE_CLASS,
+    DEFAULT_LIVE_PROGRESS,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_MONTHLY_DATA_BUDGET,
+    DEFAULT_NICE,
+    DEFAULT_PROBE_INTERVAL,
+    DEFAULT_PROBE_TARGETS,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SKIP_CPU_BOUND,
+    DEFAULT_TEST_TIMEOUT,
     DOMAIN,
+    MIN_PROBE_INTERVAL,
 )
 from .helpers import (
     get_speedtest_servers,
+    validate_cpu_affinity,
+    validate_probe_targets,
     validate_server_id,
     validate_time_format,
 )
+from .process_priority import IONICE_CLASSES
 from .binary_manager import async_setup_speedtest
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@config_entries.HANDLERS.register(DOMAIN)
+def _searched_values(
+    user_input: dict[str, Any], server_options: dict[str, str]
+) -> dict[str, Any]:
+    """Return submitted values to suggest again after a server search.
+
+    The search field shows the new term from its default, and a selected
+    server is dropped when the new results no longer offer it.
+    """
+    values = {
+        key: value for key, value in user_input.items() if key != CONF_SERVER_SEARCH
+    }
+    if values.get(CONF_SERVER_ID) not in server_options:
+        values.pop(CONF_SERVER_ID, None)
+    return values
+
+
 class OoklaSpeedtestConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Ookla Speedtest."""
 
     VERSION = 1
 
+    _server_search = ""
+    _search_input: dict[str, Any] | None = None
+
     @staticmethod
     def _duration_to_minutes(duration: dict[str, int]) -> float:
         """Convert duration dict to minutes."""
@@ -75,11 +125,12 @@ class OoklaSpeedtestConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self._setup_done = True
 
         errors = {}
-        servers = await get_speedtest_servers(self.hass)
+        servers = await get_speedtest_servers(self.hass, self._server_search)
         server_options = self._build_server_options(servers)
 
         schema = vol.Schema(
             {
+                vol.Optional(CONF_SERVER_SEARCH, default=self._server_search): str,
                 vol.Required(CONF_SERVER_ID, default="closest"): vol.In(
                     server_options
                 ),
@@ -103,16 +154,67 @@ class OoklaSpeedtestConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Optional(
                     CONF_FALLBACK_TO_CLOSEST, default=DEFAULT_FALLBACK_TO_CLOSEST
                 ): bool,
+                vol.Optional(
+                    CONF_TEST_TIMEOUT, default=DEFAULT_TEST_TIMEOUT
+                ): vol.All(vol.Coerce(int), vol.Range(min=30, max=900)),
+                vol.Optional(
+                    CONF_LIVE_PROGRESS, default=DEFAULT_LIVE_PROGRESS
+                ): bool,
+                vol.Optional(
+                    CONF_HISTORY_RETENTION, default=DEFAULT_HISTORY_RETENTION
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3650)),
+                vol.Optional(CONF_NICE, default=DEFAULT_NICE): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=19)
+                ),
+                vol.Optional(
+                    CONF_IONICE_CLASS, default=DEFAULT_IONICE_CLASS
+                ): vol.In(IONICE_CLASSES),
+                vol.Optional(CONF_CPU_AFFINITY, default=DEFAULT_CPU_AFFINITY): str,
+                vol.Optional(
+                    CONF_SKIP_CPU_BOUND, default=DEFAULT_SKIP_CPU_BOUND
+                ): bool,
+                vol.Optional(
+                    CONF_PROBE_INTERVAL, default=DEFAULT_PROBE_INTERVAL
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Optional(CONF_PROBE_TARGETS, default=DEFAULT_PROBE_TARGETS): str,
+                vol.Optional(
+                    CONF_DEGRADATION_RETEST, default=DEFAULT_DEGRADATION_RETEST
+                ): bool,
+                vol.Optional(
+                    CONF_ADAPTIVE_SCHEDULING, default=DEFAULT_ADAPTIVE_SCHEDULING
+                ): bool,
+                vol.Optional(
+                    CONF_MIN_SCAN_INTERVAL, default=DEFAULT_MIN_SCAN_INTERVAL
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=43200)),
+                vol.Optional(
+                    CONF_MAX_SCAN_INTERVAL, default=DEFAULT_MAX_SCAN_INTERVAL
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=43200)),
+                vol.Optional(
+                    CONF_MONTHLY_DATA_BUDGET, default=DEFAULT_MONTHLY_DATA_BUDGET
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=10_000_000)),
             }
         )
 
         if user_input is None:
+            if self._search_input:
+                # Re-rendered for a new search; keep what was already entered
+                schema = self.add_suggested_values_to_schema(
+                    schema, _searched_values(self._search_input, server_options)
+                )
+                self._search_input = None
             return self.async_show_form(
                 step_id="user",
                 data_schema=schema,
                 errors=errors,
             )
 
+        # A changed search term re-renders the form with matching servers
+        server_search = user_input.get(CONF_SERVER_SEARCH, "").strip()
+        if server_search != self._server_search:
+            self._server_search = server_search
+            self._search_input = user_input
+            return await self.async_step_user()
+
         # Process input
         scan_interval_input = user_input[CONF_SCAN_INTERVAL]
         if isinstance(scan_interval_input, dict):
@@ -131,6 +233,36 @@ class OoklaSpeedtestConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors=errors,
             )
 
+        cpu_affinity = user_input.get(CONF_CPU_AFFINITY, DEFAULT_CPU_AFFINITY).strip()
+        if not validate_cpu_affinity(cpu_affinity):
+            errors[CONF_CPU_AFFINITY] = "invalid_cpu_affinity"
+            return self.async_show_form(
+                step_id="user",
+                data_schema=schema,
+                errors=errors,
+            )
+
+        probe_interval = user_input.get(CONF_PROBE_INTERVAL, DEFAULT_PROBE_INTERVAL)
+        if 0 < probe_interval < MIN_PROBE_INTERVAL:
+            errors[CONF_PROBE_INTERVAL] = "probe_interval_too_short"
+        probe_targets = user_input.get(CONF_PROBE_TARGETS, DEFAULT_PROBE_TARGETS).strip()
+        if not validate_probe_targets(probe_targets):
+            errors[CONF_PROBE_TARGETS] = "invalid_probe_targets"
+        min_scan_interval = user_input.get(
+            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+        )
+        max_scan_interval = user_input.get(
+            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+        )
+        if min_scan_interval > max_scan_interval:
+            errors[CONF_MAX_SCAN_INTERVAL] = "invalid_scan_interval_range"
+        if errors:
+            return self.async_show_form(
+                step_id="user",
+                data_schema=schema,
+                errors=errors,
+            )
+
         # Validate and process server ID
         server_id = user_input[CONF_SERVER_ID]
         if server_id == "manual":
@@ -169,6 +301,34 @@ class OoklaSpeedtestConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             CONF_FALLBACK_TO_CLOSEST: user_input.get(
                 CONF_FALLBACK_TO_CLOSEST, DEFAULT_FALLBACK_TO_CLOSEST
             ),
+            CONF_TEST_TIMEOUT: user_input.get(
+                CONF_TEST_TIMEOUT, DEFAULT_TEST_TIMEOUT
+            ),
+            CONF_LIVE_PROGRESS: user_input.get(
+                CONF_LIVE_PROGRESS, DEFAULT_LIVE_PROGRESS
+            ),
+            CONF_HISTORY_RETENTION: user_input.get(
+                CONF_HISTORY_RETENTION, DEFAULT_HISTORY_RETENTION
+            ),
+            CONF_NICE: user_input.get(CONF_NICE, DEFAULT_NICE),
+            CONF_IONICE_CLASS: user_input.get(CONF_IONICE_CLASS, DEFAULT_IONICE_CLASS),
+            CONF_CPU_AFFINITY: cpu_affinity,
+            CONF_SKIP_CPU_BOUND: user_input.get(
+                CONF_SKIP_CPU_BOUND, DEFAULT_SKIP_CPU_BOUND
+            ),
+            CONF_PROBE_INTERVAL: probe_interval,
+            CONF_PROBE_TARGETS: probe_targets,
+            CONF_DEGRADATION_RETEST: user_input.get(
+                CONF_DEGRADATION_RETEST, DEFAULT_DEGRADATION_RETEST
+            ),
+            CONF_ADAPTIVE_SCHEDULING: user_input.get(
+                CONF_ADAPTIVE_SCHEDULING, DEFAULT_ADAPTIVE_SCHEDULING
+            ),
+            CONF_MIN_SCAN_INTERVAL: min_scan_interval,
+            CONF_MAX_SCAN_INTERVAL: max_scan_interval,
+            CONF_MONTHLY_DATA_BUDGET: user_input.get(
+                CONF_MONTHLY_DATA_BUDGET, DEFAULT_MONTHLY_DATA_BUDGET
+            ),
         }
         return self.async_create_entry(
             title="Ookla Speedtest",
@@ -214,12 +374,15 @@ class OoklaSpeedtestConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 class OoklaSpeedtestOptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for Ookla Speedtest."""
 
+    _server_search = ""
+    _search_input: dict[str, Any] | None = None
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
         errors = {}
-        servers = await get_speedtest_servers(self.hass)
+        servers = await get_speedtest_servers(self.hass, self._server_search)
         server_options = OoklaSpeedtestConfigFlow._build_server_options(servers)
 
         # Get defaults
@@ -263,9 +426,73 @@ class OoklaSpeedtestOptionsFlow(config_entries.OptionsFlow):
                 CONF_FALLBACK_TO_CLOSEST, DEFAULT_FALLBACK_TO_CLOSEST
             ),
         )
+        current_test_timeout = self.config_entry.options.get(
+            CONF_TEST_TIMEOUT,
+            self.config_entry.data.get(CONF_TEST_TIMEOUT, DEFAULT_TEST_TIMEOUT),
+        )
+        current_live_progress = self.config_entry.options.get(
+            CONF_LIVE_PROGRESS,
+            self.config_entry.data.get(CONF_LIVE_PROGRESS, DEFAULT_LIVE_PROGRESS),
+        )
+        current_history_retention = self.config_entry.options.get(
+            CONF_HISTORY_RETENTION,
+            self.config_entry.data.get(
+                CONF_HISTORY_RETENTION, DEFAULT_HISTORY_RETENTION
+            ),
+        )
+        current_nice = self.config_entry.options.get(
+            CONF_NICE, self.config_entry.data.get(CONF_NICE, DEFAULT_NICE)
+        )
+        current_ionice_class = self.config_entry.options.get(
+            CONF_IONICE_CLASS,
+            self.config_entry.data.get(CONF_IONICE_CLASS, DEFAULT_IONICE_CLASS),
+        )
+        current_cpu_affinity = self.config_entry.options.get(
+            CONF_CPU_AFFINITY,
+            self.config_entry.data.get(CONF_CPU_AFFINITY, DEFAULT_CPU_AFFINITY),
+        )
+        current_skip_cpu_bound = self.config_entry.options.get(
+            CONF_SKIP_CPU_BOUND,
+            self.config_entry.data.get(CONF_SKIP_CPU_BOUND, DEFAULT_SKIP_CPU_BOUND),
+        )
+        current_probe_interval = self.config_entry.options.get(
+            CONF_PROBE_INTERVAL,
+            self.config_entry.data.get(CONF_PROBE_INTERVAL, DEFAULT_PROBE_INTERVAL),
+        )
+        current_probe_targets = self.config_entry.options.get(
+            CONF_PROBE_TARGETS,
+            self.config_entry.data.get(CONF_PROBE_TARGETS, DEFAULT_PROBE_TARGETS),
+        )
+        current_degradation_retest = self.config_entry.options.get(
+            CONF_DEGRADATION_RETEST,
+            self.config_entry.data.get(
+                CONF_DEGRADATION_RETEST, DEFAULT_DEGRADATION_RETEST
+            ),
+        )
+        current_adaptive_scheduling = self.config_entry.options.get(
+            CONF_ADAPTIVE_SCHEDULING,
+            self.config_entry.data.get(
+                CONF_ADAPTIVE_SCHEDULING, DEFAULT_ADAPTIVE_SCHEDULING
+            ),
+        )
+        current_min_scan_interval = self.config_entry.options.get(
+            CONF_MIN_SCAN_INTERVAL,
+            self.config_entry.data.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+        )
+        current_max_scan_interval = self.config_entry.options.get(
+            CONF_MAX_SCAN_INTERVAL,
+            self.config_entry.data.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+        )
+        current_monthly_data_budget = self.config_entry.options.get(
+            CONF_MONTHLY_DATA_BUDGET,
+            self.config_entry.data.get(
+                CONF_MONTHLY_DATA_BUDGET, DEFAULT_MONTHLY_DATA_BUDGET
+            ),
+        )
 
         schema = vol.Schema(
             {
+                vol.Optional(CONF_SERVER_SEARCH, default=self._server_search): str,
                 vol.Required(
                     CONF_SERVER_ID,
                     default=current_server_id,
@@ -307,16 +534,85 @@ class OoklaSpeedtestOptionsFlow(config_entries.OptionsFlow):
                     CONF_FALLBACK_TO_CLOSEST,
                     default=current_fallback_to_closest,
                 ): bool,
+                vol.Optional(
+                    CONF_TEST_TIMEOUT,
+                    default=current_test_timeout,
+                ): vol.All(vol.Coerce(int), vol.Range(min=30, max=900)),
+                vol.Optional(
+                    CONF_LIVE_PROGRESS,
+                    default=current_live_progress,
+                ): bool,
+                vol.Optional(
+                    CONF_HISTORY_RETENTION,
+                    default=current_history_retention,
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3650)),
+                vol.Optional(
+                    CONF_NICE,
+                    default=current_nice,
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=19)),
+                vol.Optional(
+                    CONF_IONICE_CLASS,
+                    default=current_ionice_class,
+                ): vol.In(IONICE_CLASSES),
+                vol.Optional(
+                    CONF_CPU_AFFINITY,
+                    default=current_cpu_affinity,
+                ): str,
+                vol.Optional(
+                    CONF_SKIP_CPU_BOUND,
+                    default=current_skip_cpu_bound,
+                ): bool,
+                vol.Optional(
+                    CONF_PROBE_INTERVAL,
+                    default=current_probe_interval,
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Optional(
+                    CONF_PROBE_TARGETS,
+                    default=current_probe_targets,
+                ): str,
+                vol.Optional(
+                    CONF_DEGRADATION_RETEST,
+                    default=current_degradation_retest,
+                ): bool,
+                vol.Optional(
+                    CONF_ADAPTIVE_SCHEDULING,
+                    default=current_adaptive_scheduling,
+                ): bool,
+                vol.Optional(
+                    CONF_MIN_SCAN_INTERVAL,
+                    default=current_min_scan_interval,
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=43200)),
+                vol.Optional(
+                    CONF_MAX_SCAN_INTERVAL,
+                    default=current_max_scan_interval,
+                ): vol.All(vol.Coerce(int), vol.Range(min=5, max=43200)),
+                vol.Optional(
+                    CONF_MONTHLY_DATA_BUDGET,
+                    default=current_monthly_data_budget,
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=10_000_000)),
             }
         )
 
         if user_input is None:
+            if self._search_input:
+                # Re-rendered for a new search; keep what was already entered
+                schema = self.add_suggested_values_to_schema(
+                    schema, _searched_values(self._search_input, server_options)
+                )
+                self._search_input = None
             return self.async_show_form(
                 step_id="init",
                 data_schema=schema,
                 errors=errors,
             )
 
+        # A changed search term re-renders the form with matching servers
+        server_search = user_input.get(CONF_SERVER_SEARCH, "").strip()
+        if server_search != self._server_search:
+            self._server_search = server_search
+            self._search_input = user_input
+            return await self.async_step_init()
+
         # Process input
         scan_interval_input = user_input[CONF_SCAN_INTERVAL]
         if isinstance(scan_interval_input, dict):
@@ -337,6 +633,36 @@ class OoklaSpeedtestOptionsFlow(config_entries.OptionsFlow):
                 errors=errors,
             )
 
+        cpu_affinity = user_input.get(CONF_CPU_AFFINITY, DEFAULT_CPU_AFFINITY).strip()
+        if not validate_cpu_affinity(cpu_affinity):
+            errors[CONF_CPU_AFFINITY] = "invalid_cpu_affinity"
+            return self.async_show_form(
+                step_id="init",
+                data_schema=schema,
+                errors=errors,
+            )
+
+        probe_interval = user_input.get(CONF_PROBE_INTERVAL, DEFAULT_PROBE_INTERVAL)
+        if 0 < probe_interval < MIN_PROBE_INTERVAL:
+            errors[CONF_PROBE_INTERVAL] = "probe_interval_too_short"
+        probe_targets = user_input.get(CONF_PROBE_TARGETS, DEFAULT_PROBE_TARGETS).strip()
+        if not validate_probe_targets(probe_targets):
+            errors[CONF_PROBE_TARGETS] = "invalid_probe_targets"
+        min_scan_interval = user_input.get(
+            CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+        )
+        max_scan_interval = user_input.get(
+            CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+        )
+        if min_scan_interval > max_scan_interval:
+            errors[CONF_MAX_SCAN_INTERVAL] = "invalid_scan_interval_range"
+        if errors:
+            return self.async_show_form(
+                step_id="init",
+                data_schema=schema,
+                errors=errors,
+            )
+
         # Validate and process server ID
         server_id = user_input[CONF_SERVER_ID]
         if server_id == "manual":
@@ -378,5 +704,35 @@ class OoklaSpeedtestOptionsFlow(config_entries.OptionsFlow):
                 CONF_FALLBACK_TO_CLOSEST: user_input.get(
                     CONF_FALLBACK_TO_CLOSEST, DEFAULT_FALLBACK_TO_CLOSEST
                 ),
+                CONF_TEST_TIMEOUT: user_input.get(
+                    CONF_TEST_TIMEOUT, DEFAULT_TEST_TIMEOUT
+                ),
+                CONF_LIVE_PROGRESS: user_input.get(
+                    CONF_LIVE_PROGRESS, DEFAULT_LIVE_PROGRESS
+                ),
+                CONF_HISTORY_RETENTION: user_input.get(
+                    CONF_HISTORY_RETENTION, DEFAULT_HISTORY_RETENTION
+                ),
+                CONF_NICE: user_input.get(CONF_NICE, DEFAULT_NICE),
+                CONF_IONICE_CLASS: user_input.get(
+                    CONF_IONICE_CLASS, DEFAULT_IONICE_CLASS
+                ),
+                CONF_CPU_AFFINITY: cpu_affinity,
+                CONF_SKIP_CPU_BOUND: user_input.get(
+                    CONF_SKIP_CPU_BOUND, DEFAULT_SKIP_CPU_BOUND
+                ),
+                CONF_PROBE_INTERVAL: probe_interval,
+                CONF_PROBE_TARGETS: probe_targets,
+                CONF_DEGRADATION_RETEST: user_input.get(
+                    CONF_DEGRADATION_RETEST, DEFAULT_DEGRADATION_RETEST
+                ),
+                CONF_ADAPTIVE_SCHEDULING: user_input.get(
+                    CONF_ADAPTIVE_SCHEDULING, DEFAULT_ADAPTIVE_SCHEDULING
+                ),
+                CONF_MIN_SCAN_INTERVAL: min_scan_interval,
+                CONF_MAX_SCAN_INTERVAL: max_scan_interval,
+                CONF_MONTHLY_DATA_BUDGET: user_input.get(
+                    CONF_MONTHLY_DATA_BUDGET, DEFAULT_MONTHLY_DATA_BUDGET
+                ),
             },
         )
@@ -12,18 +12,97 @@ CONF_ISP_UL_SPEED = "isp_ul_speed"
 CONF_ENABLE_LATENCY_SENSORS = "enable_latency"
 CONF_ENABLE_COMPLIANCE_SENSORS = "enable_compliance"
 CONF_FALLBACK_TO_CLOSEST = "fallback_to_closest"
+CONF_TEST_TIMEOUT = "test_timeout"
+CONF_LIVE_PROGRESS = "live_progress"
+CONF_SERVER_SEARCH = "server_search"
+CONF_HISTORY_RETENTION = "history_retention"
+CONF_NICE = "nice"
+CONF_IONICE_CLASS = "ionice_class"
+CONF_CPU_AFFINITY = "cpu_affinity"
+CONF_SKIP_CPU_BOUND = "skip_cpu_bound"
+CONF_PROBE_INTERVAL = "probe_interval"
+CONF_PROBE_TARGETS = "probe_targets"
+CONF_DEGRADATION_RETEST = "degradation_retest"
+CONF_ADAPTIVE_SCHEDULING = "adaptive_scheduling"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL = "max_scan_interval"
+CONF_MONTHLY_DATA_BUDGET = "monthly_data_budget"
 
 DEFAULT_SCAN_INTERVAL = 1440  # minutes (24 hours)
 DEFAULT_ENABLE_LATENCY = False
 DEFAULT_ENABLE_COMPLIANCE = False
 DEFAULT_FALLBACK_TO_CLOSEST = False
+DEFAULT_TEST_TIMEOUT = 180  # seconds - hard deadline for a single speedtest run
+DEFAULT_LIVE_PROGRESS = True
+DEFAULT_HISTORY_RETENTION = 365  # days
+DEFAULT_NICE = 0  # 0-19, higher runs the speedtest at lower CPU priority
+DEFAULT_IONICE_CLASS = "none"
+DEFAULT_CPU_AFFINITY = ""  # e.g. "3" or "2-3"; empty allows every CPU
+DEFAULT_SKIP_CPU_BOUND = False
+DEFAULT_PROBE_INTERVAL = 0  # seconds - 0 disables the latency probes
+DEFAULT_PROBE_TARGETS = ""  # e.g. "1.1.1.1:53, example.com"
+DEFAULT_DEGRADATION_RETEST = False
+DEFAULT_ADAPTIVE_SCHEDULING = False
+DEFAULT_MIN_SCAN_INTERVAL = 60  # minutes - adaptive interval after a failure or change
+DEFAULT_MAX_SCAN_INTERVAL = 4320  # minutes (3 days) - adaptive interval ceiling
+DEFAULT_MONTHLY_DATA_BUDGET = 0  # MB - 0 means no budget
 STARTUP_DELAY = 60  # seconds - delay before first speedtest in interval mode
+KILL_GRACE_PERIOD = 5  # seconds - wait after SIGTERM before sending SIGKILL
+PROGRESS_UPDATE_INTERVAL = 0.5  # seconds - minimum gap between live progress updates
+TIMING_HISTORY_SIZE = 50  # runs - timing breakdowns kept for diagnostics
+ROLLING_WINDOW_SIZE = 20  # runs - results behind the rolling statistics
+ROLLING_EWMA_ALPHA = 0.3  # weight of the newest result in the rolling EWMA
+LOOP_LAG_SAMPLE_INTERVAL = 0.25  # seconds - event loop lag sampling period during a run
+CPU_SAMPLE_INTERVAL = 1.0  # seconds - host/process CPU sampling period during a run
+CPU_SATURATION_THRESHOLD = 95  # percent - busiest core load that counts as saturated
+CPU_BOUND_FRACTION = 0.5  # share of saturated samples that marks a result CPU bound
+MIN_PROBE_INTERVAL = 10  # seconds - shortest allowed latency probe interval
+PROBE_WINDOW_SIZE = 360  # probes - latency probe samples kept per statistic
+PROBE_TIMEOUT = 3  # seconds - deadline for one DNS lookup plus TCP connect
+PROBE_DEFAULT_PORT = 443  # TCP port for probe targets given without one
+SPEEDTEST_SERVER_PORT = 8080  # TCP port Ookla test servers listen on
+DEGRADATION_ALPHA = 0.1  # weight of the newest result in the degradation baseline
+DEGRADATION_MIN_SAMPLES = 5  # results - baseline built before degradation is detected
+DEGRADATION_SLACK = 0.5  # deviations - drift per result ignored by the CUSUM
+DEGRADATION_THRESHOLD = 4.0  # deviations - CUSUM level that reports a degradation
+DEGRADATION_RETEST_DELAY = 300  # seconds - wait before a confirmation re-test
+ADAPTIVE_MIN_SAMPLES = 3  # results - history needed before the interval adapts
+ADAPTIVE_STABILITY_BAND = 0.1  # relative change from the rolling mean that counts as stable
+ADAPTIVE_CHANGE_THRESHOLD = 0.25  # relative change that drops to the minimum interval
+ADAPTIVE_STRETCH_FACTOR = 1.5  # interval growth per stable result
+SERVER_CATALOG_TTL = 86400  # seconds - age after which the server list is refreshed
+SERVER_CATALOG_MAX_MISSED = 5  # fetches - a server missing from this many in a row is dropped
+SERVER_LIST_TIMEOUT = 30  # seconds - deadline for listing servers
+
+# Live progress phases, in the order the CLI reports them
+PHASE_IDLE = "idle"
+PHASE_STARTING = "starting"
+PROGRESS_PHASES = ("ping", "download", "upload")
+
+# hass.data keys for domain-wide objects
+DATA_SERVER_CATALOG = f"{DOMAIN}_server_catalog"
+DATA_BINARY_STATS = f"{DOMAIN}_binary_stats"
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+
+# Dispatcher signal sent with the entry id when a run's timing is complete
+SIGNAL_RUN_TIMING = f"{DOMAIN}_run_timing_{{}}"
+
+# Event fired when a sustained drop in speed or rise in latency is detected
+EVENT_DEGRADATION = f"{DOMAIN}_degradation"
+
+# Run queue priorities - lower values run first
+PRIORITY_MANUAL = 0
+PRIORITY_SCHEDULED = 10
 
 # Service
 SERVICE_RUN_SPEEDTEST = "run_speedtest"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
 
 # Paths
 SPEEDTEST_BIN_PATH = "/config/custom_components/ookla_speedtest/bin/speedtest.bin"
+# Environment variable naming another executable to run instead of the
+# managed binary, e.g. scripts/speedtest_simulator.py for offline testing
+SPEEDTEST_BIN_ENV = "OOKLA_SPEEDTEST_BIN"
 
 # Sensor attributes
 ATTR_PING = "ping"
@@ -44,6 +123,33 @@ ATTR_UPLOAD_LATENCY_HIGH = "ping high during upload"
 ATTR_UPLOAD_LATENCY_JITTER = "jitter during upload"
 ATTR_JITTER = "jitter"
 ATTR_SERVER = "server"
+ATTR_SERVER_ID = "server_id"
 ATTR_ISP = "isp"
 ATTR_DATE_LAST_TEST = "last_test"
 ATTR_RESULT_URL = "result_url"
+ATTR_RESULT_VALIDITY = "result_validity"
+
+# Live progress attributes
+ATTR_TEST_PHASE = "test_phase"
+ATTR_TEST_PROGRESS = "test_progress"
+ATTR_LIVE_BANDWIDTH = "live_bandwidth"
+ATTR_TESTING = "testing"
+
+# Schedule attributes
+ATTR_NEXT_TEST = "next_test"
+ATTR_SCHEDULE_REASON = "schedule_reason"
+
+# Data usage
+ATTR_DATA_USED_DAY = "data_used_day"
+ATTR_DATA_USED_MONTH = "data_used_month"
+ATTR_DATA_USED_TOTAL = "data_used_total"
+
+# Latency probe statistics
+ATTR_PROBE_CONNECT_P50 = "probe_connect_p50"
+ATTR_PROBE_CONNECT_P95 = "probe_connect_p95"
+ATTR_PROBE_CONNECT_P99 = "probe_connect_p99"
+ATTR_PROBE_DNS_P50 = "probe_dns_p50"
+ATTR_PROBE_DNS_P95 = "probe_dns_p95"
+ATTR_PROBE_DNS_P99 = "probe_dns_p99"
+ATTR_PROBE_LOSS = "probe_loss"
+ATTR_PROBE_OUTAGE = "probe_outage"
@@ -0,0 +1,149 @@
+"""Host and speedtest process CPU sampling during a run."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import CPU_BOUND_FRACTION, CPU_SATURATION_THRESHOLD
+
+_LOGGER = logging.getLogger(__name__)
+
+VALIDITY_VALID = "valid"
+VALIDITY_CPU_BOUND = "cpu_bound"
+VALIDITY_OPTIONS = [VALIDITY_VALID, VALIDITY_CPU_BOUND]
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def read_cpu_times() -> list[tuple[int, int]]:
+    """Return (busy, total) jiffies from /proc/stat, all CPUs first, then each core."""
+    times = []
+    with open("/proc/stat", encoding="ascii") as stat_file:
+        for line in stat_file:
+            if not line.startswith("cpu"):
+                break
+            # user nice system idle iowait irq softirq steal (guest is in user)
+            values = [int(value) for value in line.split()[1:9]]
+            total = sum(values)
+            times.append((total - values[3] - values[4], total))
+    return times
+
+
+def read_process_ticks(pid: int) -> int | None:
+    """Return the user + system clock ticks used by a process, if it exists."""
+    try:
+        with open(f"/proc/{pid}/stat", encoding="ascii") as stat_file:
+            stat = stat_file.read()
+    except OSError:
+        return None
+    # The command name may contain spaces; utime and stime follow it as
+    # fields 14 and 15 of the line
+    fields = stat.rpartition(")")[2].split()
+    return int(fields[11]) + int(fields[12])
+
+
+class CpuMonitor:
+    """Sample CPU use of the host and of the running speedtest process.
+
+    Host figures are the busy share of all CPUs; process figures are in
+    percent of one core, so a multi-threaded process can exceed 100. A
+    sample is saturated when its busiest core reached
+    CPU_SATURATION_THRESHOLD, and a run where at least CPU_BOUND_FRACTION
+    of the samples were saturated is reported as CPU bound.
+    """
+
+    def __init__(self, interval: float) -> None:
+        """Initialize the monitor."""
+        self.interval = interval
+        # Set by the coordinator once the speedtest process is spawned
+        self.pid: int | None = None
+        self.samples = 0
+        self._saturated = 0
+        self._host_total = 0.0
+        self._host_peak = 0.0
+        self._core_peak = 0.0
+        self._process_samples = 0
+        self._process_total = 0.0
+        self._process_peak = 0.0
+        self._last_times: list[tuple[int, int]] | None = None
+        self._last_pid: int | None = None
+        self._last_ticks: int | None = None
+        self._last_sampled = 0.0
+
+    async def async_run(self, hass: HomeAssistant) -> None:
+        """Sample until cancelled; /proc reads run in the executor."""
+        while True:
+            try:
+                await hass.async_add_executor_job(self.sample)
+            except OSError as err:
+                _LOGGER.debug("CPU sampling unavailable: %s", err)
+                return
+            await asyncio.sleep(self.interval)
+
+    def sample(self) -> None:
+        """Take one sample and fold the change since the last into the stats."""
+        times = read_cpu_times()
+        now = time.monotonic()
+        pid = self.pid
+        ticks = read_process_ticks(pid) if pid is not None else None
+
+        if self._last_times is not None and len(times) == len(self._last_times):
+            usage = [
+                100 * (busy - last_busy) / (total - last_total)
+                for (busy, total), (last_busy, last_total) in zip(
+                    times, self._last_times
+                )
+                if total > last_total
+            ]
+            if usage:
+                self.samples += 1
+                self._host_total += usage[0]
+                self._host_peak = max(self._host_peak, usage[0])
+                busiest_core = max(usage[1:] or usage)
+                self._core_peak = max(self._core_peak, busiest_core)
+                if busiest_core >= CPU_SATURATION_THRESHOLD:
+                    self._saturated += 1
+
+        if (
+            ticks is not None
+            and pid == self._last_pid
+            and self._last_ticks is not None
+            and now > self._last_sampled
+        ):
+            process = 100 * (ticks - self._last_ticks) / _CLOCK_TICKS / (now - self._last_sampled)
+            self._process_samples += 1
+            self._process_total += process
+            self._process_peak = max(self._process_peak, process)
+
+        self._last_times = times
+        self._last_pid = pid
+        self._last_ticks = ticks
+        self._last_sampled = now
+
+    def result_fields(self) -> dict[str, Any]:
+        """Return the SpeedtestResult CPU fields for the sampled run."""
+        if not self.samples:
+            return {}
+
+        process_avg = process_peak = None
+        if self._process_samples:
+            process_avg = round(self._process_total / self._process_samples, 1)
+            process_peak = round(self._process_peak, 1)
+        return {
+            "cpu_host_avg": round(self._host_total / self.samples, 1),
+            "cpu_host_peak": round(self._host_peak, 1),
+            "cpu_core_peak": round(self._core_peak, 1),
+            "cpu_process_avg": process_avg,
+            "cpu_process_peak": process_peak,
+            "result_validity": (
+                VALIDITY_CPU_BOUND
+                if self._saturated / self.samples >= CPU_BOUND_FRACTION
+                else VALIDITY_VALID
+            ),
+        }
@@ -0,0 +1,147 @@
+"""Online detection of a sustained drop in connection quality."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any
+
+from .const import (
+    DEGRADATION_ALPHA,
+    DEGRADATION_MIN_SAMPLES,
+    DEGRADATION_SLACK,
+    DEGRADATION_THRESHOLD,
+)
+from .result import SpeedtestResult
+
+DIRECTION_DOWN = "down"
+DIRECTION_UP = "up"
+
+# SpeedtestResult fields watched, by the direction that means worse
+DEGRADATION_SERIES = {
+    "download": DIRECTION_DOWN,
+    "upload": DIRECTION_DOWN,
+    "ping": DIRECTION_UP,
+    "download_latency_iqm": DIRECTION_UP,
+    "upload_latency_iqm": DIRECTION_UP,
+}
+
+# Floor for the baseline deviation, relative to the baseline, so a very
+# steady line does not alarm on a change of a few percent
+_MIN_RELATIVE_DEVIATION = 0.05
+
+
+@dataclass(slots=True)
+class CusumState:
+    """One-sided CUSUM of a series against its EWMA baseline."""
+
+    mean: float | None = None
+    variance: float = 0.0
+    samples: int = 0
+    cusum: float = 0.0
+
+    def update(self, value: float, direction: str) -> bool:
+        """Add a value and return true when the CUSUM crosses the threshold.
+
+        Deviations are measured in baseline standard deviations, and only
+        those in the worse direction beyond DEGRADATION_SLACK accumulate.
+        The baseline then moves towards the value, so a lasting shift
+        becomes the new normal once it has been reported.
+        """
+        if self.mean is None:
+            self.mean = value
+            self.samples = 1
+            return False
+
+        alarm = False
+        if self.samples >= DEGRADATION_MIN_SAMPLES:
+            score = self.score(value, direction)
+            self.cusum = max(0.0, self.cusum + score - DEGRADATION_SLACK)
+            alarm = self.cusum > DEGRADATION_THRESHOLD
+
+        diff = value - self.mean
+        self.mean += DEGRADATION_ALPHA * diff
+        self.variance = (1 - DEGRADATION_ALPHA) * (
+            self.variance + DEGRADATION_ALPHA * diff * diff
+        )
+        self.samples += 1
+        return alarm
+
+    def score(self, value: float, direction: str) -> float:
+        """Return how many baseline deviations a value lies in the worse direction."""
+        if self.mean is None:
+            return 0.0
+        deviation = max(
+            math.sqrt(self.variance), abs(self.mean) * _MIN_RELATIVE_DEVIATION, 1e-9
+        )
+        score = (value - self.mean) / deviation
+        return -score if direction == DIRECTION_DOWN else score
+
+
+class DegradationDetector:
+    """CUSUM detectors for the DEGRADATION_SERIES of each result."""
+
+    def __init__(self, stored: dict[str, Any] | None = None) -> None:
+        """Initialize the detectors, restoring saved state if given."""
+        stored = stored or {}
+        self.series = {
+            field: CusumState(**stored.get(field, {})) for field in DEGRADATION_SERIES
+        }
+
+    def add(self, result: SpeedtestResult) -> list[dict[str, Any]]:
+        """Add a result and return a description of each series that alarmed."""
+        alarms = []
+        for field, direction in DEGRADATION_SERIES.items():
+            value = getattr(result, field)
+            if value is None:
+                continue
+            state = self.series[field]
+            baseline = state.mean
+            if state.update(value, direction):
+                alarms.append(
+                    {
+                        "metric": field,
+                        "direction": direction,
+                        "value": value,
+                        "baseline": round(baseline, 2),
+                        "cusum": round(state.cusum, 2),
+                    }
+                )
+        return alarms
+
+    def confirm(
+        self, result: SpeedtestResult, alarms: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Return the alarms a re-test repeats on its own, before adding it.
+
+        The CUSUM of an alarm still holds the drop that raised it, so a
+        re-test is judged by its own value instead: it confirms an alarm
+        when it is worse than the baseline by more than DEGRADATION_SLACK
+        deviations, the drift the CUSUM itself ignores.
+        """
+        confirmed = []
+        for alarm in alarms:
+            value = getattr(result, alarm["metric"])
+            if value is None:
+                continue
+            state = self.series[alarm["metric"]]
+            if state.score(value, alarm["direction"]) > DEGRADATION_SLACK:
+                confirmed.append({**alarm, "value": value})
+        return confirmed
+
+    def reset(self, fields: list[str]) -> None:
+        """Clear the CUSUM of reported series so they alarm again only on a new drop."""
+        for field in fields:
+            self.series[field].cusum = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the detector state for storage."""
+        return {
+            field: {
+                "mean": state.mean,
+                "variance": state.variance,
+                "samples": state.samples,
+                "cusum": state.cusum,
+            }
+            for field, state in self.series.items()
+        }
@@ -8,9 +8,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from . import SpeedtestCoordinator
-from .const import DOMAIN
+from .const import DATA_BINARY_STATS, DOMAIN
 
-TO_REDACT = {"manual_server_id", "result_url"}
+TO_REDACT = {"manual_server_id", "result_url", "result_id", "internal_ip", "external_ip"}
 
 
 async def async_get_config_entry_diagnostics(
@@ -21,7 +21,14 @@ async def async_get_config_entry_diagnostics(
 
     diagnostics_data = {
         "entry": async_redact_data(entry.as_dict(), TO_REDACT),
-        "coordinator_data": async_redact_data(coordinator.data, TO_REDACT),
+        "coordinator_data": (
+            async_redact_data(coordinator.data.as_dict(), TO_REDACT)
+            if coordinator.data
+            else None
+        ),
+        "binary_validation": dict(hass.data.get(DATA_BINARY_STATS, {})),
+        "run_timings": [timing.as_dict() for timing in coordinator.timings],
+        "degradation": coordinator.degradation.as_dict(),
     }
 
     return diagnostics_data
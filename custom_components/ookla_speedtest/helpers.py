@@ -1,14 +1,14 @@
 """Helper functions for Ookla Speedtest integration."""
 
-import json
 import logging
-import subprocess
 from datetime import datetime
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 
-from .const import SPEEDTEST_BIN_PATH
+from .probe import parse_probe_targets
+from .process_priority import parse_cpu_list
+from .server_catalog import async_get_server_catalog
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,67 +49,57 @@ def validate_server_id(server_id: str | None) -> bool:
     return server_id.isdigit()
 
 
-async def get_speedtest_servers(hass: HomeAssistant) -> list[dict[str, Any]]:
-    """Fetch the list of 10 closest Speedtest servers.
+def validate_cpu_affinity(cpus: str | None) -> bool:
+    """Validate a CPU list such as "3", "2,3" or "2-3".
 
     Args:
-        hass: Home Assistant instance
+        cpus: The CPU list to validate
 
     Returns:
-        List of server dictionaries with id, name, location, and distance
+        True if valid or empty, False otherwise
     """
-    _LOGGER.debug("Fetching 10 closest Speedtest servers")
+    if not cpus:
+        return True
     try:
-        process = await hass.async_add_executor_job(
-            lambda: subprocess.run(
-                [
-                    SPEEDTEST_BIN_PATH,
-                    "--servers",
-                    "--format=json",
-                    "--accept-license",
-                    "--accept-gdpr",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-        )
-        servers_data = json.loads(process.stdout)
-        servers = servers_data.get("servers", [])
-
-        # Sort by distance and take the 10 closest
-        sorted_servers = sorted(
-            servers, key=lambda x: x.get("distance", float("inf"))
-        )
-        result = []
-        for server in sorted_servers[:10]:
-            # Safely access server data with fallbacks
-            city = server.get("city", server.get("location", "Unknown City"))
-            country = server.get("country", server.get("region", "Unknown Country"))
-            name = server.get("name", "Unknown Server")
-            distance = round(server.get("distance", 0), 2)
-            server_id = str(server.get("id", ""))
-
-            if not server_id:
-                _LOGGER.warning("Skipping server with missing ID: %s", name)
-                continue
-
-            result.append(
-                {
-                    "id": server_id,
-                    "name": name,
-                    "location": f"{city}, {country}",
-                    "distance": distance,
-                }
-            )
-        _LOGGER.debug("Retrieved %d valid servers", len(result))
-        return result
-    except subprocess.CalledProcessError as e:
-        _LOGGER.error("Failed to fetch server list: %s", e.stderr)
-        return []
-    except json.JSONDecodeError as e:
-        _LOGGER.error("Failed to parse server list JSON: %s", e)
-        return []
-    except Exception as e:
-        _LOGGER.error("Unexpected error fetching servers: %s", str(e))
-        return []
+        parse_cpu_list(cpus)
+    except ValueError:
+        return False
+    return True
+
+
+def validate_probe_targets(targets: str | None) -> bool:
+    """Validate a comma separated list of host[:port] probe targets.
+
+    Args:
+        targets: The targets to validate
+
+    Returns:
+        True if valid or empty, False otherwise
+    """
+    if not targets:
+        return True
+    try:
+        parse_probe_targets(targets)
+    except ValueError:
+        return False
+    return True
+
+
+async def get_speedtest_servers(
+    hass: HomeAssistant, search: str | None = None
+) -> list[dict[str, Any]]:
+    """Return Speedtest servers from the cached server catalogue.
+
+    Args:
+        hass: Home Assistant instance
+        search: Optional query matched against server id, name and city
+
+    Returns:
+        List of server dictionaries with id, name, location, and distance.
+        Without a search, the 10 closest servers are returned.
+    """
+    catalog = async_get_server_catalog(hass)
+    servers = await catalog.async_get_closest()
+    if search:
+        servers = catalog.search(search)
+    return servers
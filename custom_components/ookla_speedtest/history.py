@@ -0,0 +1,331 @@
+"""Compact on-disk history of speedtest results.
+
+Each result is stored as a fixed-size little-endian record in an
+append-only file, so range scans can binary-search and unpack straight
+out of a memory map. Records older than the retention period are dropped
+by rewriting the file once enough of them have accumulated.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import mmap
+import os
+import struct
+import time
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    ATTR_BUFFERBLOAT_GRADE,
+    ATTR_DL_PCT,
+    ATTR_DOWNLOAD,
+    ATTR_DOWNLOAD_LATENCY_HIGH,
+    ATTR_DOWNLOAD_LATENCY_IQM,
+    ATTR_DOWNLOAD_LATENCY_JITTER,
+    ATTR_DOWNLOAD_LATENCY_LOW,
+    ATTR_JITTER,
+    ATTR_PING,
+    ATTR_PING_HIGH,
+    ATTR_PING_LOW,
+    ATTR_SERVER_ID,
+    ATTR_UL_PCT,
+    ATTR_UPLOAD,
+    ATTR_UPLOAD_LATENCY_HIGH,
+    ATTR_UPLOAD_LATENCY_IQM,
+    ATTR_UPLOAD_LATENCY_JITTER,
+    ATTR_UPLOAD_LATENCY_LOW,
+    DOMAIN,
+)
+from .result import FIELD_BY_ATTR, SpeedtestResult
+
+_LOGGER = logging.getLogger(__name__)
+
+# Numeric result fields in record order; missing values are stored as NaN
+VALUE_FIELDS = (
+    ATTR_PING,
+    ATTR_JITTER,
+    ATTR_PING_LOW,
+    ATTR_PING_HIGH,
+    ATTR_DOWNLOAD,
+    ATTR_DOWNLOAD_LATENCY_IQM,
+    ATTR_DOWNLOAD_LATENCY_LOW,
+    ATTR_DOWNLOAD_LATENCY_HIGH,
+    ATTR_DOWNLOAD_LATENCY_JITTER,
+    ATTR_UPLOAD,
+    ATTR_UPLOAD_LATENCY_IQM,
+    ATTR_UPLOAD_LATENCY_LOW,
+    ATTR_UPLOAD_LATENCY_HIGH,
+    ATTR_UPLOAD_LATENCY_JITTER,
+    ATTR_DL_PCT,
+    ATTR_UL_PCT,
+)
+
+# Record fields as returned by ResultHistory.read_range
+FIELDS = ("timestamp", ATTR_SERVER_ID, *VALUE_FIELDS, ATTR_BUFFERBLOAT_GRADE)
+
+# timestamp (epoch seconds), server id (0 = none or not numeric), values,
+# bufferbloat grade (0 = none)
+RECORD = struct.Struct(f"<dI{len(VALUE_FIELDS)}fB")
+HEADER = struct.Struct("<4sHH")
+MAGIC = b"OKLH"
+FORMAT_VERSION = 1
+FILE_HEADER = HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size)
+
+# Rewrite the file once this share of its records has expired
+COMPACT_RATIO = 0.125
+
+# Seconds a downsampled series stays cached while no new test arrives
+SERIES_CACHE_TTL = 3600
+
+
+class ResultHistory:
+    """Append-only binary result history for one config entry.
+
+    File access is blocking; the async methods run it in the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, retention_days: int) -> None:
+        """Initialize the history file."""
+        self.hass = hass
+        self.path = hass.config.path(".storage", f"{DOMAIN}.{entry_id}.history")
+        self.retention = retention_days * 86400
+        self._series_cache: dict[tuple, tuple[float, dict[str, list]]] = {}
+
+    async def async_append(self, result: SpeedtestResult) -> None:
+        """Append a processed result and invalidate cached series."""
+        self._series_cache.clear()
+        try:
+            await self.hass.async_add_executor_job(self._append, pack_result(result))
+        except OSError as e:
+            _LOGGER.error("Failed to write speedtest history: %s", e)
+
+    async def async_get_series(
+        self,
+        hours: int,
+        points: int,
+        fields: tuple[str, ...],
+        since: int | None = None,
+    ) -> dict[str, list[list[float]]]:
+        """Return [timestamp_ms, value] series downsampled to at most points.
+
+        Results are cached per window and resolution until the next test is
+        appended, or for SERIES_CACHE_TTL so the window edge keeps moving.
+        With since (epoch ms), only the raw records newer than it are
+        returned so clients can sync incrementally.
+        """
+        now = time.time()
+        if since is not None:
+            return await self.hass.async_add_executor_job(
+                self.read_series, max(since / 1000, now - hours * 3600), fields, None, since
+            )
+
+        key = (hours, points, fields)
+        if (cached := self._series_cache.get(key)) and now - cached[0] < SERIES_CACHE_TTL:
+            return cached[1]
+
+        series = await self.hass.async_add_executor_job(
+            self.read_series, now - hours * 3600, fields, points
+        )
+        self._series_cache[key] = (now, series)
+        return series
+
+    async def async_read_range(
+        self, start: float | None = None, end: float | None = None
+    ) -> list[tuple]:
+        """Return records with start <= timestamp < end, oldest first."""
+        return await self.hass.async_add_executor_job(self.read_range, start, end)
+
+    def read_series(
+        self,
+        start: float,
+        fields: tuple[str, ...],
+        points: int | None,
+        since: int | None = None,
+    ) -> dict[str, list[list[float]]]:
+        """Read records from start and build their series.
+
+        Reading and downsampling scale with the history size, so both run
+        in the executor rather than on the event loop.
+        """
+        return _build_series(self.read_range(start), fields, points, since)
+
+    async def async_remove(self) -> None:
+        """Delete the history file."""
+        await self.hass.async_add_executor_job(self._remove)
+
+    def read_range(self, start: float | None = None, end: float | None = None) -> list[tuple]:
+        """Return records with start <= timestamp < end, oldest first."""
+        try:
+            with open(self.path, "rb") as history_file:
+                if os.fstat(history_file.fileno()).st_size <= HEADER.size:
+                    return []
+                with mmap.mmap(history_file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    if not self._header_is_valid(view):
+                        return []
+                    count = (len(view) - HEADER.size) // RECORD.size
+                    first = 0 if start is None else self._bisect(view, count, start)
+                    last = count if end is None else self._bisect(view, count, end)
+                    if first >= last:
+                        return []
+                    return list(
+                        RECORD.iter_unpack(
+                            view[
+                                HEADER.size + first * RECORD.size :
+                                HEADER.size + last * RECORD.size
+                            ]
+                        )
+                    )
+        except FileNotFoundError:
+            return []
+
+    def _append(self, record: bytes) -> None:
+        """Append a packed record, creating or compacting the file as needed."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a+b") as history_file:
+            history_file.seek(0)
+            header = history_file.read(HEADER.size)
+            if header != FILE_HEADER:
+                if header:
+                    _LOGGER.warning("Discarding unreadable history file %s", self.path)
+                history_file.truncate(0)
+                history_file.write(FILE_HEADER)
+            else:
+                # Drop a partial record left by an interrupted write
+                size = history_file.seek(0, os.SEEK_END)
+                aligned = size - (size - HEADER.size) % RECORD.size
+                if aligned != size:
+                    history_file.truncate(aligned)
+            history_file.write(record)
+        self._compact()
+
+    def _compact(self) -> None:
+        """Drop expired records once enough of them have accumulated."""
+        with open(self.path, "rb") as history_file:
+            with mmap.mmap(history_file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                count = (len(view) - HEADER.size) // RECORD.size
+                expired = self._bisect(view, count, time.time() - self.retention)
+                if expired == 0 or expired < count * COMPACT_RATIO:
+                    return
+                keep = view[HEADER.size + expired * RECORD.size : HEADER.size + count * RECORD.size]
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as tmp_file:
+            tmp_file.write(FILE_HEADER)
+            tmp_file.write(keep)
+        os.replace(tmp_path, self.path)
+
+    def _remove(self) -> None:
+        """Delete the history file if present."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _header_is_valid(view: mmap.mmap) -> bool:
+        """Check the file header matches the current record layout."""
+        return view[: HEADER.size] == FILE_HEADER
+
+    @staticmethod
+    def _bisect(view: mmap.mmap, count: int, timestamp: float) -> int:
+        """Return the index of the first record at or after timestamp."""
+        low, high = 0, count
+        while low < high:
+            mid = (low + high) // 2
+            if RECORD.unpack_from(view, HEADER.size + mid * RECORD.size)[0] < timestamp:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+
+def pack_result(result: SpeedtestResult) -> bytes:
+    """Pack a speedtest result into a history record."""
+    grade = result.bufferbloat_grade
+    values = (getattr(result, FIELD_BY_ATTR[key]) for key in VALUE_FIELDS)
+    return RECORD.pack(
+        result.timestamp.timestamp(),
+        _server_number(result.server_id),
+        *(math.nan if value is None else value for value in values),
+        ord(grade) if grade else 0,
+    )
+
+
+def _server_number(server_id: str | None) -> int:
+    """Return a server ID as the record's unsigned number, or 0 if it is not one."""
+    server_id = str(server_id or "")
+    if server_id.isdecimal() and int(server_id) < 1 << 32:
+        return int(server_id)
+    return 0
+
+
+def _build_series(
+    records: list[tuple],
+    fields: tuple[str, ...],
+    points: int | None,
+    since: int | None = None,
+) -> dict[str, list[list[float]]]:
+    """Extract [timestamp_ms, value] series from records, skipping gaps."""
+    series = {}
+    for field in fields:
+        column = FIELDS.index(field)
+        samples = [
+            (record[0], record[column])
+            for record in records
+            if not math.isnan(record[column])
+        ]
+        if points is not None:
+            samples = downsample_lttb(samples, points)
+
+        values = []
+        for timestamp, value in samples:
+            timestamp_ms = round(timestamp * 1000)
+            if since is None or timestamp_ms > since:
+                values.append([timestamp_ms, round(value, 2)])
+        series[field] = values
+    return series
+
+
+def downsample_lttb(
+    samples: list[tuple[float, float]], threshold: int
+) -> list[tuple[float, float]]:
+    """Downsample (x, y) samples with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last samples and, from each bucket in between, the
+    sample forming the largest triangle with its neighbours, which
+    preserves peaks and dips that plain striding drops. Fewer than three
+    points leave no buckets, so only the end points are kept.
+    """
+    if len(samples) <= threshold:
+        return samples
+    if threshold < 3:
+        return [samples[0], samples[-1]][:max(threshold, 0)]
+
+    sampled = [samples[0]]
+    bucket_size = (len(samples) - 2) / (threshold - 2)
+    previous = samples[0]
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        # Average of the next bucket (or the last sample) as the third vertex
+        next_end = min(int((bucket + 2) * bucket_size) + 1, len(samples))
+        next_bucket = samples[end:next_end] or samples[-1:]
+        avg_x = sum(x for x, _ in next_bucket) / len(next_bucket)
+        avg_y = sum(y for _, y in next_bucket) / len(next_bucket)
+
+        best, best_area = samples[start], -1.0
+        for candidate in samples[start:end]:
+            area = abs(
+                (previous[0] - avg_x) * (candidate[1] - previous[1])
+                - (previous[0] - candidate[0]) * (avg_y - previous[1])
+            )
+            if area > best_area:
+                best, best_area = candidate, area
+        sampled.append(best)
+        previous = best
+
+    sampled.append(samples[-1])
+    return sampled
@@ -0,0 +1,217 @@
+"""Lightweight latency probes between full speedtests."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ipaddress
+import logging
+import socket
+import time
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_PROBE_CONNECT_P50,
+    ATTR_PROBE_CONNECT_P95,
+    ATTR_PROBE_CONNECT_P99,
+    ATTR_PROBE_DNS_P50,
+    ATTR_PROBE_DNS_P95,
+    ATTR_PROBE_DNS_P99,
+    ATTR_PROBE_LOSS,
+    ATTR_PROBE_OUTAGE,
+    DOMAIN,
+    PROBE_DEFAULT_PORT,
+    PROBE_TIMEOUT,
+    PROBE_WINDOW_SIZE,
+    SPEEDTEST_SERVER_PORT,
+)
+from .stats import RollingWindow
+from .timing import elapsed_ms
+
+if TYPE_CHECKING:
+    from . import SpeedtestCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_probe_targets(targets: str) -> list[tuple[str, int]]:
+    """Parse "host[:port]" targets separated by commas.
+
+    IPv6 addresses with a port are written as [address]:port. Ports
+    default to PROBE_DEFAULT_PORT. Raises ValueError on invalid input.
+    """
+    result = []
+    for target in targets.split(","):
+        target = target.strip()
+        if not target:
+            continue
+        host, port = target, PROBE_DEFAULT_PORT
+        if target.startswith("["):
+            host, _, rest = target[1:].partition("]")
+            if rest:
+                if not rest.startswith(":"):
+                    raise ValueError(f"Invalid probe target: {target}")
+                port = _parse_port(rest[1:], target)
+        elif target.count(":") == 1:
+            host, _, port_text = target.partition(":")
+            port = _parse_port(port_text, target)
+        if not host or " " in host:
+            raise ValueError(f"Invalid probe target: {target}")
+        result.append((host, port))
+    return result
+
+
+def _parse_port(port: str, target: str) -> int:
+    """Parse a TCP port of a probe target."""
+    if not port.isdigit() or not 0 < int(port) < 65536:
+        raise ValueError(f"Invalid port in probe target: {target}")
+    return int(port)
+
+
+def _is_ip_address(host: str) -> bool:
+    """Return true when host needs no DNS lookup."""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+class ProbeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Time DNS lookups and TCP connects to a few targets every interval.
+
+    Each round probes the last speedtest server and the configured targets
+    concurrently. Samples go into fixed-size windows, so percentiles and
+    loss cover the last PROBE_WINDOW_SIZE probes. A round where every
+    connect fails counts as an outage. Probing pauses while a speedtest
+    runs, and stops while no probe sensor is enabled.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        speedtest: SpeedtestCoordinator,
+        interval: int,
+        targets: list[tuple[str, int]],
+    ) -> None:
+        """Initialize the probe coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} probe",
+            update_interval=timedelta(seconds=interval),
+        )
+        self.entry = entry
+        self.speedtest = speedtest
+        self.targets = targets
+        self._connect = RollingWindow(PROBE_WINDOW_SIZE)
+        self._dns = RollingWindow(PROBE_WINDOW_SIZE)
+        self._outage_started: datetime | None = None
+        self._last_outage: dict[str, Any] | None = None
+        self._outages = 0
+
+    def _round_targets(self) -> list[tuple[str, int]]:
+        """Return this round's targets, led by the last speedtest server."""
+        targets = list(self.targets)
+        result = self.speedtest.data
+        if result is not None and result.server_host:
+            server = (result.server_host, SPEEDTEST_SERVER_PORT)
+            if server not in targets:
+                targets.insert(0, server)
+        return targets
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Run one probe round and return the updated statistics."""
+        targets = self._round_targets()
+        if targets and not self.speedtest.testing:
+            samples = await asyncio.gather(
+                *(self._async_probe(host, port) for host, port in targets)
+            )
+            for dns, connect in samples:
+                if dns is not False:
+                    self._dns.push(dns)
+                self._connect.push(connect)
+            self._track_outage(all(connect is None for _, connect in samples))
+        return self._stats()
+
+    async def _async_probe(
+        self, host: str, port: int
+    ) -> tuple[float | None | bool, float | None]:
+        """Return (DNS ms, connect ms) for one target; None when a step failed.
+
+        The DNS time is False when host is an address and was not looked up.
+        """
+        dns: float | None | bool = False
+        address = host
+        try:
+            async with asyncio.timeout(PROBE_TIMEOUT):
+                if not _is_ip_address(host):
+                    # Stays None when the lookup fails
+                    dns = None
+                    start = time.perf_counter()
+                    infos = await self.hass.loop.getaddrinfo(
+                        host, port, type=socket.SOCK_STREAM
+                    )
+                    dns = elapsed_ms(start)
+                    address = infos[0][4][0]
+
+                start = time.perf_counter()
+                _, writer = await asyncio.open_connection(address, port)
+                connect = elapsed_ms(start)
+        except (OSError, TimeoutError) as err:
+            _LOGGER.debug("Probe to %s:%s failed: %s", host, port, err)
+            return dns, None
+
+        writer.close()
+        # Bounded, so a peer that never answers the close does not stall a round
+        with contextlib.suppress(OSError, TimeoutError):
+            async with asyncio.timeout(PROBE_TIMEOUT):
+                await writer.wait_closed()
+        return dns, connect
+
+    def _track_outage(self, failed: bool) -> None:
+        """Start or end an outage after a probe round."""
+        now = dt_util.utcnow()
+        if failed and self._outage_started is None:
+            self._outage_started = now
+            self._outages += 1
+            _LOGGER.info("Latency probes report an outage; no target is reachable")
+        elif not failed and self._outage_started is not None:
+            self._last_outage = {
+                "start": self._outage_started.isoformat(),
+                "end": now.isoformat(),
+                "duration": round((now - self._outage_started).total_seconds()),
+            }
+            _LOGGER.info(
+                "Latency probes recovered after %s seconds", self._last_outage["duration"]
+            )
+            self._outage_started = None
+
+    def _stats(self) -> dict[str, Any]:
+        """Return the current probe statistics."""
+        loss = self._connect.missing_percent
+        return {
+            ATTR_PROBE_CONNECT_P50: self._connect.percentile(50),
+            ATTR_PROBE_CONNECT_P95: self._connect.percentile(95),
+            ATTR_PROBE_CONNECT_P99: self._connect.percentile(99),
+            ATTR_PROBE_DNS_P50: self._dns.percentile(50),
+            ATTR_PROBE_DNS_P95: self._dns.percentile(95),
+            ATTR_PROBE_DNS_P99: self._dns.percentile(99),
+            ATTR_PROBE_LOSS: None if loss is None else round(loss, 1),
+            ATTR_PROBE_OUTAGE: (
+                round((dt_util.utcnow() - self._outage_started).total_seconds())
+                if self._outage_started is not None
+                else 0
+            ),
+            "last_outage": self._last_outage,
+            "outages": self._outages,
+            "samples": len(self._connect),
+            "targets": [f"{host}:{port}" for host, port in self._round_targets()],
+        }
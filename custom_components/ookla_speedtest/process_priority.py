@@ -0,0 +1,142 @@
+"""Run the speedtest process at reduced CPU and IO priority."""
+
+from __future__ import annotations
+
+import logging
+import platform
+import sys
+
+_LOGGER = logging.getLogger(__name__)
+
+IONICE_NONE = "none"
+IONICE_BEST_EFFORT = "best_effort"
+IONICE_IDLE = "idle"
+IONICE_CLASSES = (IONICE_NONE, IONICE_BEST_EFFORT, IONICE_IDLE)
+
+# ioprio = class << 13 | level; best effort uses its lowest level (7)
+_IOPRIO_CLASS_SHIFT = 13
+_IOPRIO_VALUES = {
+    IONICE_BEST_EFFORT: 2 << _IOPRIO_CLASS_SHIFT | 7,
+    IONICE_IDLE: 3 << _IOPRIO_CLASS_SHIFT,
+}
+# ioprio_set has no libc wrapper, so it is called by syscall number
+_IOPRIO_SET_SYSCALLS = {
+    "x86_64": 251,
+    "amd64": 251,
+    "aarch64": 30,
+    "arm64": 30,
+    "armv7l": 314,
+    "armv7": 314,
+    "armv6l": 314,
+    "arm": 314,
+    "i386": 289,
+    "i486": 289,
+    "i586": 289,
+    "i686": 289,
+}
+
+
+def parse_cpu_list(cpus: str) -> set[int]:
+    """Parse a CPU list such as "2", "2,3" or "1-3" into CPU numbers.
+
+    Raises ValueError for anything else.
+    """
+    result: set[int] = set()
+    for part in cpus.replace(" ", "").split(","):
+        first, _, last = part.partition("-")
+        if not first.isdigit() or (last and not last.isdigit()):
+            raise ValueError(f"Invalid CPU list: {cpus}")
+        start = int(first)
+        end = int(last) if last else start
+        if end < start:
+            raise ValueError(f"Invalid CPU list: {cpus}")
+        result.update(range(start, end + 1))
+    return result
+
+
+def priority_command(
+    nice: int, ionice_class: str, cpus: set[int] | None
+) -> list[str]:
+    """Return a command prefix that runs a command at the given priority.
+
+    The prefix starts a small Python wrapper that lowers its own priority,
+    pins itself to cpus and then execs the command, so the settings are in
+    place before the CLI starts its worker threads, which inherit them. An
+    empty list is returned when there is nothing to apply. Settings that
+    fail are reported on stderr; see log_priority_warnings.
+    """
+    ioprio = _IOPRIO_VALUES.get(ionice_class, 0)
+    syscall = _IOPRIO_SET_SYSCALLS.get(platform.machine().lower())
+    if ioprio and syscall is None:
+        _LOGGER.warning(
+            "Could not set speedtest IO priority to %s: ioprio_set is not "
+            "supported on %s",
+            ionice_class,
+            platform.machine(),
+        )
+        ioprio = 0
+    if not nice and not ioprio and not cpus:
+        return []
+
+    return [
+        sys.executable,
+        "-I",
+        "-S",
+        "-c",
+        _WRAPPER,
+        _WARNING_PREFIX,
+        str(nice),
+        str(syscall or 0),
+        str(ioprio),
+        ",".join(str(cpu) for cpu in sorted(cpus or ())),
+    ]
+
+
+def log_priority_warnings(stderr: str) -> None:
+    """Log the settings the wrapper of priority_command could not apply."""
+    for line in stderr.splitlines():
+        if line.startswith(_WARNING_PREFIX):
+            _LOGGER.warning(line.removeprefix(_WARNING_PREFIX))
+
+
+# Marks the wrapper's warnings in the CLI's stderr
+_WARNING_PREFIX = "ookla_speedtest priority: "
+
+# Run by priority_command with argv: warning prefix, nice level, ioprio_set
+# syscall number, ioprio value, comma separated CPUs, then the command
+_WRAPPER = """\
+import os, sys
+
+prefix, nice, syscall, ioprio, cpus = sys.argv[1:6]
+
+if int(nice):
+    try:
+        os.setpriority(os.PRIO_PROCESS, 0, int(nice))
+    except OSError as err:
+        print(f"{prefix}Could not set speedtest nice level to {nice}: {err}", file=sys.stderr)
+
+if int(ioprio):
+    import ctypes
+
+    libc = ctypes.CDLL(None, use_errno=True)
+    # IOPRIO_WHO_PROCESS, this process
+    if libc.syscall(int(syscall), 1, 0, int(ioprio)) == -1:
+        err = os.strerror(ctypes.get_errno())
+        print(f"{prefix}Could not set speedtest IO priority: {err}", file=sys.stderr)
+
+if cpus:
+    try:
+        os.sched_setaffinity(0, {int(cpu) for cpu in cpus.split(",")})
+    except OSError as err:
+        available = sorted(os.sched_getaffinity(0))
+        print(
+            f"{prefix}Could not pin speedtest to CPUs {cpus} (available: {available}): {err}",
+            file=sys.stderr,
+        )
+
+try:
+    os.execvp(sys.argv[6], sys.argv[6:])
+except OSError as err:
+    print(f"Could not run {sys.argv[6]}: {err}", file=sys.stderr)
+    sys.exit(127)
+"""
@@ -0,0 +1,246 @@
+"""Typed snapshot of a processed speedtest run."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ATTR_BUFFERBLOAT_GRADE,
+    ATTR_DATE_LAST_TEST,
+    ATTR_DL_PCT,
+    ATTR_DOWNLOAD,
+    ATTR_DOWNLOAD_LATENCY_HIGH,
+    ATTR_DOWNLOAD_LATENCY_IQM,
+    ATTR_DOWNLOAD_LATENCY_JITTER,
+    ATTR_DOWNLOAD_LATENCY_LOW,
+    ATTR_ISP,
+    ATTR_JITTER,
+    ATTR_PING,
+    ATTR_PING_HIGH,
+    ATTR_PING_LOW,
+    ATTR_RESULT_URL,
+    ATTR_RESULT_VALIDITY,
+    ATTR_SERVER,
+    ATTR_SERVER_ID,
+    ATTR_UL_PCT,
+    ATTR_UPLOAD,
+    ATTR_UPLOAD_LATENCY_HIGH,
+    ATTR_UPLOAD_LATENCY_IQM,
+    ATTR_UPLOAD_LATENCY_JITTER,
+    ATTR_UPLOAD_LATENCY_LOW,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SpeedtestResult:
+    """One speedtest run: the raw CLI fields and the values derived from them.
+
+    Latencies are in ms, speeds in Mbps, bandwidth in bytes/s, elapsed in
+    ms. Raw fields are None for results restored from older versions.
+    CPU fields are filled in by the coordinator when it could sample the
+    host during the run; see CpuMonitor.
+    """
+
+    timestamp: datetime
+    isp: str | None
+    # server { id, host, port, name, location, country, ip }
+    server: str | None
+    server_id: str | None
+    server_host: str | None
+    server_name: str | None
+    server_location: str | None
+    server_country: str | None
+    # ping { jitter, latency, low, high }
+    ping: float | None
+    jitter: float | None
+    ping_low: float | None
+    ping_high: float | None
+    packet_loss: float | None
+    # download { bandwidth, bytes, elapsed, latency { iqm, low, high, jitter }}
+    download: float | None
+    download_bandwidth: int | None
+    download_bytes: int | None
+    download_elapsed: int | None
+    download_latency_iqm: float | None
+    download_latency_low: float | None
+    download_latency_high: float | None
+    download_latency_jitter: float | None
+    # upload { bandwidth, bytes, elapsed, latency { iqm, low, high, jitter }}
+    upload: float | None
+    upload_bandwidth: int | None
+    upload_bytes: int | None
+    upload_elapsed: int | None
+    upload_latency_iqm: float | None
+    upload_latency_low: float | None
+    upload_latency_high: float | None
+    upload_latency_jitter: float | None
+    # interface { internalIp, name, macAddr, isVpn, externalIp }
+    interface_name: str | None
+    internal_ip: str | None
+    external_ip: str | None
+    is_vpn: bool | None
+    # result { id, url, persisted }
+    result_id: str | None
+    result_url: str | None
+    # Derived
+    download_percent: float | None
+    upload_percent: float | None
+    bufferbloat_grade: str | None
+    # Host and process CPU use during the run, in percent
+    cpu_host_avg: float | None = None
+    cpu_host_peak: float | None = None
+    cpu_core_peak: float | None = None
+    cpu_process_avg: float | None = None
+    cpu_process_peak: float | None = None
+    result_validity: str | None = None
+
+    @classmethod
+    def from_cli(
+        cls,
+        result: dict[str, Any],
+        isp_dl_speed: float | None = None,
+        isp_ul_speed: float | None = None,
+    ) -> SpeedtestResult:
+        """Build a result from the CLI's JSON result payload."""
+        ping = result["ping"]
+        download = result["download"]
+        upload = result["upload"]
+        download_latency = download.get("latency") or {}
+        upload_latency = upload.get("latency") or {}
+        server = result["server"]
+        interface = result.get("interface") or {}
+        result_link = result.get("result") or {}
+
+        download_mbps = round(download["bandwidth"] * 8 / 1000000, 2)
+        upload_mbps = round(upload["bandwidth"] * 8 / 1000000, 2)
+        ping_idle = round(ping["latency"], 2)
+        download_iqm = round(download_latency.get("iqm", 0), 2)
+        upload_iqm = round(upload_latency.get("iqm", 0), 2)
+
+        return cls(
+            timestamp=dt_util.now(),
+            isp=result["isp"],
+            # produces: Boost Mobile (Chicago, IL, United States)
+            server=f"{server['name']} ({server['location']}, {server['country']})",
+            server_id=str(server.get("id", "")),
+            server_host=server.get("host"),
+            server_name=server["name"],
+            server_location=server["location"],
+            server_country=server["country"],
+            ping=ping_idle,
+            jitter=round(ping["jitter"], 2),
+            ping_low=round(ping.get("low", 0), 2),
+            ping_high=round(ping.get("high", 0), 2),
+            packet_loss=result.get("packetLoss"),
+            download=download_mbps,
+            download_bandwidth=download["bandwidth"],
+            download_bytes=download.get("bytes"),
+            download_elapsed=download.get("elapsed"),
+            download_latency_iqm=download_iqm,
+            download_latency_low=round(download_latency.get("low", 0), 2),
+            download_latency_high=round(download_latency.get("high", 0), 2),
+            download_latency_jitter=round(download_latency.get("jitter", 0), 2),
+            upload=upload_mbps,
+            upload_bandwidth=upload["bandwidth"],
+            upload_bytes=upload.get("bytes"),
+            upload_elapsed=upload.get("elapsed"),
+            upload_latency_iqm=upload_iqm,
+            upload_latency_low=round(upload_latency.get("low", 0), 2),
+            upload_latency_high=round(upload_latency.get("high", 0), 2),
+            upload_latency_jitter=round(upload_latency.get("jitter", 0), 2),
+            interface_name=interface.get("name"),
+            internal_ip=interface.get("internalIp"),
+            external_ip=interface.get("externalIp"),
+            is_vpn=interface.get("isVpn"),
+            result_id=result_link.get("id"),
+            result_url=result_link.get("url", ""),
+            download_percent=(
+                round((download_mbps / isp_dl_speed) * 100, 1)
+                if isp_dl_speed and download_mbps > 0
+                else None
+            ),
+            upload_percent=(
+                round((upload_mbps / isp_ul_speed) * 100, 1)
+                if isp_ul_speed and upload_mbps > 0
+                else None
+            ),
+            bufferbloat_grade=bufferbloat_grade(ping_idle, download_iqm, upload_iqm),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpeedtestResult:
+        """Rebuild a result saved with as_dict.
+
+        Results saved by older versions were dicts keyed by sensor
+        attribute; their raw CLI fields are left empty.
+        """
+        if "timestamp" not in data:
+            data = {field: data.get(key) for key, field in FIELD_BY_ATTR.items()}
+
+        values = {name: data.get(name) for name in FIELD_NAMES}
+        if isinstance(values["timestamp"], str):
+            values["timestamp"] = dt_util.parse_datetime(values["timestamp"])
+        return cls(**values)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the fields as a dict for storage and diagnostics."""
+        return {name: getattr(self, name) for name in FIELD_NAMES}
+
+    def get(self, key: str) -> Any:
+        """Return the value behind a sensor attribute key."""
+        return getattr(self, FIELD_BY_ATTR[key])
+
+
+FIELD_NAMES = tuple(field.name for field in fields(SpeedtestResult))
+
+# Sensor attribute keys (also used in unique ids and history) to fields
+FIELD_BY_ATTR = {
+    ATTR_DATE_LAST_TEST: "timestamp",
+    ATTR_ISP: "isp",
+    ATTR_SERVER: "server",
+    ATTR_SERVER_ID: "server_id",
+    ATTR_PING: "ping",
+    ATTR_JITTER: "jitter",
+    ATTR_PING_LOW: "ping_low",
+    ATTR_PING_HIGH: "ping_high",
+    ATTR_DOWNLOAD: "download",
+    ATTR_DOWNLOAD_LATENCY_IQM: "download_latency_iqm",
+    ATTR_DOWNLOAD_LATENCY_LOW: "download_latency_low",
+    ATTR_DOWNLOAD_LATENCY_HIGH: "download_latency_high",
+    ATTR_DOWNLOAD_LATENCY_JITTER: "download_latency_jitter",
+    ATTR_UPLOAD: "upload",
+    ATTR_UPLOAD_LATENCY_IQM: "upload_latency_iqm",
+    ATTR_UPLOAD_LATENCY_LOW: "upload_latency_low",
+    ATTR_UPLOAD_LATENCY_HIGH: "upload_latency_high",
+    ATTR_UPLOAD_LATENCY_JITTER: "upload_latency_jitter",
+    ATTR_DL_PCT: "download_percent",
+    ATTR_UL_PCT: "upload_percent",
+    ATTR_BUFFERBLOAT_GRADE: "bufferbloat_grade",
+    ATTR_RESULT_URL: "result_url",
+    ATTR_RESULT_VALIDITY: "result_validity",
+}
+
+
+def bufferbloat_grade(ping_idle: float, ping_dl: float, ping_ul: float) -> str | None:
+    """Grade the increase in latency under load."""
+    # Handle potential 0/None values if test failed partially
+    if not ping_dl or not ping_ul:
+        return None
+
+    max_loaded = max(ping_dl, ping_ul)
+    # Ensure we don't get negative delta due to variance
+    delta = max(0, max_loaded - ping_idle)
+
+    if delta <= 30:
+        return "A"
+    if delta <= 60:
+        return "B"
+    if delta <= 120:
+        return "C"
+    if delta <= 300:
+        return "D"
+    return "F"
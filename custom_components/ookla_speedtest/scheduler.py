@@ -0,0 +1,147 @@
+"""Domain-wide run queue so only one speedtest uses the link at a time."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_SCHEDULER, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> SpeedtestScheduler:
+    """Return the shared scheduler, creating it on first use."""
+    scheduler = hass.data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DATA_SCHEDULER] = SpeedtestScheduler(hass)
+    return scheduler
+
+
+class _QueuedRun:
+    """A pending or running speedtest for one config entry."""
+
+    __slots__ = ("entry_id", "job", "priority", "future", "task")
+
+    def __init__(
+        self,
+        entry_id: str,
+        job: Callable[[], Awaitable[Any]],
+        priority: int,
+        future: asyncio.Future[Any],
+    ) -> None:
+        """Initialize the queued run."""
+        self.entry_id = entry_id
+        self.job = job
+        self.priority = priority
+        self.future = future
+        self.task: asyncio.Task[Any] | None = None
+
+
+class SpeedtestScheduler:
+    """Serialise speedtest runs from every config entry through one queue.
+
+    Requests for an entry that is already queued or running share that run.
+    Lower priority values run first; a duplicate request with a more urgent
+    priority promotes the queued run.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._heap: list[tuple[int, int, str]] = []
+        self._pending: dict[str, _QueuedRun] = {}
+        self._running: _QueuedRun | None = None
+        self._sequence = itertools.count()
+        self._worker: asyncio.Task[None] | None = None
+
+    async def async_run(
+        self,
+        entry_id: str,
+        job: Callable[[], Awaitable[Any]],
+        priority: int,
+    ) -> Any:
+        """Queue a run for an entry and wait for its result."""
+        if self._running is not None and self._running.entry_id == entry_id:
+            _LOGGER.debug("Speedtest for %s already running; sharing result", entry_id)
+            return await asyncio.shield(self._running.future)
+
+        run = self._pending.get(entry_id)
+        if run is None:
+            run = _QueuedRun(entry_id, job, priority, self.hass.loop.create_future())
+            self._pending[entry_id] = run
+            heapq.heappush(self._heap, (priority, next(self._sequence), entry_id))
+        elif priority < run.priority:
+            # Superseded heap entries are skipped by the worker
+            run.priority = priority
+            heapq.heappush(self._heap, (priority, next(self._sequence), entry_id))
+
+        if self._worker is None or self._worker.done():
+            self._worker = self.hass.async_create_background_task(
+                self._async_process_queue(), name=f"{DOMAIN} run queue"
+            )
+        return await asyncio.shield(run.future)
+
+    @callback
+    def async_cancel(self, entry_id: str) -> None:
+        """Drop the queued or running run of an entry that is being unloaded."""
+        if (run := self._pending.pop(entry_id, None)) is not None:
+            run.future.cancel()
+        running = self._running
+        if running is not None and running.entry_id == entry_id and running.task:
+            # The worker resolves its future and moves on to the next run
+            running.task.cancel()
+
+    async def _async_process_queue(self) -> None:
+        """Run queued speedtests one at a time.
+
+        Each run is its own task so it can be cancelled without stopping
+        the queue. If the worker itself is cancelled, every run it still
+        owns is cancelled so no caller waits forever.
+        """
+        try:
+            while self._heap:
+                priority, _, entry_id = heapq.heappop(self._heap)
+                run = self._pending.get(entry_id)
+                if run is None or run.priority != priority:
+                    continue
+
+                del self._pending[entry_id]
+                self._running = run
+                run.task = self.hass.async_create_task(
+                    run.job(), name=f"{DOMAIN} run {entry_id}"
+                )
+                # Waits without raising, whatever the task ends with
+                await asyncio.wait((run.task,))
+                self._running = None
+                _resolve(run)
+        finally:
+            running, self._running = self._running, None
+            if running is not None:
+                if running.task is not None:
+                    running.task.cancel()
+                running.future.cancel()
+            for run in self._pending.values():
+                run.future.cancel()
+            self._pending.clear()
+            self._heap.clear()
+
+
+def _resolve(run: _QueuedRun) -> None:
+    """Pass a finished run's outcome to the callers waiting for it."""
+    if run.future.done():
+        return
+    task = run.task
+    if task.cancelled():
+        run.future.cancel()
+    elif (err := task.exception()) is not None:
+        run.future.set_exception(err)
+    else:
+        run.future.set_result(task.result())
@@ -11,9 +11,17 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, Platform, UnitOfDataRate, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    PERCENTAGE,
+    EntityCategory,
+    Platform,
+    UnitOfDataRate,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity_registry import RegistryEntryDisabler, async_get
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -21,6 +29,9 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from . import SpeedtestCoordinator
 from .const import (
     ATTR_BUFFERBLOAT_GRADE,
+    ATTR_DATA_USED_DAY,
+    ATTR_DATA_USED_MONTH,
+    ATTR_DATA_USED_TOTAL,
     ATTR_DATE_LAST_TEST,
     ATTR_DL_PCT,
     ATTR_DOWNLOAD,
@@ -30,11 +41,26 @@ from .const import (
     ATTR_DOWNLOAD_LATENCY_LOW,
     ATTR_ISP,
     ATTR_JITTER,
+    ATTR_LIVE_BANDWIDTH,
+    ATTR_NEXT_TEST,
     ATTR_PING,
     ATTR_PING_HIGH,
     ATTR_PING_LOW,
+    ATTR_PROBE_CONNECT_P50,
+    ATTR_PROBE_CONNECT_P95,
+    ATTR_PROBE_CONNECT_P99,
+    ATTR_PROBE_DNS_P50,
+    ATTR_PROBE_DNS_P95,
+    ATTR_PROBE_DNS_P99,
+    ATTR_PROBE_LOSS,
+    ATTR_PROBE_OUTAGE,
     ATTR_RESULT_URL,
+    ATTR_RESULT_VALIDITY,
+    ATTR_SCHEDULE_REASON,
     ATTR_SERVER,
+    ATTR_TEST_PHASE,
+    ATTR_TEST_PROGRESS,
+    ATTR_TESTING,
     ATTR_UL_PCT,
     ATTR_UPLOAD,
     ATTR_UPLOAD_LATENCY_HIGH,
@@ -43,10 +69,20 @@ from .const import (
     ATTR_UPLOAD_LATENCY_LOW,
     CONF_ENABLE_COMPLIANCE_SENSORS,
     CONF_ENABLE_LATENCY_SENSORS,
+    CONF_LIVE_PROGRESS,
     DEFAULT_ENABLE_COMPLIANCE,
     DEFAULT_ENABLE_LATENCY,
+    DEFAULT_LIVE_PROGRESS,
     DOMAIN,
+    SIGNAL_RUN_TIMING,
 )
+from .adaptive import REASON_FIXED
+from .cpu_monitor import VALIDITY_OPTIONS
+from .result import FIELD_BY_ATTR, bufferbloat_grade
+from .sketch import TREND_GROUPS, TREND_PERCENTILES, TREND_WINDOWS
+from .stats import ROLLING_FIELDS, ROLLING_STATS
+from .timing import TIMING_FIELDS
+from .usage import PERIOD_DAY, PERIOD_MONTH, PERIOD_TOTAL
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,6 +104,10 @@ async def async_setup_entry(
         CONF_ENABLE_COMPLIANCE_SENSORS,
         entry.data.get(CONF_ENABLE_COMPLIANCE_SENSORS, DEFAULT_ENABLE_COMPLIANCE),
     )
+    live_progress = entry.options.get(
+        CONF_LIVE_PROGRESS,
+        entry.data.get(CONF_LIVE_PROGRESS, DEFAULT_LIVE_PROGRESS),
+    )
 
     sensors = [
         OoklaSpeedtestSensor(
@@ -233,7 +273,206 @@ async def async_setup_entry(
             None,
             "mdi:clock",
         ),
+        OoklaSpeedtestSensor(
+            coordinator,
+            entry,
+            ATTR_RESULT_VALIDITY,
+            "Result Validity",
+            None,
+            "mdi:check-decagram",
+        ),
+    ]
+
+    if live_progress:
+        sensors.extend(
+            [
+                OoklaSpeedtestProgressSensor(
+                    coordinator,
+                    entry,
+                    ATTR_TEST_PHASE,
+                    "Test Phase",
+                    None,
+                    "mdi:progress-clock",
+                ),
+                OoklaSpeedtestProgressSensor(
+                    coordinator,
+                    entry,
+                    ATTR_TEST_PROGRESS,
+                    "Test Progress",
+                    PERCENTAGE,
+                    "mdi:progress-helper",
+                ),
+                OoklaSpeedtestProgressSensor(
+                    coordinator,
+                    entry,
+                    ATTR_LIVE_BANDWIDTH,
+                    "Live Bandwidth",
+                    UnitOfDataRate.MEGABITS_PER_SECOND,
+                    "mdi:speedometer",
+                ),
+            ]
+        )
+
+    if coordinator.probe is not None:
+        probe = coordinator.probe
+        sensors.extend(
+            [
+                OoklaSpeedtestProbeSensor(
+                    probe,
+                    entry,
+                    ATTR_PROBE_CONNECT_P50,
+                    "Probe Latency P50",
+                    UnitOfTime.MILLISECONDS,
+                    "mdi:lan-connect",
+                ),
+                OoklaSpeedtestProbeSensor(
+                    probe,
+                    entry,
+                    ATTR_PROBE_CONNECT_P95,
+                    "Probe Latency P95",
+                    UnitOfTime.MILLISECONDS,
+                    "mdi:lan-connect",
+                ),
+                OoklaSpeedtestProbeSensor(
+                    probe,
+                    entry,
+                    ATTR_PROBE_CONNECT_P99,
+                    "Probe Latency P99",
+                    UnitOfTime.MILLISECONDS,
+                    "mdi:lan-connect",
+                ),
+                OoklaSpeedtestProbeSensor(
+                    probe,
+                    entry,
+                    ATTR_PROBE_DNS_P50,
+                    "Probe DNS P50",
+                    UnitOfTime.MILLISECONDS,
+                    "mdi:dns",
+                ),
+                OoklaSpeedtestProbeSensor(
+                    probe,
+                    entry,
+                    ATTR_PROBE_DNS_P95,
+                    "Probe DNS P95",
+                    UnitOfTime.MILLISECONDS,
+                    "mdi:dns",
+                ),
+                OoklaSpeedtestProbeSensor(
+                    probe,
+                    entry,
+                    ATTR_PROBE_DNS_P99,
+                    "Probe DNS P99",
+                    UnitOfTime.MILLISECONDS,
+                    "mdi:dns",
+                ),
+                OoklaSpeedtestProbeSensor(
+                    probe,
+                    entry,
+                    ATTR_PROBE_LOSS,
+                    "Probe Loss",
+                    PERCENTAGE,
+                    "mdi:lan-disconnect",
+                ),
+                OoklaSpeedtestProbeSensor(
+                    probe,
+                    entry,
+                    ATTR_PROBE_OUTAGE,
+                    "Outage Duration",
+                    UnitOfTime.SECONDS,
+                    "mdi:timer-alert-outline",
+                ),
+            ]
+        )
+
+    sensors.extend(
+        [
+            OoklaSpeedtestDataUsageSensor(
+                coordinator,
+                entry,
+                ATTR_DATA_USED_DAY,
+                "Data Used Today",
+                PERIOD_DAY,
+            ),
+            OoklaSpeedtestDataUsageSensor(
+                coordinator,
+                entry,
+                ATTR_DATA_USED_MONTH,
+                "Data Used This Month",
+                PERIOD_MONTH,
+            ),
+            OoklaSpeedtestDataUsageSensor(
+                coordinator,
+                entry,
+                ATTR_DATA_USED_TOTAL,
+                "Data Used Total",
+                PERIOD_TOTAL,
+            ),
+        ]
+    )
+
+    trend_names = {
+        "ping": "Ping",
+        "download_latency_iqm": "Download Latency",
+        "upload_latency_iqm": "Upload Latency",
+    }
+    trend_sensors = [
+        OoklaSpeedtestTrendSensor(
+            coordinator,
+            entry,
+            field,
+            trend_names[field],
+            days,
+            percent,
+            enabled_latency,
+        )
+        for field in TREND_GROUPS
+        for days in TREND_WINDOWS
+        for percent in TREND_PERCENTILES
     ]
+    sensors.extend(trend_sensors)
+
+    rolling_fields = {
+        "download": ("Download", UnitOfDataRate.MEGABITS_PER_SECOND, "mdi:download"),
+        "upload": ("Upload", UnitOfDataRate.MEGABITS_PER_SECOND, "mdi:upload"),
+        "ping": ("Ping", UnitOfTime.MILLISECONDS, "mdi:speedometer"),
+        "jitter": ("Jitter", UnitOfTime.MILLISECONDS, "mdi:pulse"),
+    }
+    rolling_names = {
+        "mean": "Mean",
+        "min": "Min",
+        "max": "Max",
+        "stdev": "Std Dev",
+        "ewma": "EWMA",
+    }
+    sensors.extend(
+        OoklaSpeedtestRollingSensor(
+            coordinator,
+            entry,
+            field,
+            stat,
+            f"{rolling_fields[field][0]} Rolling {rolling_names[stat]}",
+            rolling_fields[field][1],
+            rolling_fields[field][2],
+        )
+        for field in ROLLING_FIELDS
+        for stat in ROLLING_STATS
+    )
+
+    timing_names = {
+        "queue_wait": "Queue Wait Time",
+        "spawn": "Spawn Time",
+        "cli_run": "CLI Run Time",
+        "download_elapsed": "Download Duration",
+        "upload_elapsed": "Upload Duration",
+        "parse": "Parse Time",
+        "state_write": "State Write Time",
+        "loop_lag_max": "Event Loop Lag (Max)",
+        "loop_lag_avg": "Event Loop Lag (Avg)",
+    }
+    sensors.extend(
+        OoklaSpeedtestTimingSensor(coordinator, entry, field, timing_names[field])
+        for field in TIMING_FIELDS
+    )
 
     # Manage entity registry state based on configuration options
     ent_reg = async_get(hass)
@@ -241,7 +480,8 @@ async def async_setup_entry(
     latency_keys = {
         ATTR_PING_LOW, ATTR_PING_HIGH,
         ATTR_DOWNLOAD_LATENCY_IQM, ATTR_DOWNLOAD_LATENCY_LOW, ATTR_DOWNLOAD_LATENCY_HIGH,
-        ATTR_UPLOAD_LATENCY_IQM, ATTR_UPLOAD_LATENCY_LOW, ATTR_UPLOAD_LATENCY_HIGH
+        ATTR_UPLOAD_LATENCY_IQM, ATTR_UPLOAD_LATENCY_LOW, ATTR_UPLOAD_LATENCY_HIGH,
+        *(sensor._key for sensor in trend_sensors),
     }
     compliance_keys = {
         ATTR_DL_PCT, ATTR_UL_PCT,
@@ -253,7 +493,9 @@ async def async_setup_entry(
         unique_id = f"{entry.entry_id}_{sensor._key}"
         entity_id = ent_reg.async_get_entity_id(Platform.SENSOR, DOMAIN, unique_id)
         
-        if not entity_id:
+        if not entity_id or isinstance(
+            sensor, (OoklaSpeedtestTimingSensor, OoklaSpeedtestRollingSensor)
+        ):
             continue
             
         registry_entry = ent_reg.async_get(entity_id)
@@ -300,6 +542,7 @@ class OoklaSpeedtestSensor(CoordinatorEntity[SpeedtestCoordinator], SensorEntity
         super().__init__(coordinator)
         self._entry = entry
         self._key = key
+        self._field = FIELD_BY_ATTR.get(key)
         self._attr_name = name
         self._attr_unique_id = f"{entry.entry_id}_{key}"
         self._attr_native_unit_of_measurement = unit
@@ -320,6 +563,13 @@ class OoklaSpeedtestSensor(CoordinatorEntity[SpeedtestCoordinator], SensorEntity
         if key == ATTR_DATE_LAST_TEST:
             self._attr_device_class = SensorDeviceClass.TIMESTAMP
 
+        if key == ATTR_RESULT_VALIDITY:
+            self._attr_device_class = SensorDeviceClass.ENUM
+            self._attr_options = VALIDITY_OPTIONS
+            self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+        self._last_written: tuple[Any, ...] | None = None
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this sensor."""
@@ -334,6 +584,303 @@ class OoklaSpeedtestSensor(CoordinatorEntity[SpeedtestCoordinator], SensorEntity
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
+        if self.coordinator.data is None:
+            return None
+        return getattr(self.coordinator.data, self._field)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag a stale result, show the schedule and explain the result validity."""
+        if self._key == ATTR_DATE_LAST_TEST:
+            coordinator = self.coordinator
+            return {
+                ATTR_TESTING: coordinator.testing,
+                ATTR_NEXT_TEST: (
+                    coordinator.next_run.isoformat() if coordinator.next_run else None
+                ),
+                ATTR_SCHEDULE_REASON: (
+                    coordinator.adaptive.reason if coordinator.adaptive else REASON_FIXED
+                ),
+            }
+        if self._key == ATTR_BUFFERBLOAT_GRADE:
+            # Graded from 7 day medians, so one bad run does not flip it
+            trends = self.coordinator.latency_trends
+            return {
+                "grade_7d": bufferbloat_grade(
+                    trends.percentile(7, "ping", 50),
+                    trends.percentile(7, "download_latency_iqm", 50),
+                    trends.percentile(7, "upload_latency_iqm", 50),
+                )
+            }
+        if self._key == ATTR_RESULT_VALIDITY and (data := self.coordinator.data):
+            return {
+                "host_cpu_avg": data.cpu_host_avg,
+                "host_cpu_peak": data.cpu_host_peak,
+                "busiest_core_peak": data.cpu_core_peak,
+                "speedtest_cpu_avg": data.cpu_process_avg,
+                "speedtest_cpu_peak": data.cpu_process_peak,
+            }
+        return None
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the state written when the entity is added."""
+        await super().async_added_to_hass()
+        self._last_written = self._state_snapshot()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when something the state machine sees changed.
+
+        Coordinator updates fan out to every sensor, but most values (and
+        string sensors such as ISP or Server) rarely change between runs.
+        """
+        snapshot = self._state_snapshot()
+        if snapshot == self._last_written:
+            return
+        self._last_written = snapshot
+        self.async_write_ha_state()
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return the values that make up the written state."""
+        return (self.available, self.native_value, self.extra_state_attributes)
+
+
+class OoklaSpeedtestProgressSensor(OoklaSpeedtestSensor):
+    """Sensor reporting live progress while a speedtest is running."""
+
+    @property
+    def native_value(self) -> Any:
+        """Return the live progress value."""
+        return self.coordinator.progress.get(self._key)
+
+
+class OoklaSpeedtestTimingSensor(OoklaSpeedtestSensor):
+    """Diagnostic sensor reporting a timing of the last run.
+
+    Updated once the run's state writes are timed rather than with the
+    coordinator, so the State Write Time belongs to the same run.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 0
+
+    def __init__(
+        self,
+        coordinator: SpeedtestCoordinator,
+        entry: ConfigEntry,
+        field: str,
+        name: str,
+    ) -> None:
+        """Initialize the timing sensor."""
+        super().__init__(
+            coordinator,
+            entry,
+            f"timing_{field}",
+            name,
+            UnitOfTime.MILLISECONDS,
+            "mdi:timer-outline",
+            enabled_default=False,
+        )
+        self._timing_field = field
+
+    @property
+    def native_value(self) -> Any:
+        """Return the timing of the last run."""
+        if (timing := self.coordinator.last_timing) is None:
+            return None
+        return getattr(timing, self._timing_field)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return when the timed run started and whether it succeeded."""
+        if (timing := self.coordinator.last_timing) is None:
+            return None
+        return {"run_started": timing.started.isoformat(), "success": timing.success}
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to completed run timings."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_RUN_TIMING.format(self._entry.entry_id),
+                self._handle_run_timing,
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Ignore coordinator updates; timings arrive by dispatcher."""
+
+    @callback
+    def _handle_run_timing(self) -> None:
+        """Write the timing of the run that just finished."""
+        super()._handle_coordinator_update()
+
+
+class OoklaSpeedtestProbeSensor(OoklaSpeedtestSensor):
+    """Sensor reporting a latency probe statistic."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> Any:
+        """Return the probe statistic."""
         if self.coordinator.data is None:
             return None
         return self.coordinator.data.get(self._key)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Describe the probe window behind the statistic."""
+        data = self.coordinator.data
+        if data is None:
+            return None
+        if self._key == ATTR_PROBE_OUTAGE:
+            return {"last_outage": data["last_outage"], "outages": data["outages"]}
+        return {"samples": data["samples"], "targets": data["targets"]}
+
+
+class OoklaSpeedtestTrendSensor(OoklaSpeedtestSensor):
+    """Sensor reporting a rolling latency percentile over recent days.
+
+    The state is the percentile of the main latency (idle ping or loaded
+    IQM); the same percentile of its low, high and jitter values are
+    attributes.
+    """
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: SpeedtestCoordinator,
+        entry: ConfigEntry,
+        field: str,
+        name: str,
+        days: int,
+        percent: int,
+        enabled_default: bool,
+    ) -> None:
+        """Initialize the trend sensor."""
+        super().__init__(
+            coordinator,
+            entry,
+            f"latency_trend_{field}_{days}d_p{percent}",
+            f"{name} P{percent} ({days}d)",
+            UnitOfTime.MILLISECONDS,
+            "mdi:chart-bell-curve-cumulative",
+            enabled_default=enabled_default,
+        )
+        self._trend_field = field
+        self._days = days
+        self._percent = percent
+
+    @property
+    def native_value(self) -> Any:
+        """Return the percentile of the main latency."""
+        return self.coordinator.latency_trends.percentile(
+            self._days, self._trend_field, self._percent
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the same percentile of the related latency fields."""
+        trends = self.coordinator.latency_trends
+        return {
+            field: trends.percentile(self._days, field, self._percent)
+            for field in TREND_GROUPS[self._trend_field]
+        }
+
+
+class OoklaSpeedtestRollingSensor(OoklaSpeedtestSensor):
+    """Sensor reporting a rolling statistic over the most recent results.
+
+    Disabled by default and left to the user, unlike the option-driven
+    extended sensors.
+    """
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: SpeedtestCoordinator,
+        entry: ConfigEntry,
+        field: str,
+        stat: str,
+        name: str,
+        unit: str,
+        icon: str,
+    ) -> None:
+        """Initialize the rolling statistic sensor."""
+        super().__init__(
+            coordinator,
+            entry,
+            f"{field}_rolling_{stat}",
+            name,
+            unit,
+            icon,
+            enabled_default=False,
+        )
+        self._rolling_field = field
+        self._stat = stat
+
+    @property
+    def native_value(self) -> Any:
+        """Return the statistic."""
+        return self.coordinator.rolling_stats.get(self._rolling_field, self._stat)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the number of results behind the statistic."""
+        return {"samples": self.coordinator.rolling_stats.samples(self._rolling_field)}
+
+
+class OoklaSpeedtestDataUsageSensor(OoklaSpeedtestSensor):
+    """Sensor reporting the data used by speedtests in a period.
+
+    The day and month counters restart at zero with each calendar period,
+    which the total_increasing state class records as a meter reset.
+    """
+
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_suggested_unit_of_measurement = UnitOfInformation.MEGABYTES
+
+    def __init__(
+        self,
+        coordinator: SpeedtestCoordinator,
+        entry: ConfigEntry,
+        key: str,
+        name: str,
+        period: str,
+    ) -> None:
+        """Initialize the data usage sensor."""
+        super().__init__(
+            coordinator,
+            entry,
+            key,
+            name,
+            UnitOfInformation.BYTES,
+            "mdi:database-arrow-down",
+        )
+        self._period = period
+
+    @property
+    def native_value(self) -> Any:
+        """Return the bytes used in the current period."""
+        return self.coordinator.data_usage.get(self._period)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the monthly budget and what is left of it."""
+        budget = self.coordinator.monthly_data_budget
+        if self._period != PERIOD_MONTH or not budget:
+            return None
+        used = self.coordinator.data_usage.get(PERIOD_MONTH) / 1_000_000
+        return {
+            "budget": budget,
+            "remaining": round(max(budget - used, 0), 1),
+            "budget_reached": self.coordinator.budget_exhausted,
+        }
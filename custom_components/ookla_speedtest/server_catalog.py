@@ -0,0 +1,243 @@
+"""Cached, searchable catalogue of Speedtest servers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from bisect import bisect_left
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DATA_SERVER_CATALOG,
+    DOMAIN,
+    SERVER_CATALOG_MAX_MISSED,
+    SERVER_CATALOG_TTL,
+    SERVER_LIST_TIMEOUT,
+)
+from .binary_manager import speedtest_bin_path
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.servers"
+
+
+def async_get_server_catalog(hass: HomeAssistant) -> ServerCatalog:
+    """Return the shared server catalogue, creating it on first use."""
+    catalog = hass.data.get(DATA_SERVER_CATALOG)
+    if catalog is None:
+        catalog = hass.data[DATA_SERVER_CATALOG] = ServerCatalog(hass)
+    return catalog
+
+
+class ServerCatalog:
+    """Server list persisted in storage with stale-while-revalidate reads.
+
+    Servers are indexed by id and by the words of their name and city so
+    the config and options flows can search every known server. The CLI
+    only lists servers near the host, so servers from earlier fetches are
+    kept until SERVER_CATALOG_MAX_MISSED fetches in a row left them out.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the catalogue."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._loaded = False
+        self._fetched_at: float | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._by_id: dict[str, dict[str, Any]] = {}
+        self._by_distance: list[dict[str, Any]] = []
+        self._words: list[str] = []
+        self._word_ids: dict[str, set[str]] = {}
+        # Consecutive fetches that did not list a known server, by id
+        self._missed: dict[str, int] = {}
+
+    @property
+    def is_stale(self) -> bool:
+        """Return true when the catalogue is older than its TTL."""
+        return (
+            self._fetched_at is None
+            or time.time() - self._fetched_at > SERVER_CATALOG_TTL
+        )
+
+    async def async_get_closest(self, limit: int = 10) -> list[dict[str, Any]]:
+        """Return the closest servers, refreshing in the background if stale.
+
+        Only an empty catalogue waits for the CLI; otherwise the cached list
+        is returned immediately.
+        """
+        await self._async_load()
+        if not self._by_id:
+            await self.async_refresh()
+        elif self.is_stale:
+            self._async_schedule_refresh()
+        return self._by_distance[:limit]
+
+    def search(self, query: str, limit: int = 25) -> list[dict[str, Any]]:
+        """Return servers matching every word of the query, closest first.
+
+        Words are prefix-matched against server names and cities; a numeric
+        word also matches the server id exactly.
+        """
+        matches: set[str] | None = None
+        for token in query.lower().split():
+            token_ids = set(self._word_ids_with_prefix(token))
+            if token in self._by_id:
+                token_ids.add(token)
+            matches = token_ids if matches is None else matches & token_ids
+            if not matches:
+                return []
+
+        if matches is None:
+            return self._by_distance[:limit]
+        return sorted(
+            (self._by_id[server_id] for server_id in matches),
+            key=lambda server: server["distance"],
+        )[:limit]
+
+    def get(self, server_id: str) -> dict[str, Any] | None:
+        """Return a server by id."""
+        return self._by_id.get(server_id)
+
+    async def async_refresh(self) -> None:
+        """Fetch the server list from the CLI and persist it.
+
+        On failure the existing catalogue is kept so the flows keep working
+        offline.
+        """
+        servers = await _async_fetch_servers()
+        if not servers:
+            return
+        fetched = {server["id"]: server for server in servers}
+        missed = {
+            server_id: self._missed.get(server_id, 0) + 1
+            for server_id in self._by_id
+            if server_id not in fetched
+        }
+        # Servers retired or no longer near the host age out
+        self._missed = {
+            server_id: count
+            for server_id, count in missed.items()
+            if count <= SERVER_CATALOG_MAX_MISSED
+        }
+        merged = {server_id: self._by_id[server_id] for server_id in self._missed}
+        merged.update(fetched)
+        self._fetched_at = time.time()
+        self._build_index(list(merged.values()))
+        await self._store.async_save(
+            {
+                "fetched_at": self._fetched_at,
+                "servers": self._by_distance,
+                "missed": self._missed,
+            }
+        )
+
+    async def _async_load(self) -> None:
+        """Load the catalogue from storage once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if stored := await self._store.async_load():
+            self._fetched_at = stored.get("fetched_at")
+            self._missed = stored.get("missed", {})
+            self._build_index(stored.get("servers", []))
+
+    def _async_schedule_refresh(self) -> None:
+        """Start a background refresh unless one is already running."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = self.hass.async_create_background_task(
+                self.async_refresh(), name=f"{DOMAIN} server catalogue refresh"
+            )
+
+    def _build_index(self, servers: list[dict[str, Any]]) -> None:
+        """Rebuild the id and word indexes."""
+        self._by_id = {server["id"]: server for server in servers}
+        self._by_distance = sorted(servers, key=lambda server: server["distance"])
+        self._word_ids = {}
+        for server in servers:
+            for word in f"{server['name']} {server['city']}".lower().split():
+                self._word_ids.setdefault(word, set()).add(server["id"])
+        self._words = sorted(self._word_ids)
+
+    def _word_ids_with_prefix(self, prefix: str):
+        """Yield ids of servers with an indexed word starting with prefix."""
+        index = bisect_left(self._words, prefix)
+        while index < len(self._words) and self._words[index].startswith(prefix):
+            yield from self._word_ids[self._words[index]]
+            index += 1
+
+
+def _normalize_server(server: dict[str, Any]) -> dict[str, Any] | None:
+    """Convert a CLI server entry into a catalogue record."""
+    name = server.get("name", "Unknown Server")
+    server_id = str(server.get("id", ""))
+    if not server_id:
+        _LOGGER.warning("Skipping server with missing ID: %s", name)
+        return None
+
+    # Safely access server data with fallbacks
+    city = server.get("city", server.get("location", "Unknown City"))
+    country = server.get("country", server.get("region", "Unknown Country"))
+    return {
+        "id": server_id,
+        "name": name,
+        "city": city,
+        "location": f"{city}, {country}",
+        "distance": round(server.get("distance", 0), 2),
+    }
+
+
+async def _async_fetch_servers() -> list[dict[str, Any]]:
+    """Run the CLI to list servers, returning an empty list on failure."""
+    _LOGGER.debug("Fetching Speedtest server list")
+    cmd = [
+        speedtest_bin_path(),
+        "--servers",
+        "--format=json",
+        "--accept-license",
+        "--accept-gdpr",
+    ]
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            async with asyncio.timeout(SERVER_LIST_TIMEOUT):
+                stdout, stderr = await process.communicate()
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            raise
+
+        if process.returncode:
+            _LOGGER.error(
+                "Failed to fetch server list: %s", stderr.decode(errors="replace")
+            )
+            return []
+
+        servers_data = json.loads(stdout)
+        servers = [
+            record
+            for server in servers_data.get("servers", [])
+            if (record := _normalize_server(server)) is not None
+        ]
+        _LOGGER.debug("Retrieved %d valid servers", len(servers))
+        return servers
+    except TimeoutError:
+        _LOGGER.error("Timed out fetching server list after %s seconds", SERVER_LIST_TIMEOUT)
+        return []
+    except json.JSONDecodeError as e:
+        _LOGGER.error("Failed to parse server list JSON: %s", e)
+        return []
+    except Exception as e:
+        _LOGGER.error("Unexpected error fetching servers: %s", str(e))
+        return []
@@ -0,0 +1,198 @@
+"""Mergeable latency sketches for rolling percentile trends."""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .result import SpeedtestResult
+
+# Bucket i > 0 holds values in (MIN_VALUE * GAMMA**(i-1), MIN_VALUE * GAMMA**i],
+# so a percentile is off by at most 1% of the true value
+MIN_VALUE = 0.01  # ms
+GAMMA = 1.02
+_LOG_GAMMA = math.log(GAMMA)
+
+TREND_WINDOWS = (7, 30)  # days
+TREND_PERCENTILES = (50, 95, 99)
+
+# SpeedtestResult latency fields sketched per run, by the field shown as
+# the trend sensor's state and the fields added as its attributes
+TREND_GROUPS = {
+    "ping": ("ping_low", "ping_high", "jitter"),
+    "download_latency_iqm": (
+        "download_latency_low",
+        "download_latency_high",
+        "download_latency_jitter",
+    ),
+    "upload_latency_iqm": (
+        "upload_latency_low",
+        "upload_latency_high",
+        "upload_latency_jitter",
+    ),
+}
+TREND_FIELDS = tuple(
+    field for main, extra in TREND_GROUPS.items() for field in (main, *extra)
+)
+
+
+class LogHistogram:
+    """Sparse histogram with logarithmic buckets.
+
+    Histograms merge by adding bucket counts, so per-day sketches combine
+    into any window without keeping the samples.
+    """
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self, counts: dict[int, int] | None = None) -> None:
+        """Initialize the histogram."""
+        self.counts = counts or {}
+        self.total = sum(self.counts.values())
+
+    def add(self, value: float) -> None:
+        """Count one value."""
+        if value <= MIN_VALUE:
+            index = 0
+        else:
+            index = math.ceil(math.log(value / MIN_VALUE) / _LOG_GAMMA)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+
+    def merge(self, other: LogHistogram) -> None:
+        """Add another histogram's counts to this one."""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+
+    def percentiles(self, percents: tuple[int, ...]) -> dict[int, float | None]:
+        """Return the given percentiles in one pass over the buckets."""
+        if not self.total:
+            return dict.fromkeys(percents)
+
+        result = {}
+        targets = sorted(percents)
+        position = 0
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            while position < len(targets) and seen >= targets[position] / 100 * self.total:
+                result[targets[position]] = _bucket_value(index)
+                position += 1
+        for percent in targets[position:]:
+            result[percent] = _bucket_value(max(self.counts))
+        return result
+
+
+def _bucket_value(index: int) -> float:
+    """Return the value representing a bucket (its geometric midpoint)."""
+    if index == 0:
+        return 0.0
+    return round(MIN_VALUE * GAMMA ** (index - 0.5), 2)
+
+
+class LatencyTrends:
+    """Per-day latency sketches with rolling 7 and 30 day percentiles.
+
+    Adding a run updates that day's histograms and the window aggregates
+    directly. The aggregates are rebuilt from the daily sketches only when
+    the day changes, on an add or a read, and percentiles are cached after
+    every change, so sensors read them without touching the histograms.
+    """
+
+    def __init__(self, days: dict[int, dict[str, LogHistogram]] | None = None) -> None:
+        """Initialize the trends from daily sketches keyed by date ordinal."""
+        self._days = days or {}
+        self._today: int | None = None
+        self._windows: dict[int, dict[str, LogHistogram]] = {}
+        self._cache: dict[tuple[int, str], dict[int, float | None]] = {}
+
+    def add(self, result: SpeedtestResult) -> None:
+        """Add a run's latencies."""
+        today = _day(result.timestamp)
+        self.roll(today)
+        day = self._days.setdefault(today, {})
+        for field in TREND_FIELDS:
+            value = getattr(result, field)
+            if value is None:
+                continue
+            day.setdefault(field, LogHistogram()).add(value)
+            for window in self._windows.values():
+                window.setdefault(field, LogHistogram()).add(value)
+        self._update_cache()
+
+    def roll(self, today: int | None = None) -> None:
+        """Drop days older than the longest window and rebuild the windows."""
+        if today is None:
+            today = _day(dt_util.now())
+        if today == self._today:
+            return
+
+        self._today = today
+        longest = max(TREND_WINDOWS)
+        self._days = {
+            day: sketches
+            for day, sketches in self._days.items()
+            if today - longest < day <= today
+        }
+        self._windows = {}
+        for days in TREND_WINDOWS:
+            window: dict[str, LogHistogram] = {}
+            for day, sketches in self._days.items():
+                if day > today - days:
+                    for field, histogram in sketches.items():
+                        window.setdefault(field, LogHistogram()).merge(histogram)
+            self._windows[days] = window
+        self._update_cache()
+
+    def percentile(self, days: int, field: str, percent: int) -> float | None:
+        """Return a cached percentile of a field over the last days.
+
+        Rolls to the current day first, so the windows move on even when
+        no test has run since midnight.
+        """
+        self.roll()
+        return self._cache.get((days, field), {}).get(percent)
+
+    def _update_cache(self) -> None:
+        """Recompute the percentiles of every window."""
+        self._cache = {
+            (days, field): histogram.percentiles(TREND_PERCENTILES)
+            for days, window in self._windows.items()
+            for field, histogram in window.items()
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the daily sketches for storage."""
+        return {
+            str(day): {
+                field: {str(index): count for index, count in histogram.counts.items()}
+                for field, histogram in sketches.items()
+            }
+            for day, sketches in self._days.items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LatencyTrends:
+        """Rebuild trends saved with as_dict, rolled to the current day."""
+        trends = cls(
+            {
+                int(day): {
+                    field: LogHistogram(
+                        {int(index): count for index, count in counts.items()}
+                    )
+                    for field, counts in sketches.items()
+                }
+                for day, sketches in data.items()
+            }
+        )
+        trends.roll()
+        return trends
+
+
+def _day(timestamp: datetime) -> int:
+    """Return the local calendar day of a timestamp as an ordinal."""
+    return dt_util.as_local(timestamp).date().toordinal()
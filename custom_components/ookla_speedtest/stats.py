@@ -0,0 +1,186 @@
+"""Incremental statistics over recent samples."""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, insort
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .result import SpeedtestResult
+
+# SpeedtestResult fields with rolling statistics, and the statistics kept
+ROLLING_FIELDS = ("download", "upload", "ping", "jitter")
+ROLLING_STATS = ("mean", "min", "max", "stdev", "ewma")
+
+
+class RollingWindow:
+    """Fixed-size ring buffer of samples with order statistics.
+
+    Samples are kept in arrival order and in a sorted list, so a push is a
+    binary search plus one insert/delete and percentiles are an index
+    lookup. Missing samples (None) take a slot in the window and count
+    towards missing_percent, but not towards the percentiles.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty window."""
+        self.size = size
+        self.missing = 0
+        self._samples: deque[float | None] = deque()
+        self._sorted: list[float] = []
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def push(self, value: float | None) -> None:
+        """Add a sample, evicting the oldest once the window is full."""
+        if len(self._samples) == self.size:
+            oldest = self._samples.popleft()
+            if oldest is None:
+                self.missing -= 1
+            else:
+                del self._sorted[bisect_left(self._sorted, oldest)]
+
+        self._samples.append(value)
+        if value is None:
+            self.missing += 1
+        else:
+            insort(self._sorted, value)
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the nearest-rank percentile of the present samples."""
+        if not self._sorted:
+            return None
+        rank = math.ceil(percent / 100 * len(self._sorted))
+        return self._sorted[max(rank, 1) - 1]
+
+    @property
+    def missing_percent(self) -> float | None:
+        """Return the share of missing samples, in percent."""
+        if not self._samples:
+            return None
+        return 100 * self.missing / len(self._samples)
+
+
+class RunningStats:
+    """Mean, standard deviation, min, max and EWMA of the last samples.
+
+    The mean and variance are updated with Welford's method as samples
+    enter and leave the window, and min/max come from monotonic deques, so
+    a push is O(1) (amortized for min/max) whatever the window size. The
+    EWMA covers every sample ever pushed, weighting the newest by alpha.
+    """
+
+    def __init__(self, size: int, alpha: float) -> None:
+        """Initialize empty statistics."""
+        self.size = size
+        self.alpha = alpha
+        self.ewma: float | None = None
+        self._samples: deque[float] = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+        # (sequence number, value), values increasing (min) or decreasing (max)
+        self._min: deque[tuple[int, float]] = deque()
+        self._max: deque[tuple[int, float]] = deque()
+        self._pushed = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def push(self, value: float) -> None:
+        """Add a sample, evicting the oldest once the window is full."""
+        if len(self._samples) == self.size:
+            oldest = self._samples.popleft()
+            count = len(self._samples)
+            if count:
+                delta = oldest - self._mean
+                self._mean -= delta / count
+                self._m2 = max(self._m2 - delta * (oldest - self._mean), 0.0)
+            else:
+                self._mean = self._m2 = 0.0
+
+        self._samples.append(value)
+        delta = value - self._mean
+        self._mean += delta / len(self._samples)
+        self._m2 += delta * (value - self._mean)
+
+        self._pushed += 1
+        # Sequence numbers up to this one have left the window
+        expired = self._pushed - self.size
+        for extremes, keep in ((self._min, value.__gt__), (self._max, value.__lt__)):
+            while extremes and not keep(extremes[-1][1]):
+                extremes.pop()
+            extremes.append((self._pushed, value))
+            if extremes[0][0] <= expired:
+                extremes.popleft()
+
+        self.ewma = (
+            value
+            if self.ewma is None
+            else self.alpha * value + (1 - self.alpha) * self.ewma
+        )
+
+    def values(self) -> dict[str, float | None]:
+        """Return the statistics keyed by ROLLING_STATS name."""
+        count = len(self._samples)
+        if not count:
+            return dict.fromkeys(ROLLING_STATS)
+        return {
+            "mean": round(self._mean, 2),
+            "min": self._min[0][1],
+            "max": self._max[0][1],
+            "stdev": round(math.sqrt(self._m2 / (count - 1)), 2) if count > 1 else None,
+            "ewma": round(self.ewma, 2),
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the window and EWMA for storage."""
+        return {"samples": list(self._samples), "ewma": self.ewma}
+
+    @classmethod
+    def from_dict(cls, size: int, alpha: float, data: dict[str, Any]) -> RunningStats:
+        """Rebuild statistics saved with as_dict."""
+        stats = cls(size, alpha)
+        for value in data.get("samples", [])[-size:]:
+            stats.push(value)
+        stats.ewma = data.get("ewma")
+        return stats
+
+
+class ResultStatistics:
+    """Rolling statistics of the ROLLING_FIELDS of recent results."""
+
+    def __init__(
+        self, size: int, alpha: float, stored: dict[str, Any] | None = None
+    ) -> None:
+        """Initialize the statistics, restoring saved ones if given."""
+        stored = stored or {}
+        self._stats = {
+            field: RunningStats.from_dict(size, alpha, stored.get(field, {}))
+            for field in ROLLING_FIELDS
+        }
+        self._values = {field: stats.values() for field, stats in self._stats.items()}
+
+    def add(self, result: SpeedtestResult) -> None:
+        """Add a run's values."""
+        for field, stats in self._stats.items():
+            value = getattr(result, field)
+            if value is not None:
+                stats.push(value)
+                self._values[field] = stats.values()
+
+    def get(self, field: str, stat: str) -> float | None:
+        """Return one statistic of a field."""
+        return self._values[field][stat]
+
+    def samples(self, field: str) -> int:
+        """Return the number of samples behind a field's statistics."""
+        return len(self._stats[field])
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for storage."""
+        return {field: stats.as_dict() for field, stats in self._stats.items()}
@@ -0,0 +1,88 @@
+"""Per-phase timing of speedtest runs."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any
+
+# RunTiming fields reported by the timing sensors, phases in run order
+TIMING_FIELDS = (
+    "queue_wait",
+    "spawn",
+    "cli_run",
+    "download_elapsed",
+    "upload_elapsed",
+    "parse",
+    "state_write",
+    "loop_lag_max",
+    "loop_lag_avg",
+)
+
+
+@dataclass(slots=True)
+class RunTiming:
+    """Milliseconds spent in each phase of one speedtest run.
+
+    spawn, cli_run and parse add up over both invocations when a run falls
+    back to the closest server. download_elapsed and upload_elapsed are
+    the CLI's own figures from the result JSON. loop_lag_max and
+    loop_lag_avg are how late the event loop ran while the test was
+    running, as measured by LoopLagMonitor.
+    """
+
+    started: datetime
+    queue_wait: float | None = None
+    spawn: float = 0.0
+    cli_run: float = 0.0
+    download_elapsed: int | None = None
+    upload_elapsed: int | None = None
+    parse: float = 0.0
+    state_write: float | None = None
+    loop_lag_max: float | None = None
+    loop_lag_avg: float | None = None
+    success: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timing as a JSON serialisable dict."""
+        data = asdict(self)
+        data["started"] = self.started.isoformat()
+        return data
+
+
+def elapsed_ms(start: float) -> float:
+    """Return milliseconds since a time.perf_counter() reading."""
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
+class LoopLagMonitor:
+    """Sample event loop lag by timing how late a periodic sleep wakes up."""
+
+    def __init__(self, interval: float) -> None:
+        """Initialize the monitor."""
+        self.interval = interval
+        self.samples = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    async def async_run(self) -> None:
+        """Sample until cancelled."""
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - start - self.interval)
+            self.samples += 1
+            self._total += lag
+            self._max = max(self._max, lag)
+
+    @property
+    def max_ms(self) -> float | None:
+        """Return the largest lag seen, in ms."""
+        return round(self._max * 1000, 2) if self.samples else None
+
+    @property
+    def avg_ms(self) -> float | None:
+        """Return the mean lag, in ms."""
+        return round(self._total / self.samples * 1000, 2) if self.samples else None
@@ -0,0 +1,64 @@
+"""Data used by speedtests, per day, per month and in total."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .result import SpeedtestResult
+
+PERIOD_DAY = "day"
+PERIOD_MONTH = "month"
+PERIOD_TOTAL = "total"
+USAGE_PERIODS = (PERIOD_DAY, PERIOD_MONTH, PERIOD_TOTAL)
+
+
+def _period_keys(now: datetime) -> dict[str, int]:
+    """Return the local day and month a time falls in, as comparable numbers."""
+    local = dt_util.as_local(now)
+    return {
+        PERIOD_DAY: local.date().toordinal(),
+        PERIOD_MONTH: local.year * 12 + local.month - 1,
+        PERIOD_TOTAL: 0,
+    }
+
+
+class DataUsage:
+    """Bytes transferred by speedtests in the current day, month and overall.
+
+    Counters start again at zero when their local calendar period ends,
+    which total_increasing sensors treat as a meter reset.
+    """
+
+    def __init__(self, stored: dict[str, Any] | None = None) -> None:
+        """Initialize the counters, restoring saved ones if given."""
+        stored = stored or {}
+        self._bytes = {period: stored.get(period, 0) for period in USAGE_PERIODS}
+        self._keys = {
+            period: stored.get(f"{period}_key", 0) for period in USAGE_PERIODS
+        }
+
+    def add(self, result: SpeedtestResult) -> int:
+        """Count a run's download and upload bytes and return them."""
+        used = (result.download_bytes or 0) + (result.upload_bytes or 0)
+        keys = _period_keys(result.timestamp)
+        for period in USAGE_PERIODS:
+            if self._keys[period] != keys[period]:
+                self._keys[period] = keys[period]
+                self._bytes[period] = 0
+            self._bytes[period] += used
+        return used
+
+    def get(self, period: str, now: datetime | None = None) -> int:
+        """Return the bytes used so far in the period containing now."""
+        key = _period_keys(now or dt_util.now())[period]
+        return self._bytes[period] if self._keys[period] == key else 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for storage."""
+        return {
+            **self._bytes,
+            **{f"{period}_key": key for period, key in self._keys.items()},
+        }
@@ -0,0 +1,77 @@
+"""Websocket API for the Ookla Speedtest cards."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+
+from .const import ATTR_DOWNLOAD, ATTR_PING, ATTR_UPLOAD, DOMAIN
+from .history import VALUE_FIELDS
+
+if TYPE_CHECKING:
+    from . import SpeedtestCoordinator
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the integration's websocket commands."""
+    websocket_api.async_register_command(hass, websocket_history)
+
+
+@callback
+def _async_find_coordinator(
+    hass: HomeAssistant, entity_id: str | None
+) -> SpeedtestCoordinator | None:
+    """Return the coordinator owning entity_id, or the first one loaded."""
+    coordinators: dict[str, SpeedtestCoordinator] = hass.data.get(DOMAIN, {})
+    if entity_id is None:
+        return next(iter(coordinators.values()), None)
+
+    registry_entry = er.async_get(hass).async_get(entity_id)
+    if registry_entry is None or registry_entry.config_entry_id is None:
+        return None
+    return coordinators.get(registry_entry.config_entry_id)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/history",
+        vol.Optional("entity_id"): cv.entity_id,
+        vol.Optional("hours", default=168): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=87600)
+        ),
+        vol.Optional("points", default=100): vol.All(
+            vol.Coerce(int), vol.Range(min=3, max=2000)
+        ),
+        vol.Optional("series", default=[ATTR_DOWNLOAD, ATTR_UPLOAD, ATTR_PING]): vol.All(
+            cv.ensure_list, [vol.In(VALUE_FIELDS)]
+        ),
+        vol.Optional("since"): vol.Coerce(int),
+    }
+)
+@websocket_api.async_response
+async def websocket_history(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return downsampled result history for the entry owning entity_id.
+
+    With since (epoch ms), only records newer than it are returned.
+    """
+    coordinator = _async_find_coordinator(hass, msg.get("entity_id"))
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "No Ookla Speedtest entry found"
+        )
+        return
+
+    series = await coordinator.history.async_get_series(
+        msg["hours"], msg["points"], tuple(msg["series"]), msg.get("since")
+    )
+    connection.send_result(msg["id"], {"series": series})
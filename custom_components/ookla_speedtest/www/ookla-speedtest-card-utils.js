@@ -19,6 +19,73 @@ function setSupportedStyle(element, property, value) {
   }
 }
 
+const writtenValues = new WeakMap();
+
+/**
+ * Record the state and last_updated of the given entities in `snapshot`
+ * (a Map owned by the card) and report whether any changed since the last
+ * call. Cards use this to skip DOM work for unrelated hass updates.
+ */
+export function entitiesChanged(snapshot, hass, entityIds) {
+  let changed = false;
+  for (const entityId of entityIds) {
+    if (!entityId) continue;
+    const stateObj = hass?.states[entityId];
+    const stamp = stateObj ? `${stateObj.state}|${stateObj.last_updated}` : null;
+    if (snapshot.get(entityId) !== stamp) {
+      snapshot.set(entityId, stamp);
+      changed = true;
+    }
+  }
+  return changed;
+}
+
+function patchValue(element, key, value, apply) {
+  if (!element) return false;
+  let written = writtenValues.get(element);
+  if (!written) {
+    written = new Map();
+    writtenValues.set(element, written);
+  }
+  if (written.has(key) && written.get(key) === value) return false;
+  written.set(key, value);
+  apply();
+  return true;
+}
+
+// Write helpers that leave the node alone when the value is unchanged
+export function patchText(element, text) {
+  const value = String(text);
+  return patchValue(element, 'textContent', value, () => { element.textContent = value; });
+}
+
+export function patchHTML(element, html) {
+  return patchValue(element, 'innerHTML', html, () => { element.innerHTML = html; });
+}
+
+export function patchStyle(element, property, value) {
+  const cssValue = String(value);
+  return patchValue(element, `style:${property}`, cssValue, () => element.style.setProperty(property, cssValue));
+}
+
+export function patchAttribute(element, name, value) {
+  return patchValue(element, `attr:${name}`, value, () => {
+    if (value === null || value === undefined) element.removeAttribute(name);
+    else element.setAttribute(name, value);
+  });
+}
+
+/**
+ * Rebuild a card's shadow DOM only when its config object changed since the
+ * last build. Returns true when render() ran.
+ */
+export function renderIfConfigChanged(card) {
+  if (card._renderedConfig === card._config) return false;
+  card.render();
+  card._renderedConfig = card._config;
+  return true;
+}
+
 export function applyCardAppearance(root, config) {
   const card = root?.querySelector('.card');
   if (!card) return;
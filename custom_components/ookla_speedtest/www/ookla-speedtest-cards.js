@@ -0,0 +1,2567 @@
+/**
+ * Ookla Speedtest Cards for Home Assistant
+ * All Lovelace cards of the integration in a single module, so a dashboard
+ * only needs one resource. Card editors live in ookla-speedtest-editors.js
+ * and are only loaded when an editor is opened.
+ *
+ * Version: 3.0.5
+ *
+ * Layout Compatibility:
+ * - Masonry: Each card returns its size for proper column distribution
+ * - Sections: Cards use automatic grid sizing
+ */
+
+import {
+  applyCardAppearance, entitiesChanged, patchAttribute, patchHTML, patchStyle, patchText,
+  renderIfConfigChanged
+} from './ookla-speedtest-card-utils.js?v=3.0.5';
+
+const HISTORY_KEYS = ['download', 'upload', 'ping'];
+
+/**
+ * History shared by every dashboard card on the page.
+ * Keyed by entity set, window and resolution; each entry holds [timestamp_ms, value]
+ * series and is synced incrementally when the download entity changes.
+ */
+const historyCache = new Map();
+
+function emptyHistory() {
+  return { download: [], upload: [], ping: [] };
+}
+
+function lastHistoryTimestamp(series) {
+  return Math.max(0, ...HISTORY_KEYS.map(key => series[key].at(-1)?.[0] ?? 0));
+}
+
+// How often relative times such as "5 min ago" are refreshed between entity updates
+const RELATIVE_TIME_REFRESH_MS = 60000;
+
+const SIMPLE_DOWNLOAD_ENTITY = 'sensor.ookla_speedtest_download';
+const SIMPLE_UPLOAD_ENTITY = 'sensor.ookla_speedtest_upload';
+const SIMPLE_PING_ENTITY = 'sensor.ookla_speedtest_ping';
+
+// Main card: Ookla-style interface with radial gauges
+class OoklaSpeedtestCard extends HTMLElement {
+  constructor() {
+    super();
+    this.attachShadow({ mode: 'open' });
+    this._config = {};
+    this._hass = null;
+    this._isRunning = false;
+    this._entitySnapshot = new Map();
+    this._renderedConfig = null;
+  }
+
+  static async getConfigElement() {
+    await import('./ookla-speedtest-editors.js?v=3.0.5');
+    return document.createElement("ookla-speedtest-card-editor");
+  }
+
+  static getStubConfig() {
+    return {
+      type: "custom:ookla-speedtest-card",
+      entities: {
+        download: "sensor.ookla_speedtest_download",
+        upload: "sensor.ookla_speedtest_upload",
+        ping: "sensor.ookla_speedtest_ping",
+        jitter: "sensor.ookla_speedtest_jitter",
+        grade: "sensor.ookla_speedtest_bufferbloat_grade",
+        isp: "sensor.ookla_speedtest_isp",
+        server: "sensor.ookla_speedtest_server",
+        last_test: "sensor.ookla_speedtest_last_test",
+        result_url: "sensor.ookla_speedtest_result_url"
+      },
+      labels: {
+        download: "Download",
+        upload: "Upload",
+        ping: "Ping",
+        jitter: "Jitter",
+        grade: "Grade"
+      },
+      max_download: 1000,
+      max_upload: 500,
+      show_gauges: true,
+      theme: "dark"
+    };
+  }
+
+  setConfig(config) {
+    if (!config) {
+      throw new Error("Invalid configuration");
+    }
+    this._config = {
+      ...OoklaSpeedtestCard.getStubConfig(),
+      ...config
+    };
+    this._entitySnapshot.clear();
+    if (this.isConnected) {
+      renderIfConfigChanged(this);
+      this.updateCard();
+    }
+  }
+
+  set hass(hass) {
+    this._hass = hass;
+    // Only touch the DOM when one of the configured entities changed
+    if (entitiesChanged(this._entitySnapshot, hass, Object.values(this._config.entities || {}))) {
+      this.updateCard();
+    }
+  }
+
+  get hass() {
+    return this._hass;
+  }
+
+  connectedCallback() {
+    renderIfConfigChanged(this);
+    this.updateCard();
+  }
+
+  /**
+   * Card size for Masonry view (1 = 50px)
+   * This helps masonry layout calculate proper column distribution
+   */
+  getCardSize() {
+    return 12; // ~600px height
+  }
+
+  /**
+   * Layout options for Sections view
+   * Sections use a 12-column grid system
+   * 
+   * grid_columns: How many columns the card should occupy (1-12)
+   * grid_rows: How many rows the card should occupy (1+), each row is ~56px
+   * grid_min/max: Constraints for user resizing
+   */
+  static getLayoutOptions() {
+    return {
+      grid_columns: null,     // Automatic width
+      grid_rows: null,        // Automatic height
+    };
+  }
+
+  getLayoutOptions() {
+    return {
+      grid_columns: null,     // Automatic width
+      grid_rows: null,        // Automatic height
+    };
+  }
+
+  updateCard() {
+    if (!this._hass || !this.isConnected) return;
+    
+    const entities = this._config.entities;
+    const download = this._getState(entities.download);
+    const upload = this._getState(entities.upload);
+    const ping = this._getState(entities.ping);
+    const jitter = this._getState(entities.jitter);
+    const grade = this._getState(entities.grade);
+    const isp = this._getState(entities.isp);
+    const server = this._getState(entities.server);
+    const lastTest = this._getState(entities.last_test);
+    const resultUrl = this._getState(entities.result_url);
+
+    // Update gauge values
+    this._updateGauge('download', download, this._config.max_download);
+    this._updateGauge('upload', upload, this._config.max_upload);
+
+    // Update metrics
+    this._updateMetric('ping', ping, 'ms');
+    this._updateMetric('jitter', jitter, 'ms');
+    this._updateMetric('grade', grade, '');
+
+    // Update header
+    const ispEl = this.shadowRoot.querySelector('.isp-name');
+    const serverEl = this.shadowRoot.querySelector('.server-name');
+    patchText(ispEl, isp || 'Unknown ISP');
+    patchText(serverEl, server || 'Unknown Server');
+
+    // Update footer
+    const lastTestEl = this.shadowRoot.querySelector('.last-test');
+    if (lastTest) {
+      patchText(lastTestEl, this._formatDate(lastTest));
+    }
+
+    // Update result link
+    const resultLink = this.shadowRoot.querySelector('.result-link');
+    if (resultLink) {
+      if (resultUrl && resultUrl.startsWith('http')) {
+        if (resultLink.href !== resultUrl) resultLink.href = resultUrl;
+        patchStyle(resultLink, 'display', 'inline-block');
+      } else {
+        patchStyle(resultLink, 'display', 'none');
+      }
+    }
+  }
+
+  _getState(entityId) {
+    if (!this._hass || !entityId) return null;
+    const state = this._hass.states[entityId];
+    return state ? state.state : null;
+  }
+  
+  _showMoreInfo(entityId) {
+    if (!entityId) return;
+    const event = new CustomEvent('hass-more-info', {
+      bubbles: true,
+      composed: true,
+      detail: { entityId }
+    });
+    this.dispatchEvent(event);
+  }
+
+  _updateGauge(type, value, max) {
+    const gauge = this.shadowRoot.querySelector(`.gauge-${type} .gauge-fill`);
+    const valueEl = this.shadowRoot.querySelector(`.gauge-${type} .gauge-value`);
+    
+    if (!gauge || !valueEl) return;
+
+    const numValue = parseFloat(value) || 0;
+    const percentage = Math.min((numValue / max) * 100, 100);
+    
+    // Calculate stroke dashoffset for SVG circle (270 degrees)
+    const maxArc = 424; 
+    const offset = maxArc * (1 - percentage / 100);
+    
+    patchStyle(gauge, 'stroke-dashoffset', offset);
+    
+    // Color based on percentage
+    let color = '#ef4444'; // red
+    if (percentage >= 50) color = '#22d3ee'; // cyan
+    if (percentage >= 80) color = '#22c55e'; // green
+    
+    patchStyle(gauge, 'stroke', color);
+    patchText(valueEl, Math.round(numValue));
+    patchStyle(valueEl, 'color', color);
+  }
+
+  _updateMetric(type, value, unit) {
+    const el = this.shadowRoot.querySelector(`.metric-${type} .metric-value`);
+    if (el) {
+      let displayValue = value || '-';
+      if (type === 'grade' && value) {
+        const colors = { 'A+': '#22c55e', 'A': '#22c55e', 'B': '#84cc16', 'C': '#eab308' };
+        const color = colors[value] || '#ef4444';
+        patchHTML(el, `<span style="color:${color}">${value}</span>`);
+      } else {
+        patchText(el, displayValue + (unit ? ` ${unit}` : ''));
+      }
+    }
+  }
+
+  _formatDate(dateStr) {
+    if (!dateStr || dateStr === 'unknown' || dateStr === 'unavailable') return 'Never';
+    try {
+      const date = new Date(dateStr);
+      return date.toLocaleString();
+    } catch {
+      return dateStr;
+    }
+  }
+
+  _runSpeedtest() {
+    if (this._isRunning) return;
+    
+    this._isRunning = true;
+    const btn = this.shadowRoot.querySelector('.go-button');
+    if (btn) {
+      btn.classList.add('running');
+      btn.textContent = '...';
+    }
+
+    this._hass.callService('ookla_speedtest', 'run_speedtest').then(() => {
+      setTimeout(() => {
+        this._isRunning = false;
+        if (btn) {
+          btn.classList.remove('running');
+          btn.textContent = 'GO';
+        }
+      }, 3000);
+    });
+  }
+
+  render() {
+    const labels = this._config.labels || { download: 'Download', upload: 'Upload', ping: 'Ping', jitter: 'Jitter', grade: 'Grade' };
+    
+    this.shadowRoot.innerHTML = `
+      <style>
+        :host {
+          display: block;
+          font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+          width: 100%;
+          height: 100%;
+          box-sizing: border-box;
+          container-type: inline-size;
+        }
+
+        * {
+          box-sizing: border-box;
+        }
+
+        .card {
+          background: var(--ha-card-background, var(--card-background-color, rgba(15, 23, 42, 0.6)));
+          backdrop-filter: blur(20px);
+          -webkit-backdrop-filter: blur(20px);
+          border-radius: var(--ha-card-border-radius, 12px);
+          padding: 20px;
+          box-shadow: var(--ha-card-box-shadow, none);
+          border: 1px solid var(--ha-card-border-color, var(--divider-color, rgba(255, 255, 255, 0.08)));
+          color: var(--primary-text-color, #f8fafc);
+          position: relative;
+          overflow: hidden;
+          width: 100%;
+          height: 100%;
+          min-height: 0;
+          display: flex;
+          flex-direction: column;
+          justify-content: space-between;
+          /* Ensure card fills available space in sections view */
+          flex: 1;
+          direction: ltr;
+        }
+
+        .card::before {
+          content: '';
+          position: absolute;
+          top: -50%;
+          left: -50%;
+          width: 200%;
+          height: 200%;
+          background: radial-gradient(circle at 50% 50%, rgba(34, 211, 238, 0.02), transparent 60%);
+          pointer-events: none;
+          z-index: 0;
+        }
+        
+        .content-wrapper {
+          position: relative;
+          z-index: 1;
+        }
+        
+        .header {
+          text-align: center;
+          margin-bottom: 16px;
+          display: flex;
+          flex-direction: column;
+          align-items: center;
+          flex-shrink: 0;
+        }
+        
+        .header-icon {
+          font-size: 28px;
+          margin-bottom: 12px;
+          background: rgba(255,255,255,0.05);
+          width: 50px;
+          height: 50px;
+          display: flex;
+          align-items: center;
+          justify-content: center;
+          border-radius: 50%;
+          box-shadow: 0 4px 12px rgba(0,0,0,0.2);
+        }
+        
+        .isp-name {
+          font-size: 20px;
+          font-weight: 700;
+          color: var(--primary-text-color, #f8fafc);
+          margin-bottom: 4px;
+          text-shadow: 0 2px 4px rgba(0,0,0,0.3);
+        }
+
+        .server-name {
+          font-size: 13px;
+          color: var(--secondary-text-color, #94a3b8);
+          display: flex;
+          align-items: center;
+          gap: 6px;
+        }
+        
+        .gauges-container {
+          display: flex;
+          justify-content: center;
+          gap: 16px;
+          margin: 16px 0;
+          position: relative;
+          flex: 1;
+          align-items: center;
+        }
+        
+        .gauge {
+          position: relative;
+          width: 140px;
+          height: 140px;
+          flex-shrink: 0;
+          cursor: pointer;
+          transition: transform 0.2s;
+        }
+        
+        .gauge:hover {
+          transform: scale(1.05);
+        }
+        
+        .gauge-svg {
+          transform: rotate(135deg);
+          width: 100%;
+          height: 100%;
+        }
+        
+        .gauge-bg {
+          fill: none;
+          stroke: var(--divider-color, rgba(255,255,255,0.05));
+          stroke-width: 12;
+          stroke-linecap: round;
+          stroke-dasharray: 424 566;
+          stroke-dashoffset: 0;
+        }
+        
+        .gauge-fill {
+          fill: none;
+          stroke-width: 12;
+          stroke-linecap: round;
+          stroke-dasharray: 424 566; /* 2 * PI * 90 * 0.75 */
+          stroke-dashoffset: 424;
+          transition: stroke-dashoffset 1s cubic-bezier(0.4, 0, 0.2, 1), stroke 0.3s ease;
+          filter: drop-shadow(0 0 4px currentColor);
+        }
+        
+        .gauge-content {
+          position: absolute;
+          top: 50%;
+          left: 50%;
+          transform: translate(-50%, -50%);
+          text-align: center;
+          display: flex;
+          flex-direction: column;
+          align-items: center;
+        }
+        
+        .gauge-label {
+          font-size: 11px;
+          color: var(--secondary-text-color, #94a3b8);
+          text-transform: uppercase;
+          letter-spacing: 1.5px;
+          margin-bottom: 8px;
+          font-weight: 600;
+        }
+        
+        .gauge-value {
+          font-size: 32px;
+          font-weight: 800;
+          color: var(--primary-text-color, #fff);
+          line-height: 1;
+          letter-spacing: -0.5px;
+          text-shadow: 0 2px 10px rgba(0,0,0,0.3);
+        }
+        
+        .gauge-unit {
+          font-size: 12px;
+          color: var(--secondary-text-color, #64748b);
+          margin-top: 4px;
+          font-weight: 500;
+        }
+        
+        .go-button-container {
+          display: flex;
+          justify-content: center;
+          margin: -30px 0 20px;
+          position: relative;
+          z-index: 10;
+        }
+        
+        .go-button {
+          width: 80px;
+          height: 80px;
+          border-radius: 50%;
+          border: 4px solid rgba(255,255,255,0.1);
+          background: var(--ookla-accent-color, #0ea5e9);
+          background: radial-gradient(circle at 30% 30%, color-mix(in srgb, var(--ookla-accent-color, #0ea5e9) 78%, white), var(--ookla-accent-color, #0ea5e9));
+          color: white;
+          font-size: 20px;
+          font-weight: 900;
+          letter-spacing: 1px;
+          cursor: pointer;
+          box-shadow: 
+            0 0 20px rgba(14, 165, 233, 0.4),
+            inset 0 0 20px rgba(255,255,255,0.2),
+            0 10px 20px rgba(0,0,0,0.3);
+          transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+          text-shadow: 0 2px 4px rgba(0,0,0,0.3);
+          display: flex;
+          align-items: center;
+          justify-content: center;
+        }
+        
+        .go-button:hover {
+          transform: scale(1.05) translateY(-2px);
+          box-shadow: 
+            0 0 30px rgba(14, 165, 233, 0.6),
+            inset 0 0 20px rgba(255,255,255,0.3),
+            0 15px 25px rgba(0,0,0,0.4);
+          background: var(--ookla-accent-color, #0ea5e9);
+          background: radial-gradient(circle at 30% 30%, color-mix(in srgb, var(--ookla-accent-color, #0ea5e9) 72%, white), var(--ookla-accent-color, #0ea5e9));
+        }
+        
+        .go-button:active {
+          transform: scale(0.95) translateY(0);
+          box-shadow: 0 0 10px rgba(14, 165, 233, 0.4);
+        }
+        
+        .go-button.running {
+          animation: pulse 1.5s infinite;
+          background: radial-gradient(circle at 30% 30%, #10b981, #059669);
+          box-shadow: 0 0 20px rgba(16, 185, 129, 0.4);
+        }
+        
+        @keyframes pulse {
+          0% { box-shadow: 0 0 0 0 rgba(16, 185, 129, 0.7); }
+          70% { box-shadow: 0 0 0 20px rgba(16, 185, 129, 0); }
+          100% { box-shadow: 0 0 0 0 rgba(16, 185, 129, 0); }
+        }
+        
+        .metrics {
+          display: grid;
+          grid-template-columns: repeat(3, 1fr);
+          gap: 12px;
+          margin-bottom: 16px;
+        }
+        
+        .metric {
+          background: var(--secondary-background-color, rgba(255,255,255,0.03));
+          border-radius: 16px;
+          padding: 16px 12px;
+          text-align: center;
+          border: 1px solid var(--divider-color, rgba(255,255,255,0.02));
+          transition: transform 0.2s, background 0.2s;
+          cursor: pointer;
+        }
+        
+        .metric:hover {
+          background: var(--secondary-background-color, rgba(255,255,255,0.05));
+          transform: translateY(-2px);
+        }
+        
+        .metric-icon {
+          font-size: 20px;
+          margin-bottom: 8px;
+          opacity: 0.8;
+        }
+        
+        .metric-label {
+          font-size: 10px;
+          color: var(--secondary-text-color, #94a3b8);
+          text-transform: uppercase;
+          letter-spacing: 1px;
+          margin-bottom: 4px;
+          font-weight: 600;
+        }
+        
+        .metric-value {
+          font-size: 16px;
+          font-weight: 700;
+          color: var(--primary-text-color, #f8fafc);
+        }
+        
+        .metric-ping .metric-value { color: #fbbf24; text-shadow: 0 0 10px rgba(251, 191, 36, 0.3); }
+        .metric-jitter .metric-value { color: #a78bfa; text-shadow: 0 0 10px rgba(167, 139, 250, 0.3); }
+        .metric-grade .metric-value { font-size: 18px; }
+        
+        .footer {
+          text-align: center;
+          padding-top: 16px;
+          border-top: 1px solid var(--divider-color, rgba(255,255,255,0.05));
+          display: flex;
+          justify-content: space-between;
+          align-items: center;
+          flex-shrink: 0;
+        }
+        
+        .last-test {
+          font-size: 11px;
+          color: var(--secondary-text-color, #64748b);
+          display: flex;
+          align-items: center;
+          gap: 6px;
+          cursor: pointer;
+        }
+        
+        .last-test::before {
+          content: '';
+          display: block;
+          width: 6px;
+          height: 6px;
+          border-radius: 50%;
+          background: var(--secondary-text-color, #64748b);
+        }
+        
+        .result-link {
+          display: inline-flex;
+          align-items: center;
+          gap: 6px;
+          color: var(--ookla-accent-color, #38bdf8);
+          text-decoration: none;
+          font-size: 12px;
+          font-weight: 600;
+          transition: all 0.2s;
+          padding: 6px 12px;
+          border-radius: 20px;
+          background: rgba(56, 189, 248, 0.1);
+        }
+        
+        .result-link:hover {
+          background: rgba(56, 189, 248, 0.2);
+          color: #7dd3fc;
+        }
+
+        /* Container query responsive adjustments */
+        @container (max-width: 450px) {
+          .card { padding: 16px; }
+          .gauges-container { gap: 12px; }
+          .gauge { width: 120px; height: 120px; }
+          .gauge-value { font-size: 28px; }
+          .go-button { width: 70px; height: 70px; font-size: 18px; }
+          .metrics { gap: 8px; }
+          .metric { padding: 12px 8px; }
+        }
+
+        @container (max-width: 350px) {
+          .gauges-container { flex-direction: column; gap: 8px; }
+          .gauge { width: 100px; height: 100px; }
+          .gauge-value { font-size: 24px; }
+          .go-button { width: 60px; height: 60px; font-size: 16px; }
+          .go-button-container { margin: -20px 0 16px; }
+        }
+</style>
+      
+      <div class="card">
+        <div class="content-wrapper">
+          <div class="header">
+            <div class="header-icon">🌐</div>
+            <div class="isp-name">Loading...</div>
+            <div class="server-name">
+              <svg width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M20 10c0 6-8 12-8 12s-8-6-8-12a8 8 0 0 1 16 0Z"/><circle cx="12" cy="10" r="3"/></svg>
+              <span>-</span>
+            </div>
+          </div>
+          
+          <div class="gauges-container">
+            <div class="gauge gauge-download">
+              <svg class="gauge-svg" viewBox="0 0 200 200">
+                <!-- Defs for gradients -->
+                <defs>
+                  <linearGradient id="grad-download" x1="0%" y1="0%" x2="100%" y2="0%">
+                    <stop offset="0%" style="stop-color:var(--ookla-accent-color, #0ea5e9);stop-opacity:1" />
+                    <stop offset="100%" style="stop-color:#22d3ee;stop-opacity:1" />
+                  </linearGradient>
+                  <linearGradient id="grad-upload" x1="0%" y1="0%" x2="100%" y2="0%">
+                    <stop offset="0%" style="stop-color:#7c3aed;stop-opacity:1" />
+                    <stop offset="100%" style="stop-color:#a78bfa;stop-opacity:1" />
+                  </linearGradient>
+                </defs>
+                <circle class="gauge-bg" cx="100" cy="100" r="90"></circle>
+                <circle class="gauge-fill" cx="100" cy="100" r="90" stroke="url(#grad-download)"></circle>
+              </svg>
+              <div class="gauge-content">
+                <div class="gauge-label">${labels.download}</div>
+                <div class="gauge-value">0</div>
+                <div class="gauge-unit">Mbps</div>
+              </div>
+            </div>
+            
+            <div class="gauge gauge-upload">
+              <svg class="gauge-svg" viewBox="0 0 200 200">
+                <circle class="gauge-bg" cx="100" cy="100" r="90"></circle>
+                <circle class="gauge-fill" cx="100" cy="100" r="90" stroke="url(#grad-upload)"></circle>
+              </svg>
+              <div class="gauge-content">
+                <div class="gauge-label">${labels.upload}</div>
+                <div class="gauge-value">0</div>
+                <div class="gauge-unit">Mbps</div>
+              </div>
+            </div>
+          </div>
+          
+          <div class="go-button-container">
+            <button class="go-button">GO</button>
+          </div>
+          
+          <div class="metrics">
+            <div class="metric metric-ping">
+              <div class="metric-icon">⚡</div>
+              <div class="metric-label">${labels.ping}</div>
+              <div class="metric-value">- ms</div>
+            </div>
+            <div class="metric metric-jitter">
+              <div class="metric-icon">📶</div>
+              <div class="metric-label">${labels.jitter}</div>
+              <div class="metric-value">- ms</div>
+            </div>
+            <div class="metric metric-grade">
+              <div class="metric-icon">🏆</div>
+              <div class="metric-label">${labels.grade}</div>
+              <div class="metric-value">-</div>
+            </div>
+          </div>
+          
+          <div class="footer">
+            <div class="last-test">Never tested</div>
+            <a href="#" class="result-link" target="_blank" rel="noopener noreferrer" style="display:none;">View Results</a>
+          </div>
+        </div>
+      </div>
+    `;
+
+    applyCardAppearance(this.shadowRoot, this._config);
+
+    // Add event listeners
+    const goBtn = this.shadowRoot.querySelector('.go-button');
+    if (goBtn) {
+      goBtn.addEventListener('click', () => this._runSpeedtest());
+    }
+
+    // Interactive elements
+    const entities = this._config.entities;
+    this.shadowRoot.querySelector('.gauge-download')?.addEventListener('click', () => this._showMoreInfo(entities.download));
+    this.shadowRoot.querySelector('.gauge-upload')?.addEventListener('click', () => this._showMoreInfo(entities.upload));
+    this.shadowRoot.querySelector('.metric-ping')?.addEventListener('click', () => this._showMoreInfo(entities.ping));
+    this.shadowRoot.querySelector('.metric-jitter')?.addEventListener('click', () => this._showMoreInfo(entities.jitter));
+    this.shadowRoot.querySelector('.metric-grade')?.addEventListener('click', () => this._showMoreInfo(entities.grade));
+    this.shadowRoot.querySelector('.last-test')?.addEventListener('click', () => this._showMoreInfo(entities.last_test));
+  }
+}
+
+// Minimal card: clean design with large typography
+class OoklaSpeedtestMinimal extends HTMLElement {
+  constructor() {
+    super();
+    this.attachShadow({ mode: 'open' });
+    this._config = {};
+    this._hass = null;
+    this._entitySnapshot = new Map();
+    this._renderedConfig = null;
+  }
+
+  static async getConfigElement() {
+    await import('./ookla-speedtest-editors.js?v=3.0.5');
+    return document.createElement("ookla-speedtest-minimal-editor");
+  }
+
+  static getStubConfig() {
+    return {
+      type: "custom:ookla-speedtest-minimal",
+      entities: {
+        download: "sensor.ookla_speedtest_download",
+        upload: "sensor.ookla_speedtest_upload",
+        ping: "sensor.ookla_speedtest_ping",
+        isp: "sensor.ookla_speedtest_isp"
+      },
+      labels: {
+        download: "Download",
+        upload: "Upload",
+        ping: "Ping"
+      }
+    };
+  }
+
+  setConfig(config) {
+    this._config = { ...OoklaSpeedtestMinimal.getStubConfig(), ...config };
+    this._entitySnapshot.clear();
+    if (this.isConnected) {
+      renderIfConfigChanged(this);
+      this.updateCard();
+    }
+  }
+
+  set hass(hass) {
+    this._hass = hass;
+    // Only touch the DOM when one of the configured entities changed
+    if (entitiesChanged(this._entitySnapshot, hass, Object.values(this._config.entities || {}))) {
+      this.updateCard();
+    }
+  }
+
+  connectedCallback() {
+    renderIfConfigChanged(this);
+    this.updateCard();
+  }
+
+  /**
+   * Card size for Masonry view (1 = 50px)
+   * This helps masonry layout calculate proper column distribution
+   */
+  getCardSize() {
+    return 6; // ~300px height
+  }
+
+  /**
+   * Layout options for Sections view
+   * Sections use a 12-column grid system
+   * 
+   * grid_columns: How many columns the card should occupy (1-12)
+   * grid_rows: How many rows the card should occupy (1+), each row is ~56px
+   * grid_min/max: Constraints for user resizing
+   */
+  static getLayoutOptions() {
+    return {
+      grid_columns: null,     // Automatic width
+      grid_rows: null,        // Automatic height
+    };
+  }
+
+  getLayoutOptions() {
+    return {
+      grid_columns: null,     // Automatic width
+      grid_rows: null,        // Automatic height
+    };
+  }
+
+  updateCard() {
+    if (!this._hass) return;
+    
+    const e = this._config.entities;
+    const download = this._getState(e.download);
+    const upload = this._getState(e.upload);
+    const ping = this._getState(e.ping);
+    const isp = this._getState(e.isp);
+
+    const dlEl = this.shadowRoot.querySelector('.speed-download');
+    const ulEl = this.shadowRoot.querySelector('.speed-upload');
+    const pingEl = this.shadowRoot.querySelector('.ping-value');
+    const ispEl = this.shadowRoot.querySelector('.isp-text');
+
+    patchText(dlEl, download ? `${Math.round(download)} Mbps` : '--');
+    patchText(ulEl, upload ? `${Math.round(upload)} Mbps` : '--');
+    patchText(pingEl, ping ? `${Math.round(ping)} ms` : '--');
+    patchText(ispEl, isp || 'Unknown ISP');
+
+    // Color coding
+    if (download) {
+      patchStyle(dlEl, 'color', download > 100 ? '#38bdf8' : download > 50 ? '#fbbf24' : '#ef4444');
+    }
+    if (upload) {
+      patchStyle(ulEl, 'color', upload > 50 ? '#a78bfa' : upload > 20 ? '#fbbf24' : '#ef4444');
+    }
+  }
+
+  _getState(entityId) {
+    if (!this._hass || !entityId) return null;
+    const state = this._hass.states[entityId];
+    return state ? parseFloat(state.state) || state.state : null;
+  }
+  
+  _showMoreInfo(entityId) {
+    if (!entityId) return;
+    const event = new CustomEvent('hass-more-info', {
+      bubbles: true,
+      composed: true,
+      detail: { entityId }
+    });
+    this.dispatchEvent(event);
+  }
+
+  _runTest() {
+    if (this._hass) {
+      this._hass.callService('ookla_speedtest', 'run_speedtest');
+      const btn = this.shadowRoot.querySelector('.test-btn');
+      if (btn) {
+        btn.textContent = 'Testing...';
+        setTimeout(() => btn.textContent = 'Run Speed Test', 3000);
+      }
+    }
+  }
+
+  render() {
+    const labels = this._config.labels || { download: 'Download', upload: 'Upload', ping: 'Ping' };
+    
+    this.shadowRoot.innerHTML = `
+      <style>
+        :host {
+          display: block;
+          width: 100%;
+          height: 100%;
+          box-sizing: border-box;
+          container-type: inline-size;
+        }
+
+        * {
+          box-sizing: border-box;
+        }
+
+        .card {
+          background: var(--ha-card-background, var(--card-background-color, rgba(15, 23, 42, 0.6)));
+          backdrop-filter: blur(20px);
+          -webkit-backdrop-filter: blur(20px);
+          border-radius: var(--ha-card-border-radius, 12px);
+          padding: 20px;
+          color: var(--primary-text-color, #f8fafc);
+          font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+          border: 1px solid var(--ha-card-border-color, var(--divider-color, rgba(255, 255, 255, 0.08)));
+          box-shadow: var(--ha-card-box-shadow, none);
+          width: 100%;
+          height: 100%;
+          min-height: 0;
+          display: flex;
+          flex-direction: column;
+          justify-content: center;
+          /* Ensure card fills available space in sections view */
+          flex: 1;
+          direction: ltr;
+        }
+        .isp-text {
+          font-size: 11px;
+          color: var(--secondary-text-color, #94a3b8);
+          text-transform: uppercase;
+          letter-spacing: 1.5px;
+          margin-bottom: 20px;
+          font-weight: 600;
+        }
+        .speeds {
+          display: flex;
+          gap: 20px;
+          margin-bottom: 20px;
+        }
+        .speed-block {
+          flex: 1;
+          cursor: pointer;
+          transition: transform 0.2s;
+        }
+        .speed-block:hover {
+          transform: translateY(-2px);
+        }
+        .speed-label {
+          font-size: 10px;
+          color: var(--secondary-text-color, #94a3b8);
+          text-transform: uppercase;
+          letter-spacing: 1px;
+          margin-bottom: 8px;
+          display: flex;
+          align-items: center;
+          gap: 6px;
+          font-weight: 600;
+        }
+        .speed-value {
+          font-size: 36px;
+          font-weight: 800;
+          line-height: 1;
+          transition: color 0.3s;
+          letter-spacing: -1px;
+        }
+        .arrow-down { color: #38bdf8; }
+        .arrow-up { color: #a78bfa; }
+        .ping-row {
+          display: flex;
+          align-items: center;
+          gap: 8px;
+          font-size: 14px;
+          color: var(--secondary-text-color, #94a3b8);
+          margin-bottom: 24px;
+          background: var(--secondary-background-color, rgba(255,255,255,0.03));
+          padding: 8px 16px;
+          border-radius: 12px;
+          width: fit-content;
+          cursor: pointer;
+          transition: background 0.2s;
+        }
+        .ping-row:hover {
+          background: var(--secondary-background-color, rgba(255,255,255,0.08));
+        }
+        .ping-value {
+          color: #fbbf24;
+          font-weight: 700;
+        }
+        .test-btn {
+          width: 100%;
+          padding: 14px;
+          border: none;
+          border-radius: 16px;
+          background: var(--ookla-accent-color, #0ea5e9);
+          background: linear-gradient(135deg, var(--ookla-accent-color, #0ea5e9), color-mix(in srgb, var(--ookla-accent-color, #0ea5e9) 75%, black));
+          color: white;
+          font-size: 15px;
+          font-weight: 700;
+          cursor: pointer;
+          transition: all 0.2s;
+          box-shadow: 0 4px 12px rgba(14, 165, 233, 0.3);
+        }
+        .test-btn:hover {
+          opacity: 0.9;
+          transform: translateY(-1px);
+          box-shadow: 0 6px 16px rgba(14, 165, 233, 0.4);
+        }
+        .test-btn:active {
+          transform: translateY(0);
+        }
+      </style>
+      
+      <div class="card">
+        <div class="isp-text">Internet Speed</div>
+        
+        <div class="speeds">
+          <div class="speed-block speed-block-dl">
+            <div class="speed-label">
+              <span class="arrow-down">⬇</span> ${labels.download}
+            </div>
+            <div class="speed-value speed-download">--</div>
+          </div>
+          <div class="speed-block speed-block-ul">
+            <div class="speed-label">
+              <span class="arrow-up">⬆</span> ${labels.upload}
+            </div>
+            <div class="speed-value speed-upload">--</div>
+          </div>
+        </div>
+        
+        <div class="ping-row">
+          <span>⚡</span> ${labels.ping}: <span class="ping-value">--</span>
+        </div>
+        
+        <button class="test-btn">Run Speed Test</button>
+      </div>
+    `;
+
+    applyCardAppearance(this.shadowRoot, this._config);
+
+    this.shadowRoot.querySelector('.test-btn')?.addEventListener('click', () => this._runTest());
+    
+    // Interactive elements
+    const e = this._config.entities;
+    this.shadowRoot.querySelector('.speed-block-dl')?.addEventListener('click', () => this._showMoreInfo(e.download));
+    this.shadowRoot.querySelector('.speed-block-ul')?.addEventListener('click', () => this._showMoreInfo(e.upload));
+    this.shadowRoot.querySelector('.ping-row')?.addEventListener('click', () => this._showMoreInfo(e.ping));
+  }
+}
+
+// Compact card: pill-shaped, inspired by Bubble Card
+class OoklaSpeedtestCompact extends HTMLElement {
+  constructor() {
+    super();
+    this.attachShadow({ mode: 'open' });
+    this._config = {};
+    this._hass = null;
+    this._entitySnapshot = new Map();
+    this._renderedConfig = null;
+  }
+
+  static async getConfigElement() {
+    await import('./ookla-speedtest-editors.js?v=3.0.5');
+    return document.createElement("ookla-speedtest-compact-editor");
+  }
+
+  static getStubConfig() {
+    return {
+      type: "custom:ookla-speedtest-compact",
+      entities: {
+        download: "sensor.ookla_speedtest_download",
+        upload: "sensor.ookla_speedtest_upload",
+        ping: "sensor.ookla_speedtest_ping"
+      },
+      labels: {
+        download: "Download",
+        upload: "Upload",
+        ping: "Ping"
+      }
+    };
+  }
+
+  setConfig(config) {
+    this._config = { ...OoklaSpeedtestCompact.getStubConfig(), ...config };
+    this._entitySnapshot.clear();
+    if (this.isConnected) {
+      renderIfConfigChanged(this);
+      this.updateCard();
+    }
+  }
+
+  set hass(hass) {
+    this._hass = hass;
+    // Only touch the DOM when one of the configured entities changed
+    if (entitiesChanged(this._entitySnapshot, hass, Object.values(this._config.entities || {}))) {
+      this.updateCard();
+    }
+  }
+
+  connectedCallback() {
+    renderIfConfigChanged(this);
+    this.updateCard();
+  }
+
+  /**
+   * Card size for Masonry view (1 = 50px)
+   * This helps masonry layout calculate proper column distribution
+   */
+  getCardSize() {
+    return 2; // ~100px height (compact but readable)
+  }
+
+  /**
+   * Layout options for Sections view (Bubble Card style)
+   * Sections use a 12-column grid system
+   * 
+   * grid_columns: How many columns the card should occupy (1-12)
+   * grid_rows: How many rows the card should occupy (1+), each row is ~56px
+   * grid_min/max: Constraints for user resizing
+   */
+  static getLayoutOptions() {
+    return {
+      grid_columns: null,     // Automatic width
+      grid_rows: null,        // Automatic height
+    };
+  }
+
+  getLayoutOptions() {
+    return {
+      grid_columns: null,     // Automatic width
+      grid_rows: null,        // Automatic height
+    };
+  }
+
+  updateCard() {
+    if (!this._hass) return;
+
+    const e = this._config.entities;
+    const dl = this._getState(e.download);
+    const ul = this._getState(e.upload);
+    const ping = this._getState(e.ping);
+
+    const dlEl = this.shadowRoot.querySelector('.dl-value');
+    const ulEl = this.shadowRoot.querySelector('.ul-value');
+    const pingEl = this.shadowRoot.querySelector('.ping-value');
+
+    patchText(dlEl, dl ? Math.round(dl) : '--');
+    patchText(ulEl, ul ? Math.round(ul) : '--');
+    patchText(pingEl, ping ? Math.round(ping) : '--');
+  }
+
+  _getState(entityId) {
+    if (!this._hass || !entityId) return null;
+    const state = this._hass.states[entityId];
+    return state ? parseFloat(state.state) || null : null;
+  }
+  
+  _showMoreInfo(entityId) {
+    if (!entityId) return;
+    const event = new CustomEvent('hass-more-info', {
+      bubbles: true,
+      composed: true,
+      detail: { entityId }
+    });
+    this.dispatchEvent(event);
+  }
+
+  _runTest() {
+    if (!this._hass) return;
+
+    this._hass.callService('ookla_speedtest', 'run_speedtest');
+    const btn = this.shadowRoot.querySelector('.action-button');
+    if (btn) {
+      btn.classList.add('running');
+      btn.textContent = '...';
+      setTimeout(() => {
+        btn.classList.remove('running');
+        btn.textContent = 'GO';
+      }, 5000);
+    }
+  }
+
+  render() {
+    const labels = this._config.labels || { download: 'Download', upload: 'Upload', ping: 'Ping' };
+    
+    this.shadowRoot.innerHTML = `
+      <style>
+        :host {
+          display: block;
+          width: 100%;
+          height: 100%;
+          box-sizing: border-box;
+          container-type: inline-size;
+        }
+
+        * {
+          box-sizing: border-box;
+        }
+
+        .card {
+          background: var(--bubble-main-background-color, var(--ha-card-background, var(--card-background-color, rgba(255, 255, 255, 0.04))));
+          backdrop-filter: blur(50px);
+          -webkit-backdrop-filter: blur(50px);
+          border-radius: var(--bubble-border-radius, var(--ha-card-border-radius, 12px));
+          padding: 4px 8px 4px 4px; /* Tighter padding */
+          color: var(--primary-text-color, #f8fafc);
+          font-family: var(--primary-font-family, -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif);
+          display: flex;
+          flex-direction: row;
+          flex-wrap: nowrap;
+          align-items: center;
+          justify-content: flex-start;
+          border: none;
+          box-shadow: var(--bubble-box-shadow, var(--ha-card-box-shadow, none));
+          width: 100%;
+          height: 100%;
+          min-height: 50px;
+          max-height: 80px;
+          gap: 8px; /* Reduced gap */
+          transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+          cursor: pointer;
+          position: relative;
+          overflow: hidden;
+          /* Ensure proper sizing in sections view */
+          flex: 1;
+          direction: ltr;
+        }
+
+        .card::before {
+          content: '';
+          position: absolute;
+          top: 0;
+          left: 0;
+          right: 0;
+          bottom: 0;
+          background: linear-gradient(135deg, rgba(14, 165, 233, 0.05) 0%, rgba(167, 139, 250, 0.05) 100%);
+          opacity: 0;
+          transition: opacity 0.3s ease;
+          pointer-events: none;
+        }
+
+        .card:hover {
+          box-shadow: 0 4px 16px 0 rgba(0, 0, 0, 0.24);
+          transform: translateY(-1px);
+        }
+
+        .card:hover::before {
+          opacity: 1;
+        }
+
+        .card:active {
+          transform: scale(0.98);
+        }
+
+        .stats-container {
+          display: flex;
+          flex-direction: row;
+          align-items: center;
+          flex: 1;
+          min-width: 0;
+          overflow: hidden;
+        }
+
+        .stats {
+          display: flex;
+          justify-content: space-between;
+          align-items: center;
+          width: 100%;
+          gap: 4px;
+          min-width: 0;
+          overflow: hidden;
+        }
+
+        .stat {
+          display: flex;
+          flex-direction: row;
+          align-items: baseline;
+          justify-content: center;
+          gap: 2px;
+          white-space: nowrap;
+          flex: 1;
+          min-width: 0;
+          overflow: hidden;
+          cursor: pointer;
+          transition: opacity 0.2s;
+        }
+        
+        .stat:hover {
+          opacity: 0.8;
+        }
+
+        .stat-icon {
+          font-size: 10px;
+          opacity: 0.6;
+          margin: 0;
+        }
+
+        .stat-value {
+          font-size: 13px;
+          font-weight: 700;
+          letter-spacing: -0.02em;
+        }
+
+        .stat-unit {
+          font-size: 9px;
+          font-weight: 500;
+          opacity: 0.5;
+          margin: 0;
+        }
+
+        .stat-dl .stat-value { color: #38bdf8; }
+        .stat-ul .stat-value { color: #a78bfa; }
+        .stat-ping .stat-value { color: #fbbf24; }
+
+        .action-button {
+          width: 38px;
+          height: 38px;
+          border-radius: 50%;
+          background: var(--ookla-accent-color, #0ea5e9);
+          background: linear-gradient(135deg, var(--ookla-accent-color, #0ea5e9), color-mix(in srgb, var(--ookla-accent-color, #0ea5e9) 75%, black));
+          color: white;
+          display: flex;
+          align-items: center;
+          justify-content: center;
+          font-size: 10px;
+          font-weight: 800;
+          cursor: pointer;
+          box-shadow: 0 2px 8px rgba(14, 165, 233, 0.3);
+          transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+          flex: 0 0 auto;
+          border: none;
+          letter-spacing: 0.5px;
+          white-space: nowrap;
+          padding: 0;
+        }
+
+        .action-button:hover {
+          transform: scale(1.05);
+          box-shadow: 0 4px 12px rgba(14, 165, 233, 0.4);
+        }
+
+        .action-button:active {
+          transform: scale(0.95);
+        }
+
+        .action-button.running {
+          animation: pulse-glow 1.5s cubic-bezier(0.4, 0, 0.2, 1) infinite;
+          background: linear-gradient(135deg, #10b981 0%, #059669 100%);
+          box-shadow: 0 2px 8px rgba(16, 185, 129, 0.3);
+        }
+
+        @keyframes pulse-glow {
+          0%, 100% { opacity: 1; }
+          50% { opacity: 0.8; }
+        }
+
+        /* Container query responsive adjustments - simplified to prevent wrapping */
+        @container (max-width: 320px) {
+          .stat-icon { display: none; }
+          .stats { gap: 4px; }
+          .stat-value { font-size: 11px; }
+          .stat-unit { font-size: 8px; }
+          .card { padding: 4px 8px; }
+        }
+      </style>
+
+      <div class="card">
+        <button class="action-button">GO</button>
+        <div class="stats-container">
+          <div class="stats">
+            <div class="stat stat-dl" title="${labels.download}">
+              <span class="stat-icon">⬇</span>
+              <span class="stat-value dl-value">--</span>
+              <span class="stat-unit">Mbps</span>
+            </div>
+            <div class="stat stat-ul" title="${labels.upload}">
+              <span class="stat-icon">⬆</span>
+              <span class="stat-value ul-value">--</span>
+              <span class="stat-unit">Mbps</span>
+            </div>
+            <div class="stat stat-ping" title="${labels.ping}">
+              <span class="stat-icon">⏱</span>
+              <span class="stat-value ping-value">--</span>
+              <span class="stat-unit">ms</span>
+            </div>
+          </div>
+        </div>
+      </div>
+    `;
+
+    applyCardAppearance(this.shadowRoot, this._config);
+
+    this.shadowRoot.querySelector('.action-button')?.addEventListener('click', (e) => {
+      e.stopPropagation();
+      this._runTest();
+    });
+    
+    // Interactive elements
+    const e = this._config.entities;
+    this.shadowRoot.querySelector('.stat-dl')?.addEventListener('click', (ev) => { ev.stopPropagation(); this._showMoreInfo(e.download); });
+    this.shadowRoot.querySelector('.stat-ul')?.addEventListener('click', (ev) => { ev.stopPropagation(); this._showMoreInfo(e.upload); });
+    this.shadowRoot.querySelector('.stat-ping')?.addEventListener('click', (ev) => { ev.stopPropagation(); this._showMoreInfo(e.ping); });
+  }
+}
+
+// Dashboard card: full metrics with gauges and history charts
+class OoklaSpeedtestDashboard extends HTMLElement {
+  constructor() {
+    super();
+    this.attachShadow({ mode: 'open' });
+    this._config = {};
+    this._hass = null;
+    this._history = emptyHistory();
+    this._historyStamp = null;
+    this._entitySnapshot = new Map();
+    this._renderedConfig = null;
+    this._relativeTimeTimer = null;
+  }
+
+  static async getConfigElement() {
+    await import('./ookla-speedtest-editors.js?v=3.0.5');
+    return document.createElement("ookla-speedtest-dashboard-editor");
+  }
+
+  static getStubConfig() {
+    return {
+      type: "custom:ookla-speedtest-dashboard",
+      entities: {
+        // Default sensors
+        download: "sensor.ookla_speedtest_download",
+        upload: "sensor.ookla_speedtest_upload",
+        ping: "sensor.ookla_speedtest_ping",
+        jitter: "sensor.ookla_speedtest_jitter",
+        grade: "sensor.ookla_speedtest_bufferbloat_grade",
+        isp: "sensor.ookla_speedtest_isp",
+        server: "sensor.ookla_speedtest_server",
+        last_test: "sensor.ookla_speedtest_last_test",
+        result_url: "sensor.ookla_speedtest_result_url",
+        // Latency Metrics (Optional)
+        ping_min: "sensor.ookla_speedtest_ping_min",
+        ping_max: "sensor.ookla_speedtest_ping_max",
+        dl_ping: "sensor.ookla_speedtest_download_ping",
+        dl_ping_min: "sensor.ookla_speedtest_download_ping_min",
+        dl_ping_max: "sensor.ookla_speedtest_download_ping_max",
+        ul_ping: "sensor.ookla_speedtest_upload_ping",
+        ul_ping_min: "sensor.ookla_speedtest_upload_ping_min",
+        ul_ping_max: "sensor.ookla_speedtest_upload_ping_max",
+        // Stability & Compliance (Optional)
+        dl_compliance: "sensor.ookla_speedtest_download_plan_compliance",
+        ul_compliance: "sensor.ookla_speedtest_upload_plan_compliance",
+        dl_jitter: "sensor.ookla_speedtest_download_jitter",
+        ul_jitter: "sensor.ookla_speedtest_upload_jitter"
+      },
+      labels: {
+        download: "Download",
+        upload: "Upload",
+        ping: "Ping",
+        jitter: "Jitter",
+        grade: "Grade"
+      },
+      show_gauges: true,
+      show_charts: true,
+      history_hours: 168,  // 7 days (24 * 7)
+      max_download: 1000,
+      max_upload: 500,
+      chart_points: 100,
+      chart_height: 70,
+      chart_stroke_width: 2,
+      chart_line_style: "solid",
+      chart_line_cap: "round",
+      chart_include_zero: false,
+      chart_show_area: true,
+      chart_area_opacity: 0.25,
+      chart_show_points: false,
+      chart_point_radius: 0.75,
+      chart_colors: {
+        download: "#0ea5e9",
+        upload: "#7c3aed",
+        ping: "#f59e0b"
+      },
+      chart_area_colors: {
+        download: "#0ea5e9",
+        upload: "#7c3aed",
+        ping: "#f59e0b"
+      }
+    };
+  }
+
+  setConfig(config) {
+    // Merge config but don't force stub defaults for entities
+    const stubConfig = OoklaSpeedtestDashboard.getStubConfig();
+    this._config = {
+      ...stubConfig,
+      ...config,
+      chart_colors: { ...stubConfig.chart_colors, ...(config.chart_colors || {}) },
+      chart_area_colors: { ...stubConfig.chart_area_colors, ...(config.chart_area_colors || {}) }
+    };
+
+    // Only use stub entities if user hasn't provided any entities at all
+    if (!config.entities) {
+      this._config.entities = stubConfig.entities;
+    } else {
+      // Use only the entities the user explicitly configured
+      this._config.entities = config.entities;
+    }
+    this._entitySnapshot.clear();
+    if (this.isConnected) {
+      renderIfConfigChanged(this);
+      this.updateCard();
+      this._fetchHistory();
+    }
+  }
+
+  set hass(hass) {
+    this._hass = hass;
+
+    // Only touch the DOM when one of the configured entities changed
+    if (hass && entitiesChanged(this._entitySnapshot, hass, Object.values(this._config.entities || {}))) {
+      this.updateCard();
+      // Sync history only when a new result lands on the download entity
+      const stamp = hass.states[this._config.entities?.download]?.last_updated ?? '';
+      if (stamp !== this._historyStamp) {
+        this._historyStamp = stamp;
+        this._fetchHistory();
+      }
+    }
+  }
+
+  connectedCallback() {
+    renderIfConfigChanged(this);
+    this.updateCard();
+    // Fetch history immediately if hass is already available; charts are
+    // drawn once it resolves, from the shared cache when possible
+    if (this._hass && this._config.show_charts) {
+      this._fetchHistory();
+    }
+    // Entity updates can be hours apart, so "N min ago" is kept current here
+    if (!this._relativeTimeTimer) {
+      this._relativeTimeTimer = setInterval(() => this._updateLastTest(), RELATIVE_TIME_REFRESH_MS);
+    }
+  }
+
+  disconnectedCallback() {
+    clearInterval(this._relativeTimeTimer);
+    this._relativeTimeTimer = null;
+  }
+
+  /**
+   * Card size for Masonry view (1 = 50px)
+   * This helps masonry layout calculate proper column distribution
+   * Adjust size based on enabled features
+   */
+  getCardSize() {
+    let size = 10; // Base size for metrics and footer
+    if (this._config.show_gauges) size += 3; // Add space for gauges
+    if (this._config.show_charts) size += 4; // Add space for charts
+    return size;
+  }
+
+  /**
+   * Layout options for Sections view
+   * Sections use a 12-column grid system
+   * 
+   * grid_columns: How many columns the card should occupy (1-12)
+   * grid_rows: How many rows the card should occupy (1+), each row is ~56px
+   * grid_min/max: Constraints for user resizing
+   */
+  static getLayoutOptions() {
+    return {
+      grid_columns: null,     // Automatic width
+      grid_rows: null,        // Automatic height
+    };
+  }
+
+  getLayoutOptions() {
+    return {
+      grid_columns: null,     // Automatic width
+      grid_rows: null,        // Automatic height
+    };
+  }
+
+  async _fetchHistory() {
+    if (!this._hass || !this._config.show_charts) return;
+
+    const e = this._config.entities;
+    const entities = [e.download, e.upload, e.ping].filter(id => id);
+
+    if (entities.length === 0) return;
+
+    const hours = this._config.history_hours || 168; // Default 7 days
+    const maxPoints = Math.min(Math.max(Math.round(Number(this._config.chart_points) || 100), 2), 500);
+    const key = JSON.stringify([e.download, e.upload, e.ping, hours, maxPoints]);
+    const stamp = this._hass.states[e.download]?.last_updated ?? '';
+
+    let entry = historyCache.get(key);
+    if (!entry) {
+      entry = { series: null, source: null, syncedStamp: null, pending: null };
+      historyCache.set(key, entry);
+    }
+
+    try {
+      // Join a sync another card already started for the same history
+      if (entry.pending) await entry.pending;
+      if (!entry.series || entry.syncedStamp !== stamp) {
+        entry.pending = this._syncHistory(entry, entities, hours, maxPoints)
+          .then(() => { entry.syncedStamp = stamp; })
+          .finally(() => { entry.pending = null; });
+        await entry.pending;
+      }
+      this._history = entry.series;
+    } catch (error) {
+      console.error('Failed to fetch history:', error);
+      // Fallback to current values if history fetch fails
+      const now = Date.now();
+      this._history = {
+        download: [[now, parseFloat(this._getState(e.download)) || 0]],
+        upload: [[now, parseFloat(this._getState(e.upload)) || 0]],
+        ping: [[now, parseFloat(this._getState(e.ping)) || 0]]
+      };
+    }
+
+    if (this._config.show_charts) {
+      this._drawCharts();
+    }
+  }
+
+  /**
+   * Bring a shared cache entry up to date.
+   * The first sync loads the whole window; later syncs fetch only points newer
+   * than the last cached timestamp and drop points that left the window.
+   */
+  async _syncHistory(entry, entities, hours, maxPoints) {
+    const since = entry.series ? lastHistoryTimestamp(entry.series) : null;
+
+    if (since === null) {
+      entry.series = await this._fetchIntegrationHistory(hours, maxPoints, null);
+      entry.source = entry.series ? 'integration' : 'recorder';
+      if (!entry.series) entry.series = await this._fetchRecorderHistory(entities, hours, maxPoints, null);
+      return;
+    }
+
+    const delta = entry.source === 'integration'
+      ? await this._fetchIntegrationHistory(hours, maxPoints, since) || emptyHistory()
+      : await this._fetchRecorderHistory(entities, hours, maxPoints, since);
+
+    const windowStart = Date.now() - hours * 60 * 60 * 1000;
+    let overflow = false;
+    HISTORY_KEYS.forEach(key => {
+      const merged = [...entry.series[key], ...delta[key].filter(([t]) => t > since)];
+      entry.series[key] = merged.filter(([t]) => t >= windowStart);
+      overflow ||= entry.series[key].length > maxPoints;
+    });
+
+    // Too dense for the configured resolution: reload a freshly downsampled window
+    if (overflow) {
+      entry.series = null;
+      await this._syncHistory(entry, entities, hours, maxPoints);
+    }
+  }
+
+  /**
+   * Fetch history from the integration, downsampled on the server.
+   * Returns null when the entities don't belong to the integration (or it is
+   * too old to provide the endpoint) so the caller can fall back to the recorder.
+   */
+  async _fetchIntegrationHistory(hours, maxPoints, since) {
+    const e = this._config.entities;
+    try {
+      const request = {
+        type: 'ookla_speedtest/history',
+        entity_id: e.download || e.upload || e.ping,
+        hours,
+        points: maxPoints,
+        series: HISTORY_KEYS
+      };
+      if (since !== null) request.since = since;
+      const response = await this._hass.callWS(request);
+      const history = emptyHistory();
+      HISTORY_KEYS.forEach(key => {
+        history[key] = response.series[key] || [];
+      });
+      // Results recorded before the integration kept its own history live only in the recorder
+      if (since === null && !HISTORY_KEYS.some(key => history[key].length)) return null;
+      return history;
+    } catch (error) {
+      return null;
+    }
+  }
+
+  async _fetchRecorderHistory(entities, hours, maxPoints, since) {
+    const e = this._config.entities;
+    const endTime = new Date();
+    const startTime = since !== null
+      ? new Date(since + 1)
+      : new Date(endTime.getTime() - hours * 60 * 60 * 1000);
+
+    const history = await this._hass.callWS({
+      type: 'history/history_during_period',
+      start_time: startTime.toISOString(),
+      end_time: endTime.toISOString(),
+      entity_ids: entities,
+      minimal_response: true,
+      significant_changes_only: false,
+      include_start_time_state: since === null
+    });
+
+    // Process history data
+    const result = emptyHistory();
+
+    if (history) {
+      // History is an object with entity_id as keys
+      entities.forEach((entityId) => {
+        const entityHistory = history[entityId];  // Access by entity ID key
+        let key = null;
+
+        if (entityId === e.download) key = 'download';
+        else if (entityId === e.upload) key = 'upload';
+        else if (entityId === e.ping) key = 'ping';
+
+        if (key && entityHistory && Array.isArray(entityHistory)) {
+          entityHistory.forEach(state => {
+            // Handle both minimal and full response formats
+            const value = parseFloat(state.s || state.state);
+            const timestamp = state.lu !== undefined ? state.lu * 1000 : Date.parse(state.last_updated);
+            if (!isNaN(value) && value >= 0 && !isNaN(timestamp)) {
+              result[key].push([Math.round(timestamp), value]);
+            }
+          });
+        }
+      });
+
+      // Sample recorder history to the configured chart density.
+      HISTORY_KEYS.forEach(key => {
+        const data = result[key];
+        if (data.length > maxPoints) {
+          const step = Math.ceil(data.length / maxPoints);
+          result[key] = data.filter((_, i) => i % step === 0);
+        }
+      });
+    }
+
+    return result;
+  }
+
+  updateCard() {
+    if (!this._hass) return;
+
+    const e = this._config.entities;
+
+    // Main Metrics
+    this._updateMetricValue('.metric-dl', e.download, ' Mbps', true);
+    this._updateMetricValue('.metric-ul', e.upload, ' Mbps', true);
+    this._updateMetricValue('.metric-ping', e.ping, ' ms');
+    this._updateMetricValue('.metric-jitter', e.jitter, ' ms');
+
+    // Update gauges if enabled
+    if (this._config.show_gauges) {
+      const download = parseFloat(this._getState(e.download)) || 0;
+      const upload = parseFloat(this._getState(e.upload)) || 0;
+      this._updateGauge('download', download, this._config.max_download);
+      this._updateGauge('upload', upload, this._config.max_upload);
+    }
+
+    // Grade with color
+    const gradeVal = this._getState(e.grade);
+    const gradeEl = this.shadowRoot.querySelector('.metric-grade .value');
+    if (gradeVal) {
+      const colors = { 'A+': '#22c55e', 'A': '#22c55e', 'B': '#84cc16', 'C': '#eab308' };
+      const color = colors[gradeVal] || '#ef4444';
+      patchHTML(gradeEl, `<span style="color:${color}">${gradeVal}</span>`);
+    }
+
+    // Optional Metrics
+    const optionalFields = [
+      { key: 'ping_min', suffix: ' ms' }, { key: 'ping_max', suffix: ' ms' },
+      { key: 'dl_ping', suffix: ' ms' }, { key: 'dl_ping_min', suffix: ' ms' }, { key: 'dl_ping_max', suffix: ' ms' },
+      { key: 'ul_ping', suffix: ' ms' }, { key: 'ul_ping_min', suffix: ' ms' }, { key: 'ul_ping_max', suffix: ' ms' },
+      { key: 'dl_compliance', suffix: '%' }, { key: 'ul_compliance', suffix: '%' },
+      { key: 'dl_jitter', suffix: ' ms' }, { key: 'ul_jitter', suffix: ' ms' }
+    ];
+
+    optionalFields.forEach(field => {
+      const entityId = e[field.key];
+      const el = this.shadowRoot.querySelector(`.metric-${field.key.replace(/_/g, '-')}`);
+      if (el) {
+        const state = this._getState(entityId);
+        const valueEl = el.querySelector('.value');
+        patchText(valueEl, (state !== null ? state : '--') + field.suffix);
+        patchStyle(el, 'display', (entityId && this._hass.states[entityId]) ? 'block' : 'none');
+      }
+    });
+
+    // ISP and server
+    patchAttribute(this.shadowRoot.querySelector('.isp-name'), 'data-text', this._getState(e.isp) || 'Unknown ISP');
+    patchAttribute(this.shadowRoot.querySelector('.server-name'), 'data-text', this._getState(e.server) || 'Unknown Server');
+
+    // Last test
+    this._updateLastTest();
+
+    // Result link
+    const resultUrl = this._getState(e.result_url);
+    const linkEl = this.shadowRoot.querySelector('.result-link');
+    if (linkEl) {
+      if (resultUrl && resultUrl.startsWith('http')) {
+        if (linkEl.href !== resultUrl) linkEl.href = resultUrl;
+        patchStyle(linkEl, 'display', 'inline-flex');
+      } else {
+        patchStyle(linkEl, 'display', 'none');
+      }
+    }
+  }
+
+  _updateMetricValue(selector, entityId, suffix = '', round = false) {
+    const el = this.shadowRoot.querySelector(selector + ' .value');
+    if (!el) return;
+    let val = this._getState(entityId);
+    if (val !== null) {
+      if (round) val = Math.round(parseFloat(val));
+      patchAttribute(el, 'data-val', val + suffix);
+    } else {
+      patchAttribute(el, 'data-val', '--' + suffix);
+    }
+  }
+
+  _updateGauge(type, value, max) {
+    const gauge = this.shadowRoot.querySelector(`.gauge-${type} .gauge-fill`);
+    const valueEl = this.shadowRoot.querySelector(`.gauge-${type} .gauge-value`);
+
+    if (!gauge || !valueEl) return;
+
+    const numValue = parseFloat(value) || 0;
+    const percentage = Math.min((numValue / max) * 100, 100);
+
+    // Calculate stroke dashoffset for SVG circle (270 degrees)
+    const maxArc = 424;
+    const offset = maxArc * (1 - percentage / 100);
+
+    patchStyle(gauge, 'stroke-dashoffset', offset);
+
+    // Color based on percentage
+    let color = '#ef4444'; // red
+    if (percentage >= 50) color = '#22d3ee'; // cyan
+    if (percentage >= 80) color = '#22c55e'; // green
+
+    patchStyle(gauge, 'stroke', color);
+    patchText(valueEl, Math.round(numValue));
+    patchStyle(valueEl, 'color', color);
+  }
+
+  _drawCharts() {
+    if (!this._config.show_charts) return;
+
+    ['download', 'upload', 'ping'].forEach(type => {
+      const svg = this.shadowRoot.querySelector(`.chart-${type} svg`);
+      if (!svg) return;
+      svg.style.height = `${Math.min(Math.max(Number(this._config.chart_height) || 70, 30), 200)}px`;
+
+      const data = this._history[type] || [];
+
+      // Need at least 1 data point to draw
+      if (data.length === 0) {
+        svg.innerHTML = '<text x="50" y="20" text-anchor="middle" fill="#64748b" font-size="8">No data</text>';
+        return;
+      }
+
+      // If only 1 point, duplicate it to draw a line
+      const chartData = data.length === 1 ? [data[0], [data[0][0] + 1, data[0][1]]] : data;
+      const values = chartData.map(([, val]) => val);
+
+      const max = Math.max(...values, 1);
+      const min = this._config.chart_include_zero ? 0 : Math.min(...values);
+      const range = max - min || 1;
+      const width = 100;
+      const height = 40;
+
+      // Plot by timestamp so gaps between tests keep their real spacing
+      const start = chartData[0][0];
+      const span = chartData[chartData.length - 1][0] - start || 1;
+      const points = chartData.map(([t, val]) => {
+        const x = ((t - start) / span) * width;
+        const y = height - ((val - min) / range) * height;
+        return [x, y];
+      });
+
+      const areaPoints = [[0, height], ...points, [width, height]].map(p => `${p[0]},${p[1]}`).join(' ');
+      const linePoints = points.map(p => `${p[0]},${p[1]}`).join(' ');
+
+      const stroke = this._chartColor(type, 'chart_colors');
+      const areaColor = this._chartColor(type, 'chart_area_colors');
+      const strokeWidth = Math.min(Math.max(Number(this._config.chart_stroke_width) || 2, 0.5), 10);
+      const areaOpacity = Math.min(Math.max(Number(this._config.chart_area_opacity) || 0, 0), 1);
+      const lineCap = ['butt', 'round', 'square'].includes(this._config.chart_line_cap) ? this._config.chart_line_cap : 'round';
+      const dashArrays = { solid: '', dashed: '6 4', dotted: '1 4' };
+      const dashArray = dashArrays[this._config.chart_line_style] ?? '';
+      const dashAttribute = dashArray ? ` stroke-dasharray="${dashArray}"` : '';
+      const area = this._config.chart_show_area === false ? '' :
+        `<polygon points="${areaPoints}" fill="url(#grad-${type})" />`;
+      const pointRadius = Math.min(Math.max(Number(this._config.chart_point_radius) || 0.75, 0.25), 4);
+      const pointMarkers = this._config.chart_show_points === true
+        ? points.map(([x, y]) => `<circle cx="${x}" cy="${y}" r="${pointRadius}" fill="${stroke}" />`).join('')
+        : '';
+
+      svg.innerHTML = `
+        <defs>
+          <linearGradient id="grad-${type}" x1="0%" y1="0%" x2="0%" y2="100%">
+            <stop offset="0%" style="stop-color:${areaColor};stop-opacity:${areaOpacity}" />
+            <stop offset="100%" style="stop-color:${areaColor};stop-opacity:0" />
+          </linearGradient>
+        </defs>
+        ${area}
+        <polyline points="${linePoints}" fill="none" stroke="${stroke}" stroke-width="${strokeWidth}" vector-effect="non-scaling-stroke" stroke-linecap="${lineCap}" stroke-linejoin="round"${dashAttribute}/>
+        ${pointMarkers}
+      `;
+    });
+  }
+
+  _chartColor(type, configKey) {
+    const defaults = { download: '#0ea5e9', upload: '#7c3aed', ping: '#f59e0b' };
+    const color = this._config[configKey]?.[type];
+    if (typeof color !== 'string' || /["'<>;&]/.test(color)) return defaults[type];
+    return globalThis.CSS?.supports?.('color', color) ? color : defaults[type];
+  }
+
+  _getState(entityId) {
+    if (!this._hass || !entityId) return null;
+    const state = this._hass.states[entityId];
+    return state ? state.state : null;
+  }
+
+  _updateLastTest() {
+    if (!this._hass) return;
+    const lastTestEl = this.shadowRoot.querySelector('.last-test');
+    patchText(lastTestEl, this._formatTime(this._getState(this._config.entities?.last_test)));
+  }
+
+  _formatTime(dateStr) {
+    if (!dateStr || dateStr === 'unknown' || dateStr === 'unavailable') return 'Never tested';
+    try {
+      const date = new Date(dateStr);
+      const now = new Date();
+      const diff = Math.floor((now - date) / 1000);
+      if (diff < 60) return 'Just now';
+      if (diff < 3600) return `${Math.floor(diff / 60)} min ago`;
+      if (diff < 86400) return `${Math.floor(diff / 3600)} hours ago`;
+      return date.toLocaleDateString();
+    } catch { return dateStr; }
+  }
+
+  _showMoreInfo(entityId) {
+    if (!entityId) return;
+    const event = new CustomEvent('hass-more-info', { bubbles: true, composed: true, detail: { entityId } });
+    this.dispatchEvent(event);
+  }
+
+    render() {
+      const e = this._config.entities;
+      const labels = this._config.labels || { download: 'Download', upload: 'Upload', ping: 'Ping', jitter: 'Jitter', grade: 'Grade' };
+      
+      this.shadowRoot.innerHTML = `
+        <style>
+          :host {
+            display: block;
+            width: 100%;
+            height: 100%;
+            box-sizing: border-box;
+            container-type: inline-size;
+          }
+  
+          * {
+            box-sizing: border-box;
+          }
+  
+          .card {
+            background: var(--ha-card-background, var(--card-background-color, rgba(15, 23, 42, 0.6)));
+            backdrop-filter: blur(20px);
+            -webkit-backdrop-filter: blur(20px);
+            border-radius: var(--ha-card-border-radius, 12px);
+            padding: 12px;
+            padding-left: max(12px, env(safe-area-inset-left));
+            padding-right: max(12px, env(safe-area-inset-right));
+            border: 1px solid var(--ha-card-border-color, var(--divider-color, rgba(255, 255, 255, 0.08)));
+            box-shadow: var(--ha-card-box-shadow, none);
+            color: var(--primary-text-color, #f8fafc);
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+            width: 100%;
+            height: 100%;
+            min-height: 0;
+            display: flex;
+            flex-direction: column;
+            overflow: auto;
+            /* Ensure card fills available space in sections view */
+            flex: 1;
+            direction: ltr;
+          }
+          .header { margin-bottom: 10px; display: flex; justify-content: space-between; align-items: flex-start; flex-shrink: 0; }
+          .isp-name { font-size: 18px; font-weight: 700; margin-bottom: 4px; color: var(--primary-text-color, #f8fafc); }
+          .isp-name::before { content: attr(data-text); }
+          .server-name { font-size: 12px; color: var(--secondary-text-color, #94a3b8); display: flex; align-items: center; gap: 6px; }
+          .server-name::before { content: attr(data-text); }
+          
+          .metrics-grid {
+            display: grid;
+            grid-template-columns: repeat(5, 1fr);
+            gap: 8px;
+            margin-bottom: 10px;
+            flex-shrink: 0;
+          }
+          .metric {
+            background: var(--secondary-background-color, rgba(255,255,255,0.03));
+            border-radius: 12px;
+            padding: 8px 4px;
+            text-align: center;
+            border: 1px solid var(--divider-color, rgba(255,255,255,0.02));
+            cursor: pointer;
+            transition: all 0.2s;
+            touch-action: manipulation;
+            -webkit-tap-highlight-color: transparent;
+          }
+          .metric:hover { transform: translateY(-2px); background: var(--secondary-background-color, rgba(255,255,255,0.05)); }
+          .metric:active { transform: translateY(0); background: var(--secondary-background-color, rgba(255,255,255,0.07)); }
+          .metric .label { font-size: 9px; color: var(--secondary-text-color, #94a3b8); text-transform: uppercase; letter-spacing: 0.5px; margin-bottom: 4px; font-weight: 600; }
+          .metric .value { font-size: 16px; font-weight: 700; line-height: 1; }
+          .metric .value::before { content: attr(data-val); }
+  
+          .optional-grid {
+            display: grid;
+            grid-template-columns: repeat(4, 1fr);
+            gap: 6px;
+            margin-bottom: 10px;
+            border-top: 1px solid var(--divider-color, rgba(255,255,255,0.05));
+            padding-top: 10px;
+            flex-shrink: 0;
+          }
+          .optional-grid .metric { padding: 6px 4px; }
+          .optional-grid .metric .value { font-size: 12px; }
+  
+          .metric-dl .value { color: #38bdf8; }
+          .metric-ul .value { color: #a78bfa; }
+          .metric-ping .value { color: #fbbf24; }
+          .metric-jitter .value { color: #f472b6; }
+  
+          /* Gauge Styles */
+          .gauges-container {
+            display: flex;
+            justify-content: center;
+            gap: 16px;
+            margin: 10px 0;
+            flex-shrink: 0;
+          }
+  
+          .gauge {
+            position: relative;
+            width: 110px;
+            height: 110px;
+            flex-shrink: 0;
+          }
+  
+          .gauge-svg {
+            transform: rotate(135deg);
+            width: 100%;
+            height: 100%;
+          }
+  
+          .gauge-bg {
+            fill: none;
+            stroke: var(--divider-color, rgba(255,255,255,0.05));
+            stroke-width: 10;
+            stroke-linecap: round;
+            stroke-dasharray: 424 566;
+            stroke-dashoffset: 0;
+          }
+  
+          .gauge-fill {
+            fill: none;
+            stroke-width: 10;
+            stroke-linecap: round;
+            stroke-dasharray: 424 566;
+            stroke-dashoffset: 424;
+            transition: stroke-dashoffset 1s cubic-bezier(0.4, 0, 0.2, 1), stroke 0.3s ease;
+            filter: drop-shadow(0 0 4px currentColor);
+          }
+  
+          .gauge-content {
+            position: absolute;
+            top: 50%;
+            left: 50%;
+            transform: translate(-50%, -50%);
+            text-align: center;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+          }
+  
+          .gauge-label {
+            font-size: 9px;
+            color: var(--secondary-text-color, #94a3b8);
+            text-transform: uppercase;
+            letter-spacing: 1px;
+            margin-bottom: 4px;
+            font-weight: 600;
+          }
+  
+          .gauge-value {
+            font-size: 24px;
+            font-weight: 800;
+            color: var(--primary-text-color, #fff);
+            line-height: 1;
+            letter-spacing: -0.5px;
+            text-shadow: 0 2px 8px rgba(0,0,0,0.3);
+          }
+  
+          .gauge-unit {
+            font-size: 9px;
+            color: var(--secondary-text-color, #64748b);
+            margin-top: 2px;
+            font-weight: 500;
+          }
+  
+          .charts-section {
+            display: grid;
+            grid-template-columns: repeat(3, 1fr);
+            gap: 8px;
+            margin-bottom: 10px;
+            flex-shrink: 0;
+            min-height: 100px;
+          }
+          .chart-box {
+            background: var(--secondary-background-color, rgba(15, 23, 42, 0.4));
+            border-radius: 16px;
+            padding: 8px;
+            border: 1px solid var(--divider-color, rgba(255,255,255,0.03));
+            cursor: pointer;
+            display: flex;
+            flex-direction: column;
+            min-height: 90px;
+            touch-action: manipulation;
+            -webkit-tap-highlight-color: transparent;
+            transition: all 0.2s;
+          }
+          .chart-box:hover { background: var(--secondary-background-color, rgba(15, 23, 42, 0.5)); }
+          .chart-box:active { transform: scale(0.98); background: var(--secondary-background-color, rgba(15, 23, 42, 0.6)); }
+          .chart-title { font-size: 10px; color: var(--secondary-text-color, #94a3b8); text-transform: uppercase; margin-bottom: 6px; font-weight: 600; }
+          .chart-box svg { width: 100%; height: 70px; overflow: visible; }
+          
+          .footer {
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
+            padding-top: 10px;
+            border-top: 1px solid var(--divider-color, rgba(255,255,255,0.05));
+            flex-shrink: 0;
+          }
+          .last-test { font-size: 11px; color: var(--secondary-text-color, #64748b); }
+          .run-btn {
+            padding: 6px 15px; border: none; border-radius: 20px;
+            background: var(--ookla-accent-color, #0ea5e9);
+            background: linear-gradient(135deg, var(--ookla-accent-color, #0ea5e9), color-mix(in srgb, var(--ookla-accent-color, #0ea5e9) 75%, black));
+            color: white; font-size: 12px; font-weight: 600; cursor: pointer; transition: all 0.2s;
+            min-height: 32px;
+            min-width: 80px;
+            touch-action: manipulation;
+            -webkit-tap-highlight-color: transparent;
+          }
+          .run-btn:active { transform: scale(0.95); }
+          .run-btn.running { background: #10b981; animation: pulse 1.5s infinite; }
+          @keyframes pulse { 0% { opacity: 1; } 50% { opacity: 0.7; } 100% { opacity: 1; } }
+          .result-link {
+            color: var(--ookla-accent-color, #38bdf8); text-decoration: none; font-size: 11px;
+            min-height: 32px;
+            display: inline-flex;
+            align-items: center;
+            touch-action: manipulation;
+            -webkit-tap-highlight-color: transparent;
+          }
+          .result-link:active { transform: scale(0.95); }
+  
+          /* Container query responsive adjustments */
+          @container (max-width: 500px) {
+            .card { padding: 14px; }
+            .isp-name { font-size: 16px; }
+            .server-name { font-size: 11px; }
+            .metrics-grid { grid-template-columns: repeat(3, 1fr); gap: 8px; }
+            .metric .label { font-size: 8px; }
+            .metric .value { font-size: 14px; }
+            .optional-grid { grid-template-columns: repeat(3, 1fr); gap: 6px; }
+            .optional-grid .metric { padding: 6px 3px; }
+            .optional-grid .metric .value { font-size: 11px; }
+            .optional-grid .metric .label { font-size: 7px; }
+            .gauge { width: 110px; height: 110px; }
+            .gauge-value { font-size: 22px; }
+            .gauge-label { font-size: 8px; }
+            .gauge-unit { font-size: 8px; }
+            .charts-section { grid-template-columns: 1fr; gap: 8px; }
+            .chart-title { font-size: 9px; }
+          }
+  
+          @container (max-width: 400px) {
+            .card { padding: 12px; }
+            .header { margin-bottom: 10px; }
+            .isp-name { font-size: 15px; }
+            .server-name { font-size: 10px; }
+            .metrics-grid { grid-template-columns: repeat(3, 1fr); gap: 6px; margin-bottom: 10px; }
+            .metric { padding: 8px 4px; border-radius: 10px; }
+            .metric .label { font-size: 7px; letter-spacing: 0.3px; }
+            .metric .value { font-size: 13px; }
+            .optional-grid { grid-template-columns: repeat(3, 1fr); gap: 5px; padding-top: 10px; margin-bottom: 10px; }
+            .optional-grid .metric { padding: 5px 3px; }
+            .optional-grid .metric .value { font-size: 10px; }
+            .optional-grid .metric .label { font-size: 7px; }
+            .gauges-container { gap: 10px; margin: 12px 0; }
+            .gauge { width: 100px; height: 100px; }
+            .gauge-value { font-size: 20px; }
+            .gauge-label { font-size: 7px; letter-spacing: 0.5px; }
+            .gauge-unit { font-size: 7px; }
+            .gauge-bg, .gauge-fill { stroke-width: 9; }
+            .charts-section { margin-bottom: 10px; }
+            .chart-box { padding: 8px; border-radius: 12px; }
+            .chart-title { font-size: 8px; margin-bottom: 6px; }
+            .footer { padding-top: 10px; flex-direction: column; gap: 8px; align-items: flex-start; }
+            .last-test { font-size: 10px; }
+            .run-btn { font-size: 11px; padding: 5px 12px; align-self: stretch; text-align: center; }
+            .result-link { font-size: 10px; padding: 5px 10px; }
+          }
+  
+          @container (max-width: 320px) {
+            .card { padding: 10px; }
+            .isp-name { font-size: 14px; }
+            .server-name { font-size: 9px; }
+            .metrics-grid { grid-template-columns: repeat(2, 1fr); gap: 5px; }
+            .metric { padding: 6px 3px; }
+            .metric .label { font-size: 7px; }
+            .metric .value { font-size: 12px; }
+            .optional-grid { grid-template-columns: repeat(2, 1fr); gap: 4px; }
+            .optional-grid .metric { padding: 4px 2px; }
+            .optional-grid .metric .value { font-size: 9px; }
+            .optional-grid .metric .label { font-size: 6px; }
+            .gauges-container { flex-direction: column; gap: 8px; margin: 10px 0; }
+            .gauge { width: 90px; height: 90px; }
+            .gauge-value { font-size: 18px; }
+            .gauge-label { font-size: 7px; }
+            .gauge-unit { font-size: 7px; }
+            .gauge-bg, .gauge-fill { stroke-width: 8; }
+            .chart-box { padding: 6px; }
+            .chart-title { font-size: 7px; }
+            .footer { gap: 6px; }
+            .last-test { font-size: 9px; }
+            .run-btn { font-size: 10px; padding: 4px 10px; border-radius: 16px; }
+          }
+  
+          @container (max-width: 280px) {
+            .card { padding: 8px; }
+            .header { margin-bottom: 8px; }
+            .metrics-grid { gap: 4px; margin-bottom: 8px; }
+            .optional-grid { gap: 3px; margin-bottom: 8px; padding-top: 8px; }
+            .gauges-container { margin: 8px 0; }
+            .gauge { width: 80px; height: 80px; }
+            .gauge-value { font-size: 16px; }
+            .gauge-label { font-size: 6px; }
+            .gauge-unit { font-size: 6px; }
+            .charts-section { gap: 6px; margin-bottom: 8px; }
+            .footer { padding-top: 8px; }
+          }
+  </style>
+        
+        <div class="card">
+          <div class="header">
+            <div class="isp-info">
+              <div class="isp-name" data-text="Loading..."></div>
+              <div class="server-name" data-text="-"></div>
+            </div>
+            <a href="#" class="result-link" target="_blank" rel="noopener" style="display:none;">View Results ↗</a>
+          </div>
+          
+          <div class="metrics-grid">
+            <div class="metric metric-dl" id="m-dl"><div class="label">${labels.download}</div><div class="value"></div></div>
+            <div class="metric metric-ul" id="m-ul"><div class="label">${labels.upload}</div><div class="value"></div></div>
+            <div class="metric metric-ping" id="m-ping"><div class="label">${labels.ping}</div><div class="value"></div></div>
+            <div class="metric metric-jitter" id="m-jitter"><div class="label">${labels.jitter}</div><div class="value"></div></div>
+            <div class="metric metric-grade" id="m-grade"><div class="label">${labels.grade}</div><div class="value">-</div></div>
+          </div>
+        <div class="optional-grid" id="opt-grid">
+          <div class="metric metric-ping-min" id="m-pmin"><div class="label">Ping Min</div><div class="value"></div></div>
+          <div class="metric metric-ping-max" id="m-pmax"><div class="label">Ping Max</div><div class="value"></div></div>
+          <div class="metric metric-dl-ping" id="m-dlp"><div class="label">DL Ping</div><div class="value"></div></div>
+          <div class="metric metric-dl-jitter" id="m-dlj"><div class="label">DL Jitter</div><div class="value"></div></div>
+          <div class="metric metric-ul-ping" id="m-ulp"><div class="label">UL Ping</div><div class="value"></div></div>
+          <div class="metric metric-ul-jitter" id="m-ulj"><div class="label">UL Jitter</div><div class="value"></div></div>
+          <div class="metric metric-dl-compliance" id="m-dlc"><div class="label">DL Plan</div><div class="value"></div></div>
+          <div class="metric metric-ul-compliance" id="m-ulc"><div class="label">UL Plan</div><div class="value"></div></div>
+        </div>
+
+        ${this._config.show_gauges ? `
+        <div class="gauges-container">
+          <div class="gauge gauge-download">
+            <svg class="gauge-svg" viewBox="0 0 200 200">
+              <defs>
+                <linearGradient id="grad-download-dash" x1="0%" y1="0%" x2="100%" y2="0%">
+                  <stop offset="0%" style="stop-color:var(--ookla-accent-color, #0ea5e9);stop-opacity:1" />
+                  <stop offset="100%" style="stop-color:#22d3ee;stop-opacity:1" />
+                </linearGradient>
+              </defs>
+              <circle class="gauge-bg" cx="100" cy="100" r="90"></circle>
+              <circle class="gauge-fill" cx="100" cy="100" r="90" stroke="url(#grad-download-dash)"></circle>
+            </svg>
+            <div class="gauge-content">
+              <div class="gauge-label">${labels.download}</div>
+              <div class="gauge-value">0</div>
+              <div class="gauge-unit">Mbps</div>
+            </div>
+          </div>
+
+          <div class="gauge gauge-upload">
+            <svg class="gauge-svg" viewBox="0 0 200 200">
+              <defs>
+                <linearGradient id="grad-upload-dash" x1="0%" y1="0%" x2="100%" y2="0%">
+                  <stop offset="0%" style="stop-color:#7c3aed;stop-opacity:1" />
+                  <stop offset="100%" style="stop-color:#a78bfa;stop-opacity:1" />
+                </linearGradient>
+              </defs>
+              <circle class="gauge-bg" cx="100" cy="100" r="90"></circle>
+              <circle class="gauge-fill" cx="100" cy="100" r="90" stroke="url(#grad-upload-dash)"></circle>
+            </svg>
+            <div class="gauge-content">
+              <div class="gauge-label">${labels.upload}</div>
+              <div class="gauge-value">0</div>
+              <div class="gauge-unit">Mbps</div>
+            </div>
+          </div>
+        </div>
+        ` : ''}
+
+        ${this._config.show_charts ? `
+        <div class="charts-section">
+          <div class="chart-box chart-download" id="c-dl"><div class="chart-title">${labels.download}</div><svg viewBox="0 0 100 40" preserveAspectRatio="none"></svg></div>
+          <div class="chart-box chart-upload" id="c-ul"><div class="chart-title">${labels.upload}</div><svg viewBox="0 0 100 40" preserveAspectRatio="none"></svg></div>
+          <div class="chart-box chart-ping" id="c-ping"><div class="chart-title">${labels.ping}</div><svg viewBox="0 0 100 40" preserveAspectRatio="none"></svg></div>
+        </div>
+        ` : ''}
+        
+        <div class="footer">
+          <span class="last-test">Never tested</span>
+          <button class="run-btn" id="run">▶ Run Test</button>
+        </div>
+      </div>
+    `;
+
+    applyCardAppearance(this.shadowRoot, this._config);
+
+    // Event Listeners
+    const clickMap = {
+      '#m-dl': e.download, '#m-ul': e.upload, '#m-ping': e.ping, '#m-jitter': e.jitter, '#m-grade': e.grade,
+      '#m-pmin': e.ping_min, '#m-pmax': e.ping_max, '#m-dlp': e.dl_ping, '#m-dlj': e.dl_jitter,
+      '#m-ulp': e.ul_ping, '#m-ulj': e.ul_jitter, '#m-dlc': e.dl_compliance, '#m-ulc': e.ul_compliance,
+      '#c-dl': e.download, '#c-ul': e.upload, '#c-ping': e.ping, '#run': null
+    };
+
+    Object.entries(clickMap).forEach(([id, ent]) => {
+      const el = this.shadowRoot.querySelector(id);
+      if (!el) return;
+      if (id === '#run') el.onclick = () => {
+        this._hass.callService('ookla_speedtest', 'run_speedtest');
+        el.classList.add('running');
+        setTimeout(() => el.classList.remove('running'), 5000);
+      };
+      else el.onclick = () => this._showMoreInfo(ent);
+    });
+  }
+}
+
+// Simple card: fixed default entities, no configuration needed
+class OoklaSpeedtestCardSimple extends HTMLElement {
+  constructor() {
+    super();
+    this.attachShadow({ mode: 'open' });
+    this._config = {};
+    this._hass = null;
+    this._entitySnapshot = new Map();
+    this._renderedConfig = null;
+  }
+
+  static async getConfigElement() {
+    await import('./ookla-speedtest-editors.js?v=3.0.5');
+    return document.createElement("ookla-speedtest-card-simple-editor");
+  }
+
+  static getStubConfig() {
+    return {
+      type: "custom:ookla-speedtest-card-simple"
+    };
+  }
+
+  setConfig(config) {
+    this._config = config;
+    renderIfConfigChanged(this);
+    this.update();
+  }
+
+  set hass(hass) {
+    this._hass = hass;
+    // Only touch the DOM when one of the speedtest entities changed
+    if (entitiesChanged(this._entitySnapshot, hass, [SIMPLE_DOWNLOAD_ENTITY, SIMPLE_UPLOAD_ENTITY, SIMPLE_PING_ENTITY])) {
+      this.update();
+    }
+  }
+
+  /**
+   * Card size for Masonry view (1 = 50px)
+   * This helps masonry layout calculate proper column distribution
+   */
+  getCardSize() {
+    return 6; // ~300px height
+  }
+
+  /**
+   * Layout options for Sections view
+   * Sections use a 12-column grid system
+   * 
+   * grid_columns: How many columns the card should occupy (1-12)
+   * grid_rows: How many rows the card should occupy (1+), each row is ~56px
+   * grid_min/max: Constraints for user resizing
+   */
+  static getLayoutOptions() {
+    return {
+      grid_columns: null,     // Automatic width
+      grid_rows: null,        // Automatic height
+    };
+  }
+
+  getLayoutOptions() {
+    return {
+      grid_columns: null,     // Automatic width
+      grid_rows: null,        // Automatic height
+    };
+  }
+
+  update() {
+    if (!this._hass) return;
+    
+    const download = this._hass.states[SIMPLE_DOWNLOAD_ENTITY];
+    const upload = this._hass.states[SIMPLE_UPLOAD_ENTITY];
+    const ping = this._hass.states[SIMPLE_PING_ENTITY];
+    
+    const dlEl = this.shadowRoot.querySelector('.dl');
+    const ulEl = this.shadowRoot.querySelector('.ul');
+    const pingEl = this.shadowRoot.querySelector('.ping');
+    
+    patchText(dlEl, download ? download.state + ' Mbps' : '--');
+    patchText(ulEl, upload ? upload.state + ' Mbps' : '--');
+    patchText(pingEl, ping ? ping.state + ' ms' : '--');
+  }
+
+  render() {
+    this.shadowRoot.innerHTML = `
+      <style>
+        :host {
+          display: block;
+          width: 100%;
+          height: 100%;
+          box-sizing: border-box;
+          container-type: inline-size;
+        }
+
+        * {
+          box-sizing: border-box;
+        }
+
+        .card {
+          background: var(--ha-card-background, var(--card-background-color, rgba(15, 23, 42, 0.6)));
+          backdrop-filter: blur(20px);
+          -webkit-backdrop-filter: blur(20px);
+          color: var(--primary-text-color, #f8fafc);
+          padding: 16px;
+          border-radius: var(--ha-card-border-radius, 12px);
+          font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+          border: 1px solid var(--ha-card-border-color, var(--divider-color, rgba(255, 255, 255, 0.08)));
+          box-shadow: var(--ha-card-box-shadow, none);
+          width: 100%;
+          height: 100%;
+          min-height: 0;
+          display: flex;
+          flex-direction: column;
+          justify-content: center;
+          /* Ensure card fills available space in sections view */
+          flex: 1;
+          direction: ltr;
+        }
+        .title { font-size: 18px; margin-bottom: 10px; font-weight: 700; }
+        .row { 
+          display: flex; 
+          justify-content: space-between; 
+          margin: 8px 0;
+          gap: 10px;
+        }
+        .btn { 
+          background: var(--ookla-accent-color, #0ea5e9);
+          background: linear-gradient(135deg, var(--ookla-accent-color, #0ea5e9), color-mix(in srgb, var(--ookla-accent-color, #0ea5e9) 75%, black));
+          color: white; 
+          border: none; 
+          padding: 12px 30px; 
+          border-radius: 30px;
+          font-size: 16px;
+          font-weight: 700;
+          cursor: pointer;
+          margin-top: 10px;
+          width: 100%;
+          transition: all 0.2s;
+        }
+        .btn:hover { opacity: 0.9; transform: scale(1.02); }
+      </style>
+      <div class="card">
+        <div class="title">🌐 Speedtest</div>
+        <div class="row"><span>⬇ Download:</span> <span class="dl">--</span></div>
+        <div class="row"><span>⬆ Upload:</span> <span class="ul">--</span></div>
+        <div class="row"><span>⏱ Ping:</span> <span class="ping">--</span></div>
+        <button class="btn">GO</button>
+      </div>
+    `;
+
+    applyCardAppearance(this.shadowRoot, this._config);
+    
+    const btn = this.shadowRoot.querySelector('.btn');
+    if (btn) {
+      btn.addEventListener('click', () => {
+        if (this._hass) {
+          this._hass.callService('ookla_speedtest', 'run_speedtest');
+          btn.textContent = 'Testing...';
+          setTimeout(() => btn.textContent = 'GO', 3000);
+        }
+      });
+    }
+  }
+}
+
+// Register the cards; a legacy resource may load this module a second time
+const CARD_ELEMENTS = {
+  "ookla-speedtest-card": OoklaSpeedtestCard,
+  "ookla-speedtest-minimal": OoklaSpeedtestMinimal,
+  "ookla-speedtest-compact": OoklaSpeedtestCompact,
+  "ookla-speedtest-dashboard": OoklaSpeedtestDashboard,
+  "ookla-speedtest-card-simple": OoklaSpeedtestCardSimple,
+};
+
+Object.entries(CARD_ELEMENTS).forEach(([tag, element]) => {
+  if (!customElements.get(tag)) customElements.define(tag, element);
+});
+
+// Add to card picker
+const CARD_PICKER_ENTRIES = [
+  {
+    type: "ookla-speedtest-card",
+    name: "Ookla Speedtest",
+    description: "Beautiful Ookla-style speedtest interface with radial gauges",
+    preview: true,
+    documentationURL: "https://github.com/soulripper13/hass-speedtest-ookla"
+  },
+  {
+    type: "ookla-speedtest-minimal",
+    name: "Ookla Speedtest - Minimal",
+    description: "Clean minimal speedtest card with large typography",
+    preview: true
+  },
+  {
+    type: "ookla-speedtest-compact",
+    name: "Ookla Speedtest - Compact (Bubble Style)",
+    description: "Minimalist pill-shaped card inspired by Bubble Card design - perfect for side panels",
+    preview: true
+  },
+  {
+    type: "ookla-speedtest-dashboard",
+    name: "Ookla Speedtest - Dashboard",
+    description: "Fully configurable dashboard with gauges, charts, and 20+ sensors",
+    preview: true
+  },
+  {
+    type: "ookla-speedtest-card-simple",
+    name: "Ookla Speedtest - Simple Test",
+    description: "Simplified test version"
+  }
+];
+
+window.customCards = window.customCards || [];
+CARD_PICKER_ENTRIES.forEach(entry => {
+  if (!window.customCards.some(card => card.type === entry.type)) window.customCards.push(entry);
+});
+
+console.info("%c OOKLA SPEEDTEST CARDS %c v3.0.5 ", "background: #00d2ff; color: #fff; font-weight: bold;", "background: #1e293b; color: #fff;");
@@ -0,0 +1,726 @@
+/**
+ * Ookla Speedtest Card Editors for Home Assistant
+ * Visual editors for the cards in ookla-speedtest-cards.js. Loaded on demand
+ * from each card's getConfigElement().
+ *
+ * Version: 3.0.5
+ */
+
+import { createAppearanceEditor } from './ookla-speedtest-card-utils.js?v=3.0.5';
+
+class OoklaSpeedtestCardEditor extends HTMLElement {
+  setConfig(config) {
+    this._config = config;
+    this.render();
+  }
+
+  set hass(hass) {
+    this._hass = hass;
+    if (this._elements) {
+      this._elements.forEach(el => el.hass = hass);
+    }
+  }
+
+  configChanged(newConfig) {
+    const event = new CustomEvent("config-changed", {
+      detail: { config: newConfig },
+      bubbles: true,
+      composed: true,
+    });
+    this.dispatchEvent(event);
+  }
+
+  render() {
+    if (this._elements) return;
+
+    this.innerHTML = '';
+    this._elements = [];
+
+    const container = document.createElement('div');
+    container.style.cssText = "display: flex; flex-direction: column; gap: 12px; margin-bottom: 16px;";
+    container.appendChild(createAppearanceEditor(this));
+
+    // Gauge Settings Section
+    const gaugeDiv = document.createElement('div');
+    gaugeDiv.style.cssText = "border: 1px solid var(--divider-color, #e0e0e0); border-radius: 8px; padding: 10px; background: var(--card-background-color, rgba(0,0,0,0.2));";
+    gaugeDiv.innerHTML = `<div style="font-weight: 500; margin-bottom: 10px; color: var(--primary-text-color); font-size: 14px;">Gauge Scale Settings</div>`;
+
+    const createInput = (key, label, defaultValue) => {
+      const div = document.createElement('div');
+      div.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 8px;";
+      
+      const lbl = document.createElement('label');
+      lbl.innerText = label;
+      lbl.style.cssText = "font-size: 13px; color: var(--primary-text-color);";
+      div.appendChild(lbl);
+
+      const input = document.createElement('input');
+      input.type = "number";
+      input.value = this._config[key] || defaultValue;
+      input.style.cssText = "padding: 6px; border-radius: 4px; border: 1px solid var(--divider-color, #888); background: var(--card-background-color, #fff); color: var(--primary-text-color, #000); width: 80px;";
+      input.addEventListener('change', (e) => {
+        this.configChanged({ ...this._config, [key]: Number(e.target.value) });
+      });
+      
+      div.appendChild(input);
+      return div;
+    };
+
+    gaugeDiv.appendChild(createInput('max_download', 'Max Download (Mbps)', 1000));
+    gaugeDiv.appendChild(createInput('max_upload', 'Max Upload (Mbps)', 500));
+    container.appendChild(gaugeDiv);
+
+    // Labels Section
+    const labelsDiv = document.createElement('div');
+    labelsDiv.style.cssText = "border: 1px solid var(--divider-color, #e0e0e0); border-radius: 8px; padding: 10px; background: var(--card-background-color, rgba(0,0,0,0.2));";
+    labelsDiv.innerHTML = `<div style="font-weight: 500; margin-bottom: 10px; color: var(--primary-text-color); font-size: 14px;">Labels</div>`;
+
+    const createLabelInput = (key, label, defaultValue) => {
+      const div = document.createElement('div');
+      div.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 8px;";
+      
+      const lbl = document.createElement('label');
+      lbl.innerText = label;
+      lbl.style.cssText = "font-size: 13px; color: var(--primary-text-color);";
+      div.appendChild(lbl);
+
+      const input = document.createElement('input');
+      input.type = "text";
+      input.value = (this._config.labels && this._config.labels[key]) || defaultValue;
+      input.style.cssText = "padding: 6px; border-radius: 4px; border: 1px solid var(--divider-color, #888); background: var(--card-background-color, #fff); color: var(--primary-text-color, #000); width: 100px;";
+      input.addEventListener('change', (e) => {
+        const labels = { ...(this._config.labels || {}) };
+        labels[key] = e.target.value;
+        this.configChanged({ ...this._config, labels });
+      });
+      
+      div.appendChild(input);
+      return div;
+    };
+
+    labelsDiv.appendChild(createLabelInput('download', 'Download', 'Download'));
+    labelsDiv.appendChild(createLabelInput('upload', 'Upload', 'Upload'));
+    labelsDiv.appendChild(createLabelInput('ping', 'Ping', 'Ping'));
+    labelsDiv.appendChild(createLabelInput('jitter', 'Jitter', 'Jitter'));
+    labelsDiv.appendChild(createLabelInput('grade', 'Grade', 'Grade'));
+    container.appendChild(labelsDiv);
+
+    // Entities Section
+    const entitiesDiv = document.createElement('div');
+    entitiesDiv.style.cssText = "border: 1px solid var(--divider-color, #e0e0e0); border-radius: 8px; padding: 10px; background: var(--card-background-color, rgba(0,0,0,0.2));";
+    entitiesDiv.innerHTML = `<div style="font-weight: 500; margin-bottom: 10px; color: var(--primary-text-color); font-size: 14px;">Entities</div>`;
+
+    const createPicker = (key, label) => {
+      const div = document.createElement('div');
+      div.style.marginBottom = "12px";
+      
+      const lbl = document.createElement('label');
+      lbl.innerText = label;
+      lbl.style.cssText = "font-size: 12px; color: var(--secondary-text-color); margin-bottom: 4px; display: block;";
+      div.appendChild(lbl);
+
+      const picker = document.createElement('ha-entity-picker');
+      picker.hass = this._hass;
+      picker.value = (this._config.entities && this._config.entities[key]) || '';
+      picker.includeDomains = ['sensor'];
+      picker.allowCustomEntity = true;
+      picker.addEventListener('value-changed', (e) => {
+        const entities = { ...(this._config.entities || {}) };
+        entities[key] = e.detail.value;
+        this.configChanged({ ...this._config, entities });
+      });
+      
+      this._elements.push(picker);
+      div.appendChild(picker);
+      return div;
+    };
+
+    const entityFields = [
+      { key: 'download', label: 'Download Speed' },
+      { key: 'upload', label: 'Upload Speed' },
+      { key: 'ping', label: 'Ping Latency' },
+      { key: 'jitter', label: 'Jitter' },
+      { key: 'grade', label: 'Bufferbloat Grade' },
+      { key: 'isp', label: 'ISP Name' },
+      { key: 'server', label: 'Server Name' },
+      { key: 'last_test', label: 'Last Test Time' },
+      { key: 'result_url', label: 'Result URL' }
+    ];
+
+    entityFields.forEach(f => entitiesDiv.appendChild(createPicker(f.key, f.label)));
+    container.appendChild(entitiesDiv);
+
+    this.appendChild(container);
+  }
+}
+
+class OoklaSpeedtestMinimalEditor extends HTMLElement {
+  setConfig(config) {
+    this._config = config;
+    this.render();
+  }
+
+  set hass(hass) {
+    this._hass = hass;
+    if (this._elements) {
+      this._elements.forEach(el => el.hass = hass);
+    }
+  }
+
+  configChanged(newConfig) {
+    const event = new CustomEvent("config-changed", {
+      detail: { config: newConfig },
+      bubbles: true,
+      composed: true,
+    });
+    this.dispatchEvent(event);
+  }
+
+  render() {
+    if (this._elements) return;
+
+    this.innerHTML = '';
+    this._elements = [];
+
+    const container = document.createElement('div');
+    container.style.cssText = "display: flex; flex-direction: column; gap: 12px; padding: 10px;";
+    container.appendChild(createAppearanceEditor(this));
+
+    // Labels Section
+    const labelsDiv = document.createElement('div');
+    labelsDiv.style.cssText = "border: 1px solid var(--divider-color, #e0e0e0); border-radius: 8px; padding: 10px; background: var(--card-background-color, rgba(0,0,0,0.2));";
+    labelsDiv.innerHTML = `<div style="font-weight: 500; margin-bottom: 10px; color: var(--primary-text-color); font-size: 14px;">Labels</div>`;
+
+    const createLabelInput = (key, label, defaultValue) => {
+      const div = document.createElement('div');
+      div.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 8px;";
+      
+      const lbl = document.createElement('label');
+      lbl.innerText = label;
+      lbl.style.cssText = "font-size: 13px; color: var(--primary-text-color);";
+      div.appendChild(lbl);
+
+      const input = document.createElement('input');
+      input.type = "text";
+      input.value = (this._config.labels && this._config.labels[key]) || defaultValue;
+      input.style.cssText = "padding: 6px; border-radius: 4px; border: 1px solid var(--divider-color, #888); background: var(--card-background-color, #fff); color: var(--primary-text-color, #000); width: 100px;";
+      input.addEventListener('change', (e) => {
+        const labels = { ...(this._config.labels || {}) };
+        labels[key] = e.target.value;
+        this.configChanged({ ...this._config, labels });
+      });
+      
+      div.appendChild(input);
+      return div;
+    };
+
+    labelsDiv.appendChild(createLabelInput('download', 'Download', 'Download'));
+    labelsDiv.appendChild(createLabelInput('upload', 'Upload', 'Upload'));
+    labelsDiv.appendChild(createLabelInput('ping', 'Ping', 'Ping'));
+    container.appendChild(labelsDiv);
+
+    const entitiesDiv = document.createElement('div');
+    entitiesDiv.style.cssText = "border: 1px solid var(--divider-color, #e0e0e0); border-radius: 8px; padding: 10px; background: var(--card-background-color, rgba(0,0,0,0.2));";
+    entitiesDiv.innerHTML = `<div style="font-weight: 500; margin-bottom: 10px; color: var(--primary-text-color); font-size: 14px;">Entities</div>`;
+
+    const createPicker = (key, label) => {
+      const div = document.createElement('div');
+      div.style.marginBottom = "12px";
+      
+      const lbl = document.createElement('label');
+      lbl.innerText = label;
+      lbl.style.cssText = "font-size: 12px; color: var(--secondary-text-color); margin-bottom: 4px; display: block;";
+      div.appendChild(lbl);
+
+      const picker = document.createElement('ha-entity-picker');
+      picker.hass = this._hass;
+      picker.value = (this._config.entities && this._config.entities[key]) || '';
+      picker.includeDomains = ['sensor'];
+      picker.allowCustomEntity = true;
+      picker.addEventListener('value-changed', (e) => {
+        const entities = { ...(this._config.entities || {}) };
+        entities[key] = e.detail.value;
+        this.configChanged({ ...this._config, entities });
+      });
+      
+      this._elements.push(picker);
+      div.appendChild(picker);
+      return div;
+    };
+
+    entitiesDiv.appendChild(createPicker('download', 'Download Entity'));
+    entitiesDiv.appendChild(createPicker('upload', 'Upload Entity'));
+    entitiesDiv.appendChild(createPicker('ping', 'Ping Entity'));
+    entitiesDiv.appendChild(createPicker('isp', 'ISP Entity'));
+    
+    container.appendChild(entitiesDiv);
+    this.appendChild(container);
+  }
+}
+
+// Editor class remains in Light DOM (standard practice for editors)
+class OoklaSpeedtestCompactEditor extends HTMLElement {
+  setConfig(config) {
+    this._config = config;
+    this.render();
+  }
+
+  set hass(hass) {
+    this._hass = hass;
+    if (this._elements) {
+      this._elements.forEach(el => el.hass = hass);
+    }
+  }
+
+  configChanged(newConfig) {
+    const event = new CustomEvent("config-changed", { detail: { config: newConfig }, bubbles: true, composed: true });
+    this.dispatchEvent(event);
+  }
+
+  render() {
+    if (this._elements) return;
+
+    this.innerHTML = '';
+    this._elements = [];
+
+    const container = document.createElement('div');
+    container.style.cssText = "display: flex; flex-direction: column; gap: 12px; padding: 10px;";
+    container.appendChild(createAppearanceEditor(this));
+
+    // Labels Section
+    const labelsDiv = document.createElement('div');
+    labelsDiv.style.cssText = "border: 1px solid var(--divider-color, #e0e0e0); border-radius: 8px; padding: 10px; background: var(--card-background-color, rgba(0,0,0,0.2));";
+    labelsDiv.innerHTML = `<div style="font-weight: 500; margin-bottom: 10px; color: var(--primary-text-color); font-size: 14px;">Labels (Tooltips)</div>`;
+
+    const createLabelInput = (key, label, defaultValue) => {
+      const div = document.createElement('div');
+      div.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 8px;";
+      
+      const lbl = document.createElement('label');
+      lbl.innerText = label;
+      lbl.style.cssText = "font-size: 13px; color: var(--primary-text-color);";
+      div.appendChild(lbl);
+
+      const input = document.createElement('input');
+      input.type = "text";
+      input.value = (this._config.labels && this._config.labels[key]) || defaultValue;
+      input.style.cssText = "padding: 6px; border-radius: 4px; border: 1px solid var(--divider-color, #888); background: var(--card-background-color, #fff); color: var(--primary-text-color, #000); width: 100px;";
+      input.addEventListener('change', (e) => {
+        const labels = { ...(this._config.labels || {}) };
+        labels[key] = e.target.value;
+        this.configChanged({ ...this._config, labels });
+      });
+      
+      div.appendChild(input);
+      return div;
+    };
+
+    labelsDiv.appendChild(createLabelInput('download', 'Download', 'Download'));
+    labelsDiv.appendChild(createLabelInput('upload', 'Upload', 'Upload'));
+    labelsDiv.appendChild(createLabelInput('ping', 'Ping', 'Ping'));
+    container.appendChild(labelsDiv);
+
+    const createPicker = (key, label) => {
+        const div = document.createElement('div');
+        const lbl = document.createElement('label');
+        lbl.innerText = label;
+        lbl.style.cssText = "font-size: 12px; color: var(--secondary-text-color); margin-bottom: 4px; display: block;";
+        div.appendChild(lbl);
+
+        const picker = document.createElement('ha-entity-picker');
+        picker.hass = this._hass;
+        picker.value = (this._config.entities && this._config.entities[key]) || '';
+        picker.includeDomains = ['sensor'];
+        picker.allowCustomEntity = true;
+        picker.addEventListener('value-changed', (e) => {
+            const entities = { ...(this._config.entities || {}) };
+            entities[key] = e.detail.value;
+            this.configChanged({ ...this._config, entities });
+        });
+        
+        this._elements.push(picker);
+        div.appendChild(picker);
+        return div;
+    };
+
+    container.appendChild(createPicker('download', 'Download Entity'));
+    container.appendChild(createPicker('upload', 'Upload Entity'));
+    container.appendChild(createPicker('ping', 'Ping Entity'));
+
+    this.appendChild(container);
+  }
+}
+
+class OoklaSpeedtestDashboardEditor extends HTMLElement {
+  setConfig(config) {
+    this._config = config;
+    this.render();
+  }
+
+  set hass(hass) {
+    this._hass = hass;
+    if (this._elements) {
+      this._elements.forEach(el => el.hass = hass);
+    }
+  }
+
+  configChanged(newConfig) {
+    this.dispatchEvent(new CustomEvent("config-changed", { detail: { config: newConfig }, bubbles: true, composed: true }));
+  }
+
+  render() {
+    if (this._elements) return;
+
+    this.innerHTML = '';
+    this._elements = [];
+
+    const container = document.createElement('div');
+    container.style.cssText = "display: flex; flex-direction: column; gap: 12px; padding: 10px; font-family: sans-serif;";
+    container.appendChild(createAppearanceEditor(this));
+
+    // General Section
+    const genDiv = document.createElement('div');
+    genDiv.style.cssText = "border: 1px solid var(--divider-color, #444); border-radius: 8px; padding: 10px; background: var(--card-background-color, #222);";
+    genDiv.innerHTML = `<div style="font-weight: bold; margin-bottom: 10px; color: var(--primary-color, #0ea5e9); font-size: 13px; text-transform: uppercase;">General Settings</div>`;
+
+    // Show Gauges Toggle
+    const gaugesToggle = document.createElement('div');
+    gaugesToggle.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 10px;";
+    gaugesToggle.innerHTML = `<label style="font-size: 12px; color: var(--secondary-text-color, #ccc);">Show Gauges</label>`;
+    const gaugesCheckbox = document.createElement('input');
+    gaugesCheckbox.type = "checkbox";
+    gaugesCheckbox.checked = this._config.show_gauges !== false;
+    gaugesCheckbox.style.cssText = "width: 20px; height: 20px; cursor: pointer;";
+    gaugesCheckbox.addEventListener('change', (e) => this.configChanged({ ...this._config, show_gauges: e.target.checked }));
+    gaugesToggle.appendChild(gaugesCheckbox);
+    genDiv.appendChild(gaugesToggle);
+
+    // Max Download
+    const maxDlOption = document.createElement('div');
+    maxDlOption.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 10px;";
+    maxDlOption.innerHTML = `<label style="font-size: 12px; color: var(--secondary-text-color, #ccc);">Max Download (Mbps)</label>`;
+    const maxDlInput = document.createElement('input');
+    maxDlInput.type = "number";
+    maxDlInput.value = this._config.max_download || 1000;
+    maxDlInput.style.cssText = "padding: 6px; border-radius: 4px; border: 1px solid var(--divider-color, #444); background: var(--card-background-color, #111); color: var(--primary-text-color, #fff); width: 80px;";
+    maxDlInput.addEventListener('change', (e) => this.configChanged({ ...this._config, max_download: Number(e.target.value) }));
+    maxDlOption.appendChild(maxDlInput);
+    genDiv.appendChild(maxDlOption);
+
+    // Max Upload
+    const maxUlOption = document.createElement('div');
+    maxUlOption.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 10px;";
+    maxUlOption.innerHTML = `<label style="font-size: 12px; color: var(--secondary-text-color, #ccc);">Max Upload (Mbps)</label>`;
+    const maxUlInput = document.createElement('input');
+    maxUlInput.type = "number";
+    maxUlInput.value = this._config.max_upload || 500;
+    maxUlInput.style.cssText = "padding: 6px; border-radius: 4px; border: 1px solid var(--divider-color, #444); background: var(--card-background-color, #111); color: var(--primary-text-color, #fff); width: 80px;";
+    maxUlInput.addEventListener('change', (e) => this.configChanged({ ...this._config, max_upload: Number(e.target.value) }));
+    maxUlOption.appendChild(maxUlInput);
+    genDiv.appendChild(maxUlOption);
+
+    // Show Charts Toggle
+    const chartsToggle = document.createElement('div');
+    chartsToggle.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 10px;";
+    chartsToggle.innerHTML = `<label style="font-size: 12px; color: var(--secondary-text-color, #ccc);">Show Charts</label>`;
+    const chartsCheckbox = document.createElement('input');
+    chartsCheckbox.type = "checkbox";
+    chartsCheckbox.checked = this._config.show_charts !== false;
+    chartsCheckbox.style.cssText = "width: 20px; height: 20px; cursor: pointer;";
+    chartsCheckbox.addEventListener('change', (e) => this.configChanged({ ...this._config, show_charts: e.target.checked }));
+    chartsToggle.appendChild(chartsCheckbox);
+    genDiv.appendChild(chartsToggle);
+
+    const historyOption = document.createElement('div');
+    historyOption.style.cssText = "display: flex; align-items: center; justify-content: space-between;";
+    historyOption.innerHTML = `<label style="font-size: 12px; color: var(--secondary-text-color, #ccc);">History (hours)</label>`;
+    const historyInput = document.createElement('input');
+    historyInput.type = "number";
+    historyInput.value = this._config.history_hours || 168;
+    historyInput.min = "24";
+    historyInput.max = "720";
+    historyInput.step = "24";
+    historyInput.style.cssText = "padding: 6px; border-radius: 4px; border: 1px solid var(--divider-color, #444); background: var(--card-background-color, #111); color: var(--primary-text-color, #fff); width: 60px;";
+    historyInput.addEventListener('change', (e) => this.configChanged({ ...this._config, history_hours: Number(e.target.value) }));
+    historyOption.appendChild(historyInput);
+    genDiv.appendChild(historyOption);
+    container.appendChild(genDiv);
+
+    // Chart appearance section
+    const chartDiv = document.createElement('div');
+    chartDiv.style.cssText = "border: 1px solid var(--divider-color, #444); border-radius: 8px; padding: 10px; background: var(--card-background-color, #222);";
+    chartDiv.innerHTML = `<div style="font-weight: bold; margin-bottom: 10px; color: var(--primary-color, #0ea5e9); font-size: 13px; text-transform: uppercase;">Chart Appearance</div>`;
+
+    const createChartNumber = (key, label, defaultValue, min, max, step) => {
+      const option = document.createElement('div');
+      option.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 10px;";
+      option.innerHTML = `<label style="font-size: 12px; color: var(--secondary-text-color, #ccc);">${label}</label>`;
+      const input = document.createElement('input');
+      input.type = 'number';
+      input.value = this._config[key] ?? defaultValue;
+      input.min = String(min);
+      input.max = String(max);
+      input.step = String(step);
+      input.style.cssText = "padding: 6px; border-radius: 4px; border: 1px solid var(--divider-color, #444); background: var(--card-background-color, #111); color: var(--primary-text-color, #fff); width: 70px;";
+      input.addEventListener('change', (event) => this.configChanged({ ...this._config, [key]: Number(event.target.value) }));
+      option.appendChild(input);
+      return option;
+    };
+
+    chartDiv.appendChild(createChartNumber('chart_points', 'Maximum data points', 100, 2, 500, 1));
+    chartDiv.appendChild(createChartNumber('chart_height', 'Chart height (px)', 70, 30, 200, 5));
+    chartDiv.appendChild(createChartNumber('chart_stroke_width', 'Line width (px)', 2, 0.5, 10, 0.5));
+    chartDiv.appendChild(createChartNumber('chart_area_opacity', 'Area opacity', 0.25, 0, 1, 0.05));
+    chartDiv.appendChild(createChartNumber('chart_point_radius', 'Point radius', 0.75, 0.25, 4, 0.25));
+
+    const createChartSelect = (key, label, defaultValue, values) => {
+      const option = document.createElement('div');
+      option.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 10px;";
+      option.innerHTML = `<label style="font-size: 12px; color: var(--secondary-text-color, #ccc);">${label}</label>`;
+      const select = document.createElement('select');
+      select.style.cssText = "padding: 6px; border-radius: 4px; border: 1px solid var(--divider-color, #444); background: var(--card-background-color, #111); color: var(--primary-text-color, #fff); width: 100px;";
+      values.forEach(value => {
+        const item = document.createElement('option');
+        item.value = value;
+        item.textContent = value[0].toUpperCase() + value.slice(1);
+        item.selected = value === (this._config[key] || defaultValue);
+        select.appendChild(item);
+      });
+      select.addEventListener('change', (event) => this.configChanged({ ...this._config, [key]: event.target.value }));
+      option.appendChild(select);
+      return option;
+    };
+
+    chartDiv.appendChild(createChartSelect('chart_line_style', 'Line style', 'solid', ['solid', 'dashed', 'dotted']));
+    chartDiv.appendChild(createChartSelect('chart_line_cap', 'Line caps', 'round', ['round', 'butt', 'square']));
+
+    const areaToggle = document.createElement('div');
+    areaToggle.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 10px;";
+    areaToggle.innerHTML = `<label style="font-size: 12px; color: var(--secondary-text-color, #ccc);">Show chart area</label>`;
+    const areaCheckbox = document.createElement('input');
+    areaCheckbox.type = 'checkbox';
+    areaCheckbox.checked = this._config.chart_show_area !== false;
+    areaCheckbox.style.cssText = "width: 20px; height: 20px; cursor: pointer;";
+    areaCheckbox.addEventListener('change', (event) => this.configChanged({ ...this._config, chart_show_area: event.target.checked }));
+    areaToggle.appendChild(areaCheckbox);
+    chartDiv.appendChild(areaToggle);
+
+    const pointsToggle = document.createElement('div');
+    pointsToggle.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 10px;";
+    pointsToggle.innerHTML = `<label style="font-size: 12px; color: var(--secondary-text-color, #ccc);">Show data points</label>`;
+    const pointsCheckbox = document.createElement('input');
+    pointsCheckbox.type = 'checkbox';
+    pointsCheckbox.checked = this._config.chart_show_points === true;
+    pointsCheckbox.style.cssText = "width: 20px; height: 20px; cursor: pointer;";
+    pointsCheckbox.addEventListener('change', (event) => this.configChanged({ ...this._config, chart_show_points: event.target.checked }));
+    pointsToggle.appendChild(pointsCheckbox);
+    chartDiv.appendChild(pointsToggle);
+
+    const zeroToggle = document.createElement('div');
+    zeroToggle.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 10px;";
+    zeroToggle.innerHTML = `<label style="font-size: 12px; color: var(--secondary-text-color, #ccc);">Start vertical scale at zero</label>`;
+    const zeroCheckbox = document.createElement('input');
+    zeroCheckbox.type = 'checkbox';
+    zeroCheckbox.checked = this._config.chart_include_zero === true;
+    zeroCheckbox.style.cssText = "width: 20px; height: 20px; cursor: pointer;";
+    zeroCheckbox.addEventListener('change', (event) => this.configChanged({ ...this._config, chart_include_zero: event.target.checked }));
+    zeroToggle.appendChild(zeroCheckbox);
+    chartDiv.appendChild(zeroToggle);
+
+    const chartColors = { download: '#0ea5e9', upload: '#7c3aed', ping: '#f59e0b' };
+    const createChartColor = (configKey, key, defaultColor, label) => {
+      const option = document.createElement('div');
+      option.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 8px;";
+      option.innerHTML = `<label style="font-size: 12px; color: var(--secondary-text-color, #ccc); text-transform: capitalize;">${key} ${label}</label>`;
+      const input = document.createElement('input');
+      input.type = 'color';
+      input.value = this._config[configKey]?.[key] || defaultColor;
+      input.style.cssText = "width: 44px; height: 30px; padding: 2px; border: 1px solid var(--divider-color, #444); border-radius: 4px; background: transparent; cursor: pointer;";
+      input.addEventListener('change', (event) => this.configChanged({
+        ...this._config,
+        [configKey]: { ...(this._config[configKey] || {}), [key]: event.target.value }
+      }));
+      option.appendChild(input);
+      return option;
+    };
+    Object.entries(chartColors).forEach(([key, defaultColor]) => {
+      chartDiv.appendChild(createChartColor('chart_colors', key, defaultColor, 'line'));
+      chartDiv.appendChild(createChartColor('chart_area_colors', key, defaultColor, 'area'));
+    });
+    container.appendChild(chartDiv);
+
+    // Labels Section
+    const labelsDiv = document.createElement('div');
+    labelsDiv.style.cssText = "border: 1px solid var(--divider-color, #444); border-radius: 8px; padding: 10px; background: var(--card-background-color, #222); margin-top: 10px;";
+    labelsDiv.innerHTML = `<div style="font-weight: bold; margin-bottom: 10px; color: var(--primary-color, #0ea5e9); font-size: 13px; text-transform: uppercase;">Labels</div>`;
+
+    const createLabelInput = (key, label, defaultValue) => {
+      const div = document.createElement('div');
+      div.style.cssText = "display: flex; align-items: center; justify-content: space-between; margin-bottom: 8px;";
+      
+      const lbl = document.createElement('label');
+      lbl.innerText = label;
+      lbl.style.cssText = "font-size: 12px; color: var(--secondary-text-color, #ccc);";
+      div.appendChild(lbl);
+
+      const input = document.createElement('input');
+      input.type = "text";
+      input.value = (this._config.labels && this._config.labels[key]) || defaultValue;
+      input.style.cssText = "padding: 6px; border-radius: 4px; border: 1px solid var(--divider-color, #444); background: var(--card-background-color, #111); color: var(--primary-text-color, #fff); width: 100px;";
+      input.addEventListener('change', (e) => {
+        const labels = { ...(this._config.labels || {}) };
+        labels[key] = e.target.value;
+        this.configChanged({ ...this._config, labels });
+      });
+      
+      div.appendChild(input);
+      return div;
+    };
+
+    labelsDiv.appendChild(createLabelInput('download', 'Download', 'Download'));
+    labelsDiv.appendChild(createLabelInput('upload', 'Upload', 'Upload'));
+    labelsDiv.appendChild(createLabelInput('ping', 'Ping', 'Ping'));
+    labelsDiv.appendChild(createLabelInput('jitter', 'Jitter', 'Jitter'));
+    labelsDiv.appendChild(createLabelInput('grade', 'Grade', 'Grade'));
+    container.appendChild(labelsDiv);
+
+    // Helpers
+    const createSection = (title, items) => {
+      const secDiv = document.createElement('div');
+      secDiv.style.cssText = "border: 1px solid var(--divider-color, #444); border-radius: 8px; padding: 10px; background: var(--card-background-color, #222); margin-top: 10px;";
+      secDiv.innerHTML = `<div style="font-weight: bold; margin-bottom: 10px; color: var(--primary-color, #0ea5e9); font-size: 13px; text-transform: uppercase;">${title}</div>`;
+      
+      items.forEach(item => {
+        const option = document.createElement('div');
+        option.style.marginBottom = "12px";
+        const label = document.createElement('label');
+        label.innerText = item.label;
+        label.style.cssText = "font-size: 12px; color: var(--secondary-text-color, #ccc); margin-bottom: 4px; display: block;";
+        option.appendChild(label);
+
+        const picker = document.createElement('ha-entity-picker');
+        picker.hass = this._hass;
+        picker.value = (this._config.entities && this._config.entities[item.key]) || '';
+        picker.includeDomains = ['sensor'];
+        picker.allowCustomEntity = true;
+        picker.addEventListener('value-changed', (e) => {
+          const entities = { ...(this._config.entities || {}) };
+          entities[item.key] = e.detail.value;
+          this.configChanged({ ...this._config, entities });
+        });
+        
+        // Add to elements tracker for hass updates
+        this._elements.push(picker);
+        option.appendChild(picker);
+        secDiv.appendChild(option);
+      });
+      return secDiv;
+    };
+
+    container.appendChild(createSection("Core Entities", [
+      { key: 'download', label: 'Download' },
+      { key: 'upload', label: 'Upload' },
+      { key: 'ping', label: 'Ping' },
+      { key: 'jitter', label: 'Jitter' },
+      { key: 'grade', label: 'Grade' }
+    ]));
+
+    container.appendChild(createSection("Extended Latency", [
+      { key: 'ping_min', label: 'Ping Min' },
+      { key: 'ping_max', label: 'Ping Max' },
+      { key: 'dl_ping', label: 'DL Ping' },
+      { key: 'ul_ping', label: 'UL Ping' }
+    ]));
+
+    container.appendChild(createSection("Stability & Compliance", [
+      { key: 'dl_compliance', label: 'DL Plan %' },
+      { key: 'ul_compliance', label: 'UL Plan %' },
+      { key: 'dl_jitter', label: 'DL Jitter' },
+      { key: 'ul_jitter', label: 'UL Jitter' }
+    ]));
+
+    this.appendChild(container);
+  }
+}
+
+class OoklaSpeedtestCardSimpleEditor extends HTMLElement {
+  setConfig(config) {
+    this._config = config;
+    this.render();
+  }
+
+  set hass(hass) {
+    this._hass = hass;
+    if (this._elements) {
+      this._elements.forEach(el => el.hass = hass);
+    }
+  }
+
+  configChanged(newConfig) {
+    const event = new CustomEvent("config-changed", {
+      detail: { config: newConfig },
+      bubbles: true,
+      composed: true,
+    });
+    this.dispatchEvent(event);
+  }
+
+  render() {
+    if (this._elements) return;
+
+    this.innerHTML = '';
+    this._elements = [];
+
+    const container = document.createElement('div');
+    container.style.cssText = "display: flex; flex-direction: column; gap: 12px; padding: 10px;";
+    container.appendChild(createAppearanceEditor(this));
+
+    const entitiesDiv = document.createElement('div');
+    entitiesDiv.style.cssText = "border: 1px solid var(--divider-color, #e0e0e0); border-radius: 8px; padding: 10px; background: var(--card-background-color, rgba(0,0,0,0.2));";
+    entitiesDiv.innerHTML = `<div style="font-weight: 500; margin-bottom: 10px; color: var(--primary-text-color); font-size: 14px;">Entities</div>`;
+
+    const createPicker = (key, label) => {
+      const div = document.createElement('div');
+      div.style.marginBottom = "12px";
+      
+      const lbl = document.createElement('label');
+      lbl.innerText = label;
+      lbl.style.cssText = "font-size: 12px; color: var(--secondary-text-color); margin-bottom: 4px; display: block;";
+      div.appendChild(lbl);
+
+      const picker = document.createElement('ha-entity-picker');
+      picker.hass = this._hass;
+      picker.value = (this._config.entities && this._config.entities[key]) || '';
+      picker.includeDomains = ['sensor'];
+      picker.allowCustomEntity = true;
+      picker.addEventListener('value-changed', (e) => {
+        const entities = { ...(this._config.entities || {}) };
+        entities[key] = e.detail.value;
+        this.configChanged({ ...this._config, entities });
+      });
+      
+      this._elements.push(picker);
+      div.appendChild(picker);
+      return div;
+    };
+
+    entitiesDiv.appendChild(createPicker('download', 'Download Entity'));
+    entitiesDiv.appendChild(createPicker('upload', 'Upload Entity'));
+    entitiesDiv.appendChild(createPicker('ping', 'Ping Entity'));
+    
+    container.appendChild(entitiesDiv);
+    this.appendChild(container);
+  }
+}
+
+const EDITOR_ELEMENTS = {
+  "ookla-speedtest-card-editor": OoklaSpeedtestCardEditor,
+  "ookla-speedtest-minimal-editor": OoklaSpeedtestMinimalEditor,
+  "ookla-speedtest-compact-editor": OoklaSpeedtestCompactEditor,
+  "ookla-speedtest-dashboard-editor": OoklaSpeedtestDashboardEditor,
+  "ookla-speedtest-card-simple-editor": OoklaSpeedtestCardSimpleEditor,
+};
+
+Object.entries(EDITOR_ELEMENTS).forEach(([tag, element]) => {
+  if (!customElements.get(tag)) customElements.define(tag, element);
+});
@@ -1,133 +1,158 @@
 """Manager for Lovelace card resources."""
 
+import gzip
 import json
 import logging
-import os
 import shutil
-import stat
 from pathlib import Path
 
+from homeassistant.components.http import StaticPathConfig
 from homeassistant.components.lovelace import DOMAIN as LOVELACE_DOMAIN
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.event import async_call_later
 
 from .const import DOMAIN
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 _LOGGER = logging.getLogger(__name__)
 
 VERSION = json.loads(
     (Path(__file__).with_name("manifest.json")).read_text(encoding="utf-8")
 )["version"]
 
-# List of cards to manage
-CARDS = [
+# Single module registering every card; the only Lovelace resource we manage
+CARDS_MODULE = "ookla-speedtest-cards.js"
+
+# Per-card modules registered as separate resources by older versions
+LEGACY_CARDS = [
     "ookla-speedtest-card.js",
-    "ookla-speedtest-minimal.js", 
+    "ookla-speedtest-minimal.js",
     "ookla-speedtest-compact.js",
     "ookla-speedtest-dashboard.js",
     "ookla-speedtest-card-simple.js",
 ]
 
-CARD_ASSETS = [*CARDS, "ookla-speedtest-card-utils.js"]
+CARD_ASSETS = [
+    CARDS_MODULE,
+    "ookla-speedtest-editors.js",
+    "ookla-speedtest-card-utils.js",
+    *LEGACY_CARDS,
+]
 
 WWW_SOURCE_DIR = Path(__file__).parent / "www"
 
+# The version in the path lets browsers keep the files until the next upgrade
+CARDS_URL = f"/{DOMAIN}/{VERSION}"
+CARDS_LATEST_URL = f"/{DOMAIN}/latest"
+LEGACY_CARDS_URL = "/local/ookla_speedtest"
 
-async def async_setup_cards(hass: HomeAssistant) -> bool:
-    """Set up the custom cards by copying to www folder.
-    
-    This ensures cards are accessible at /local/ookla_speedtest/
+
+async def async_setup_cards(hass: HomeAssistant) -> None:
+    """Serve the cards, with compressed copies, under a versioned URL.
+
+    Auto-registered resources use CARDS_URL, which changes with the
+    integration version. HA serves it with its default cache headers
+    (max-age of 31 days, without immutable), so browsers reuse the files
+    until the next upgrade changes the URL. CARDS_LATEST_URL serves the same
+    files uncached for hand-written resource entries.
+
+    The files are served from a copy in the config directory, next to .gz
+    and .br versions that the static file handler picks when the browser
+    accepts them. The integration's own folder is replaced by updates and
+    may be read-only, so nothing is written there.
     """
+    served_dir = await hass.async_add_executor_job(
+        _prepare_assets, Path(hass.config.path(".cache", DOMAIN, "www"))
+    )
+    await hass.http.async_register_static_paths(
+        [
+            StaticPathConfig(CARDS_URL, str(served_dir), cache_headers=True),
+            StaticPathConfig(CARDS_LATEST_URL, str(served_dir), cache_headers=False),
+        ]
+    )
+    _LOGGER.debug("Ookla Speedtest cards served from %s at %s", served_dir, CARDS_URL)
+
+
+def _prepare_assets(target: Path) -> Path:
+    """Copy the assets to target with compressed versions and return it.
+
+    Copies are only rewritten when the bundled file changed. Returns the
+    bundled folder, served uncompressed, when target cannot be written.
+    """
+    encoders = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        encoders.append((".br", lambda data: brotli.compress(data, quality=11)))
+
     try:
-        # Get path to www folder
-        www_dir = Path(hass.config.path("www"))
-        target_dir = www_dir / "ookla_speedtest"
-        
-        # Create www directory if it doesn't exist
-        if not www_dir.exists():
-            _LOGGER.info("Creating www directory")
-            await hass.async_add_executor_job(www_dir.mkdir)
-            
-        # Create target directory
-        if not target_dir.exists():
-             await hass.async_add_executor_job(target_dir.mkdir)
-        
-        copied_count = 0
-        for card in CARD_ASSETS:
-            source = WWW_SOURCE_DIR / card
-            target = target_dir / card
-            
-            # Copy if source exists and (target missing or source newer)
-            if source.exists():
-                # We can do a simpler check: just copy. 
-                # shutil.copy2 preserves metadata, so repeated copies are cheap if optimized by OS, 
-                # but let's just copy to be sure we have latest version.
-                await hass.async_add_executor_job(
-                    shutil.copy2, source, target
-                )
-                
-                # Ensure file is world-readable (644) so webserver can serve it
-                # specific fix for HA Green / restricted permission environments
-                def set_permissions():
-                    try:
-                        os.chmod(target, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
-                    except OSError as e:
-                        _LOGGER.warning("Could not set permissions for %s: %s", target, e)
-
-                await hass.async_add_executor_job(set_permissions)
-                
-                copied_count += 1
-        
-        _LOGGER.debug(
-            "Ookla Speedtest cards installed to www folder (%d files)",
-            copied_count
-        )
-        return True
-        
-    except Exception as e:
-        _LOGGER.error("Failed to set up cards: %s", e)
-        return False
+        target.mkdir(parents=True, exist_ok=True)
+        for asset in CARD_ASSETS:
+            source = WWW_SOURCE_DIR / asset
+            copy = target / asset
+            if not copy.exists() or copy.stat().st_mtime != source.stat().st_mtime:
+                shutil.copy2(source, copy)
+            copy_mtime = copy.stat().st_mtime
+            data = None
+            for suffix, compress in encoders:
+                compressed = target / f"{asset}{suffix}"
+                if compressed.exists() and compressed.stat().st_mtime >= copy_mtime:
+                    continue
+                if data is None:
+                    data = copy.read_bytes()
+                compressed.write_bytes(compress(data))
+    except OSError as e:
+        _LOGGER.debug("Could not prepare compressed cards in %s: %s", target, e)
+        return WWW_SOURCE_DIR
+    return target
+
+
+def _resource_card(url: str) -> str | None:
+    """Return the card file a resource URL points at, if it is one of ours."""
+    path = url.split("?")[0]
+    directory, _, filename = path.rpartition("/")
+    if filename != CARDS_MODULE and filename not in LEGACY_CARDS:
+        return None
+    if directory == LEGACY_CARDS_URL or directory.startswith(f"/{DOMAIN}/"):
+        return filename
+    return None
 
 
 async def async_remove_cards_and_resources(hass: HomeAssistant) -> None:
-    """Remove cards from www folder and unregister resources."""
+    """Remove the legacy www copy and unregister resources."""
     try:
-        # 1. Remove files from www directory
-        www_dir = Path(hass.config.path("www"))
-        target_dir = www_dir / "ookla_speedtest"
-        
-        if target_dir.exists():
+        # 1. Remove files copied to www by older versions
+        target_dir = Path(hass.config.path("www")) / "ookla_speedtest"
+
+        if await hass.async_add_executor_job(target_dir.exists):
             _LOGGER.info("Removing Ookla Speedtest cards from www directory")
             await hass.async_add_executor_job(shutil.rmtree, target_dir)
-            
+
         # 2. Unregister resources from Lovelace
         lovelace = hass.data.get(LOVELACE_DOMAIN)
         if lovelace and hasattr(lovelace, "resources") and lovelace.resources.loaded:
             resources = lovelace.resources
-            
-            for card in CARDS:
-                base_url = f"/local/ookla_speedtest/{card}"
-                
-                # Find resource to remove
-                found_resource = None
-                for resource in resources.async_items():
-                    # Check base URL match (ignoring query params)
-                    if resource["url"].split("?")[0] == base_url:
-                        found_resource = resource
-                        break
-                
-                if found_resource:
-                    _LOGGER.info("Unregistering Lovelace resource: %s", base_url)
-                    await resources.async_delete_item(found_resource["id"])
-                    
+
+            for resource in list(resources.async_items()):
+                if _resource_card(resource["url"]) is not None:
+                    _LOGGER.info("Unregistering Lovelace resource: %s", resource["url"])
+                    await resources.async_delete_item(resource["id"])
+
     except Exception as e:
         _LOGGER.error("Failed to remove cards/resources: %s", e)
 
 
 async def async_register_cards(hass: HomeAssistant) -> None:
-    """Register Lovelace resources safely."""
+    """Register Lovelace resources safely.
+
+    All of our resources are reconciled down to a single entry for the
+    current CARDS_MODULE URL; per-card entries left by older versions,
+    including those pointing at the legacy /local/ copy, are removed.
+    """
     lovelace = hass.data.get(LOVELACE_DOMAIN)
-    
+
     # Check if Lovelace is loaded
     if not lovelace:
         _LOGGER.debug("Lovelace not loaded, skipping resource registration")
@@ -138,41 +163,48 @@ async def async_register_cards(hass: HomeAssistant) -> None:
         _LOGGER.debug("Lovelace resources not loaded, retrying in 5 seconds")
         async_call_later(hass, 5, lambda _: hass.async_create_task(async_register_cards(hass)))
         return
-    
+
     resources = lovelace.resources
-    
-    for card in CARDS:
-        base_url = f"/local/ookla_speedtest/{card}"
-        full_url = f"{base_url}?v={VERSION}"
-        
-        # Find if resource exists (ignoring version param)
-        found_resource = None
-        for resource in resources.async_items():
-            if resource["url"].split("?")[0] == base_url:
-                found_resource = resource
-                break
-        
-        if found_resource:
-            # Update if version changed
-            if found_resource["url"] != full_url:
-                _LOGGER.info("Updating Lovelace resource %s to version %s", base_url, VERSION)
-                try:
-                    await resources.async_update_item(found_resource["id"], {
-                        "res_type": "module",
-                        "url": full_url
-                    })
-                except Exception as e:
-                    _LOGGER.error("Failed to update resource %s: %s", base_url, e)
-        else:
-            # Create new
-            _LOGGER.info("Auto-registering Lovelace resource: %s", full_url)
+
+    full_url = f"{CARDS_URL}/{CARDS_MODULE}"
+    ours = [
+        resource
+        for resource in resources.async_items()
+        if _resource_card(resource["url"]) is not None
+    ]
+    # Prefer keeping an entry that already points at the bundled module
+    ours.sort(key=lambda resource: _resource_card(resource["url"]) != CARDS_MODULE)
+    found, *extra = ours or [None]
+
+    if found:
+        # Update if version or location changed
+        if found["url"] != full_url:
+            _LOGGER.info("Updating Lovelace resource %s to %s", found["url"], full_url)
             try:
-                await resources.async_create_item({
+                await resources.async_update_item(found["id"], {
                     "res_type": "module",
                     "url": full_url
                 })
             except Exception as e:
-                _LOGGER.error("Failed to register %s: %s", full_url, e)
+                _LOGGER.error("Failed to update resource %s: %s", full_url, e)
+    else:
+        # Create new
+        _LOGGER.info("Auto-registering Lovelace resource: %s", full_url)
+        try:
+            await resources.async_create_item({
+                "res_type": "module",
+                "url": full_url
+            })
+        except Exception as e:
+            _LOGGER.error("Failed to register %s: %s", full_url, e)
+
+    # The bundled module defines every card, so other entries are redundant
+    for resource in extra:
+        _LOGGER.info("Removing redundant Lovelace resource: %s", resource["url"])
+        try:
+            await resources.async_delete_item(resource["id"])
+        except Exception as e:
+            _LOGGER.error("Failed to remove resource %s: %s", resource["url"], e)
 
 
 async def async_register_resources_service(hass: HomeAssistant) -> None:
@@ -196,24 +228,24 @@ def get_card_info():
             "name": "Ookla Speedtest",
             "type": "custom:ookla-speedtest-card",
             "description": "Full Ookla interface with radial gauges",
-            "file": "ookla-speedtest-card.js"
+            "file": CARDS_MODULE
         },
         {
             "name": "Ookla Speedtest - Minimal",
             "type": "custom:ookla-speedtest-minimal",
             "description": "Clean design with large typography",
-            "file": "ookla-speedtest-minimal.js"
+            "file": CARDS_MODULE
         },
         {
             "name": "Ookla Speedtest - Compact",
             "type": "custom:ookla-speedtest-compact",
             "description": "Small single-line card",
-            "file": "ookla-speedtest-compact.js"
+            "file": CARDS_MODULE
         },
         {
             "name": "Ookla Speedtest - Dashboard",
             "type": "custom:ookla-speedtest-dashboard",
             "description": "Full metrics with charts",
-            "file": "ookla-speedtest-dashboard.js"
+            "file": CARDS_MODULE
         }
     ]
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Offline stand-in for the Ookla speedtest CLI.
+
+Emits the same --format=json, --format=jsonl (with --progress=yes) and
+--servers output as speedtest.bin, without touching the network, so the
+integration's coordinator, fallback and scheduling logic can be exercised
+and load-tested on an offline box.
+
+Point the integration at it by exporting OOKLA_SPEEDTEST_BIN before Home
+Assistant starts:
+
+    export OOKLA_SPEEDTEST_BIN=/path/to/scripts/speedtest_simulator.py
+
+Behaviour is controlled through environment variables:
+
+    SPEEDTEST_SIM_MODE          ok (default), fail, no_servers, hang,
+                                bad_json or no_result
+    SPEEDTEST_SIM_DURATION      seconds a test takes (default 3)
+    SPEEDTEST_SIM_DOWNLOAD      mean download speed in Mbps (default 300)
+    SPEEDTEST_SIM_UPLOAD        mean upload speed in Mbps (default 50)
+    SPEEDTEST_SIM_PING          mean idle latency in ms (default 12)
+    SPEEDTEST_SIM_VARIANCE      relative spread of the values (default 0.1)
+    SPEEDTEST_SIM_LOADED_PING   extra latency under load in ms (default 25)
+    SPEEDTEST_SIM_PACKET_LOSS   packet loss in percent (default 0)
+    SPEEDTEST_SIM_SERVERS       number of servers listed (default 20)
+    SPEEDTEST_SIM_DOWN_SERVERS  comma separated server ids that fail with
+                                NoServersException when requested with -s
+    SPEEDTEST_SIM_STARTUP_DELAY seconds before any output (default 0)
+    SPEEDTEST_SIM_IGNORE_SIGTERM  1 to ignore SIGTERM while hanging
+    SPEEDTEST_SIM_SEED          seed for reproducible values
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import signal
+import sys
+import time
+import uuid
+from datetime import UTC, datetime
+
+VERSION_TEXT = "Speedtest by Ookla 1.2.0.84 (ea6b6773cf) Linux/x86_64-linux-musl (simulator)"
+PROGRESS_STEPS = 10
+
+CITIES = [
+    ("Amsterdam", "Netherlands"),
+    ("Berlin", "Germany"),
+    ("Chicago, IL", "United States"),
+    ("Frankfurt", "Germany"),
+    ("London", "United Kingdom"),
+    ("Madrid", "Spain"),
+    ("New York, NY", "United States"),
+    ("Paris", "France"),
+    ("Stockholm", "Sweden"),
+    ("Tokyo", "Japan"),
+]
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment."""
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def now_iso() -> str:
+    """Return the current UTC time in the CLI's timestamp format."""
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def build_servers(count: int) -> list[dict]:
+    """Return a deterministic server list, closest first."""
+    servers = []
+    for index in range(count):
+        city, country = CITIES[index % len(CITIES)]
+        server_id = 10000 + index
+        servers.append(
+            {
+                "id": server_id,
+                "host": f"speedtest{index}.example.net",
+                "port": 8080,
+                "name": f"Example Net {index}",
+                "location": city,
+                "country": country,
+                "distance": round(5 + index * 12.5, 2),
+            }
+        )
+    return servers
+
+
+def vary(rng: random.Random, value: float, spread: float) -> float:
+    """Return value scattered by +/- spread (relative), never negative."""
+    return max(0.0, value * (1 + rng.uniform(-spread, spread)))
+
+
+def latency_block(rng: random.Random, base: float, spread: float) -> dict:
+    """Return a latency summary as reported for a load phase."""
+    iqm = vary(rng, base, spread)
+    return {
+        "iqm": round(iqm, 3),
+        "low": round(iqm * 0.7, 3),
+        "high": round(iqm * 1.8, 3),
+        "jitter": round(vary(rng, iqm * 0.1, spread), 3),
+    }
+
+
+def emit(payload: dict) -> None:
+    """Write one JSON document as a line and flush it."""
+    sys.stdout.write(json.dumps(payload) + "\n")
+    sys.stdout.flush()
+
+
+def fail(message: str, code: int) -> None:
+    """Print a CLI style error and exit."""
+    sys.stderr.write(f"[error] {message}\n")
+    sys.stderr.flush()
+    sys.exit(code)
+
+
+def hang(ignore_sigterm: bool) -> None:
+    """Block forever, like a CLI stuck on a dead connection."""
+    if ignore_sigterm:
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    while True:
+        time.sleep(3600)
+
+
+def run_test(args: argparse.Namespace, rng: random.Random) -> None:
+    """Simulate a full ping/download/upload test."""
+    mode = os.environ.get("SPEEDTEST_SIM_MODE", "ok")
+    duration = env_float("SPEEDTEST_SIM_DURATION", 3)
+    spread = env_float("SPEEDTEST_SIM_VARIANCE", 0.1)
+    servers = build_servers(int(env_float("SPEEDTEST_SIM_SERVERS", 20)))
+    down_servers = {
+        server_id.strip()
+        for server_id in os.environ.get("SPEEDTEST_SIM_DOWN_SERVERS", "").split(",")
+        if server_id.strip()
+    }
+
+    if args.server_id and args.server_id in down_servers:
+        fail("Configuration - No servers defined (NoServersException)", 2)
+    server = next(
+        (server for server in servers if str(server["id"]) == args.server_id),
+        servers[0],
+    )
+
+    if mode == "fail":
+        fail("Configuration - Couldn't resolve host name (HostNotFoundException)", 1)
+    if mode == "no_servers":
+        fail("Configuration - No servers defined (NoServersException)", 2)
+
+    ping = vary(rng, env_float("SPEEDTEST_SIM_PING", 12), spread)
+    loaded = env_float("SPEEDTEST_SIM_LOADED_PING", 25)
+    download_bandwidth = int(vary(rng, env_float("SPEEDTEST_SIM_DOWNLOAD", 300), spread) * 125000)
+    upload_bandwidth = int(vary(rng, env_float("SPEEDTEST_SIM_UPLOAD", 50), spread) * 125000)
+    phase_time = duration / 3
+    phase_ms = int(phase_time * 1000)
+
+    result = {
+        "type": "result",
+        "timestamp": now_iso(),
+        "ping": {
+            "jitter": round(vary(rng, ping * 0.08, spread), 3),
+            "latency": round(ping, 3),
+            "low": round(ping * 0.85, 3),
+            "high": round(ping * 1.3, 3),
+        },
+        "download": {
+            "bandwidth": download_bandwidth,
+            "bytes": download_bandwidth * phase_ms // 1000,
+            "elapsed": phase_ms,
+            "latency": latency_block(rng, ping + loaded, spread),
+        },
+        "upload": {
+            "bandwidth": upload_bandwidth,
+            "bytes": upload_bandwidth * phase_ms // 1000,
+            "elapsed": phase_ms,
+            "latency": latency_block(rng, ping + loaded * 0.6, spread),
+        },
+        "packetLoss": env_float("SPEEDTEST_SIM_PACKET_LOSS", 0),
+        "isp": "Simulated ISP",
+        "interface": {
+            "internalIp": "192.168.1.50",
+            "name": "eth0",
+            "macAddr": "02:00:00:00:00:01",
+            "isVpn": False,
+            "externalIp": "203.0.113.10",
+        },
+        "server": {**{k: v for k, v in server.items() if k != "distance"}, "ip": "198.51.100.1"},
+        "result": {
+            "id": (result_id := str(uuid.UUID(int=rng.getrandbits(128)))),
+            "url": f"https://www.speedtest.net/result/c/{result_id}",
+            "persisted": True,
+        },
+    }
+
+    streaming = args.format == "jsonl"
+    progress = streaming and args.progress == "yes"
+    if progress:
+        emit({"type": "testStart", "timestamp": now_iso(), "isp": result["isp"],
+              "interface": result["interface"], "server": result["server"]})
+
+    for phase in ("ping", "download", "upload"):
+        for step in range(1, PROGRESS_STEPS + 1):
+            time.sleep(phase_time / PROGRESS_STEPS)
+            if mode == "hang" and phase == "download" and step == PROGRESS_STEPS // 2:
+                hang(os.environ.get("SPEEDTEST_SIM_IGNORE_SIGTERM") == "1")
+            if not progress:
+                continue
+            fraction = step / PROGRESS_STEPS
+            if phase == "ping":
+                payload = {"jitter": result["ping"]["jitter"],
+                           "latency": result["ping"]["latency"], "progress": fraction}
+            else:
+                final = result[phase]
+                payload = {
+                    "bandwidth": int(vary(rng, final["bandwidth"], spread)),
+                    "bytes": int(final["bytes"] * fraction),
+                    "elapsed": int(final["elapsed"] * fraction),
+                    "progress": fraction,
+                }
+            emit({"type": phase, "timestamp": now_iso(), phase: payload})
+
+    if mode == "no_result":
+        sys.exit(0)
+    if mode == "bad_json":
+        sys.stdout.write('{"type": "result", "ping": {"latency": \n')
+        sys.stdout.flush()
+        sys.exit(0)
+
+    if streaming:
+        emit(result)
+    else:
+        sys.stdout.write(json.dumps(result))
+        sys.stdout.flush()
+
+
+def main() -> None:
+    """Parse the CLI flags the integration uses and simulate the binary."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--accept-license", action="store_true")
+    parser.add_argument("--accept-gdpr", action="store_true")
+    parser.add_argument("--version", action="store_true")
+    parser.add_argument("--servers", "-L", action="store_true")
+    parser.add_argument("--format", "-f", default="human-readable")
+    parser.add_argument("--progress", "-p", default="no")
+    parser.add_argument("--server-id", "-s")
+    args, _unknown = parser.parse_known_args()
+
+    seed = os.environ.get("SPEEDTEST_SIM_SEED")
+    rng = random.Random(seed)
+
+    time.sleep(env_float("SPEEDTEST_SIM_STARTUP_DELAY", 0))
+
+    if args.version:
+        print(VERSION_TEXT)
+        return
+    if args.servers:
+        servers = build_servers(int(env_float("SPEEDTEST_SIM_SERVERS", 20)))
+        if os.environ.get("SPEEDTEST_SIM_MODE") == "fail":
+            fail("Configuration - Couldn't resolve host name (HostNotFoundException)", 1)
+        print(json.dumps({"type": "serverList", "timestamp": now_iso(), "servers": servers}))
+        return
+    run_test(args, rng)
+
+
+if __name__ == "__main__":
+    main()
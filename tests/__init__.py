@@ -0,0 +1 @@
+"""Tests for the Ookla Speedtest integration."""
@@ -0,0 +1 @@
+"""Benchmarks for the Ookla Speedtest integration."""
@@ -0,0 +1,144 @@
+"""Fixtures for the benchmarks of the integration's hot paths."""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    MockEntityPlatform,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.ookla_speedtest import SpeedtestCoordinator
+from custom_components.ookla_speedtest.const import DOMAIN
+from custom_components.ookla_speedtest.history import ResultHistory, pack_result
+from custom_components.ookla_speedtest.result import SpeedtestResult
+from custom_components.ookla_speedtest.sensor import (
+    async_setup_entry as async_setup_sensors,
+)
+
+# Recorded --format=json output of speedtest.bin 1.2.0
+CLI_PAYLOAD = {
+    "type": "result",
+    "timestamp": "2024-05-01T08:00:00Z",
+    "ping": {"jitter": 0.412, "latency": 11.873, "low": 11.201, "high": 13.055},
+    "download": {
+        "bandwidth": 37412345,
+        "bytes": 412345678,
+        "elapsed": 11012,
+        "latency": {"iqm": 38.214, "low": 12.551, "high": 240.118, "jitter": 6.402},
+    },
+    "upload": {
+        "bandwidth": 5712345,
+        "bytes": 61234567,
+        "elapsed": 10507,
+        "latency": {"iqm": 24.631, "low": 11.902, "high": 130.772, "jitter": 3.118},
+    },
+    "packetLoss": 0,
+    "isp": "Example Broadband",
+    "interface": {
+        "internalIp": "192.168.1.50",
+        "name": "eth0",
+        "macAddr": "02:00:00:00:00:01",
+        "isVpn": False,
+        "externalIp": "203.0.113.10",
+    },
+    "server": {
+        "id": 12345,
+        "host": "speedtest.example.net",
+        "port": 8080,
+        "name": "Example Net",
+        "location": "Amsterdam",
+        "country": "Netherlands",
+        "ip": "198.51.100.1",
+    },
+    "result": {
+        "id": "0b5e6a9c-2f55-4d4e-9a35-6a1c1c8f2f11",
+        "url": "https://www.speedtest.net/result/c/0b5e6a9c-2f55-4d4e-9a35-6a1c1c8f2f11",
+        "persisted": True,
+    },
+}
+
+CITIES = ["Amsterdam", "Berlin", "Chicago", "Frankfurt", "London", "New York", "Paris", "Tokyo"]
+
+
+@pytest.fixture
+def result() -> SpeedtestResult:
+    """Return the parsed recorded result."""
+    return SpeedtestResult.from_cli(CLI_PAYLOAD, 400, 50)
+
+
+@pytest.fixture
+def raw_servers() -> list[dict]:
+    """Return a CLI style listing of 5,000 servers."""
+    rng = random.Random(1)
+    return [
+        {
+            "id": 10000 + index,
+            "name": f"Provider {index % 700} Networks",
+            "location": CITIES[index % len(CITIES)],
+            "country": "Somewhere",
+            "distance": rng.uniform(1, 5000),
+        }
+        for index in range(5000)
+    ]
+
+
+@pytest.fixture
+def history(tmp_path, result: SpeedtestResult) -> ResultHistory:
+    """Return a history file holding four tests a day for a year."""
+    config = SimpleNamespace(path=lambda *parts: str(tmp_path.joinpath(*parts)))
+    tmp_path.joinpath(".storage").mkdir()
+    history = ResultHistory(SimpleNamespace(config=config), "benchmark", 400)
+    start = dt_util.now() - timedelta(days=365)
+    for index in range(365 * 4):
+        history._append(
+            pack_result(
+                SpeedtestResult.from_dict(
+                    {**result.as_dict(), "timestamp": start + timedelta(hours=6 * index)}
+                )
+            )
+        )
+    return history
+
+
+@pytest.fixture
+def week_ago() -> float:
+    """Return the epoch time a week ago."""
+    return time.time() - 7 * 86400
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, auto_enable_custom_integrations, result: SpeedtestResult
+):
+    """Return a manual coordinator holding the recorded result."""
+    entry = MockConfigEntry(domain=DOMAIN, title="Ookla Speedtest")
+    entry.add_to_hass(hass)
+    coordinator = SpeedtestCoordinator(hass, entry, "closest", 60, True)
+    coordinator.latency_trends.add(result)
+    coordinator.async_set_updated_data(result)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    yield coordinator
+    await coordinator.async_shutdown()
+
+
+@pytest.fixture
+async def sensors(hass: HomeAssistant, coordinator: SpeedtestCoordinator) -> list:
+    """Add the integration's sensors for the coordinator and return them."""
+    created = []
+    await async_setup_sensors(
+        hass, coordinator.entry, lambda entities, **_: created.extend(entities)
+    )
+    platform = MockEntityPlatform(hass, domain="sensor", platform_name=DOMAIN)
+    await platform.async_add_entities(created)
+    await hass.async_block_till_done()
+    # Sensors disabled by default are not added
+    return [sensor for sensor in created if sensor.hass is not None]
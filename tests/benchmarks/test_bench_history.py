@@ -0,0 +1,39 @@
+"""Benchmarks for the result history and its downsampling."""
+
+from __future__ import annotations
+
+import random
+
+from custom_components.ookla_speedtest.const import ATTR_DOWNLOAD, ATTR_PING, ATTR_UPLOAD
+from custom_components.ookla_speedtest.history import (
+    ResultHistory,
+    _build_series,
+    downsample_lttb,
+    pack_result,
+)
+from custom_components.ookla_speedtest.result import SpeedtestResult
+
+
+def test_history_read_week(benchmark, history: ResultHistory, week_ago: float) -> None:
+    """Reading a week of records from a year-long history."""
+    assert benchmark(history.read_range, week_ago)
+
+
+def test_history_series(benchmark, history: ResultHistory) -> None:
+    """Building downsampled dashboard series for that year."""
+    records = history.read_range()
+    benchmark(_build_series, records, (ATTR_DOWNLOAD, ATTR_UPLOAD, ATTR_PING), 100)
+
+
+def test_lttb_downsample(benchmark) -> None:
+    """Downsampling 10,000 samples to 500 points."""
+    rng = random.Random(2)
+    samples = [(float(index), rng.uniform(0, 1000)) for index in range(10000)]
+    assert len(benchmark(downsample_lttb, samples, 500)) == 500
+
+
+def test_history_append(
+    benchmark, history: ResultHistory, result: SpeedtestResult
+) -> None:
+    """Appending a record to the history file."""
+    benchmark(history._append, pack_result(result))
@@ -0,0 +1,40 @@
+"""Benchmarks for result parsing and the server catalogue."""
+
+from __future__ import annotations
+
+from custom_components.ookla_speedtest.result import SpeedtestResult
+from custom_components.ookla_speedtest.server_catalog import (
+    ServerCatalog,
+    _normalize_server,
+)
+
+from .conftest import CLI_PAYLOAD
+
+
+def _catalog(raw_servers: list[dict]) -> tuple[ServerCatalog, list[dict]]:
+    normalized = [_normalize_server(server) for server in raw_servers]
+    catalog = ServerCatalog.__new__(ServerCatalog)
+    catalog._build_index(normalized)
+    return catalog, normalized
+
+
+def test_result_from_cli(benchmark) -> None:
+    """SpeedtestResult.from_cli on a recorded CLI payload."""
+    benchmark(SpeedtestResult.from_cli, CLI_PAYLOAD, 400, 50)
+
+
+def test_servers_normalize(benchmark, raw_servers: list[dict]) -> None:
+    """Normalising a 5,000 server CLI listing."""
+    benchmark(lambda: [_normalize_server(server) for server in raw_servers])
+
+
+def test_servers_index(benchmark, raw_servers: list[dict]) -> None:
+    """Building the catalogue index for 5,000 servers."""
+    catalog, normalized = _catalog(raw_servers)
+    benchmark(catalog._build_index, normalized)
+
+
+def test_servers_search(benchmark, raw_servers: list[dict]) -> None:
+    """Searching the 5,000 server catalogue."""
+    catalog, _ = _catalog(raw_servers)
+    assert benchmark(catalog.search, "provider 12 amst")
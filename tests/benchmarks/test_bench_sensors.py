@@ -0,0 +1,42 @@
+"""Benchmarks for coordinator updates reaching the sensors."""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import replace
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.ookla_speedtest import SpeedtestCoordinator
+from custom_components.ookla_speedtest.result import SpeedtestResult
+
+
+async def test_sensor_fanout(benchmark, sensors: list) -> None:
+    """State snapshots of every sensor for one update."""
+    benchmark(lambda: [sensor._state_snapshot() for sensor in sensors])
+
+
+async def test_refresh_state_write(
+    benchmark,
+    hass: HomeAssistant,
+    coordinator: SpeedtestCoordinator,
+    sensors: list,
+    result: SpeedtestResult,
+) -> None:
+    """A new result going from the coordinator to the written sensor states.
+
+    Results alternate between two download speeds, so every update has
+    state to write like a real run does.
+    """
+    results = itertools.cycle(
+        [replace(result, download=result.download + 1), result]
+    )
+    entity_id = next(
+        sensor.entity_id for sensor in sensors if sensor._field == "download"
+    )
+
+    benchmark(lambda: coordinator.async_set_updated_data(next(results)))
+    assert float(hass.states.get(entity_id).state) in (
+        result.download,
+        result.download + 1,
+    )
@@ -0,0 +1,9 @@
+"""Shared test setup."""
+
+import pytest
+
+
+@pytest.fixture
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Let Home Assistant load the integration from custom_components."""
+    return
@@ -0,0 +1,108 @@
+"""Tests for degradation detection and its confirmation re-test."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from homeassistant.util import dt as dt_util
+
+from custom_components import ookla_speedtest
+from custom_components.ookla_speedtest import SpeedtestCoordinator
+from custom_components.ookla_speedtest.degradation import DegradationDetector
+from custom_components.ookla_speedtest.result import SpeedtestResult
+from custom_components.ookla_speedtest.usage import DataUsage
+
+BASELINE = [9.38, 9.48] * 5
+DIP = 8.55
+
+
+def _result(download: float) -> SpeedtestResult:
+    return SpeedtestResult.from_dict(
+        {"timestamp": dt_util.now(), "download": download, "download_bytes": 1_000_000}
+    )
+
+
+@pytest.fixture
+def coordinator(monkeypatch):
+    """Return a coordinator with confirmation re-tests and no Home Assistant."""
+    retests = []
+    monkeypatch.setattr(
+        ookla_speedtest,
+        "async_call_later",
+        lambda hass, delay, action: retests.append(action) or (lambda: None),
+    )
+    events = []
+    coordinator = SpeedtestCoordinator.__new__(SpeedtestCoordinator)
+    coordinator.hass = SimpleNamespace(
+        bus=SimpleNamespace(async_fire=lambda event, data: events.append(data))
+    )
+    coordinator.entry = SimpleNamespace(entry_id="test")
+    coordinator.degradation = DegradationDetector()
+    coordinator.degradation_retest = True
+    coordinator._suspected_degradation = None
+    coordinator._unsub_retest = None
+    coordinator.retests = retests
+    coordinator.events = events
+    return coordinator
+
+
+def _suspect(coordinator) -> None:
+    """Feed a baseline, then dips until a degradation is suspected."""
+    for value in BASELINE:
+        coordinator._check_degradation(_result(value))
+    for _ in range(10):
+        coordinator._check_degradation(_result(DIP))
+        if coordinator._suspected_degradation:
+            return
+    pytest.fail("The dips never raised an alarm")
+
+
+def test_dip_then_recover_is_not_reported(coordinator) -> None:
+    """A re-test back at the baseline clears the suspicion without an event."""
+    _suspect(coordinator)
+    assert coordinator.retests
+    assert coordinator.events == []
+
+    coordinator._check_degradation(_result(9.43))
+    assert coordinator.events == []
+    assert coordinator._suspected_degradation is None
+
+    # The dip does not count towards the next alarm either
+    coordinator._check_degradation(_result(DIP))
+    assert coordinator._suspected_degradation is None
+    assert coordinator.events == []
+
+
+def test_dip_confirmed_by_retest(coordinator) -> None:
+    """A re-test that is still down reports a confirmed degradation."""
+    _suspect(coordinator)
+    coordinator._check_degradation(_result(DIP))
+
+    assert len(coordinator.events) == 1
+    event = coordinator.events[0]
+    assert event["metric"] == "download"
+    assert event["value"] == DIP
+    assert event["confirmed"] is True
+    assert coordinator._suspected_degradation is None
+
+
+def test_retest_skipped_by_budget_drops_suspicion(coordinator) -> None:
+    """A re-test skipped by the data budget does not leave a stale suspicion."""
+    _suspect(coordinator)
+    coordinator.monthly_data_budget = 1
+    coordinator.data_usage = DataUsage()
+    coordinator.data_usage.add(_result(9.43))
+    coordinator.update_interval = timedelta(hours=1)
+    coordinator.data = None
+    coordinator.start_time = None
+
+    asyncio.run(coordinator._async_update_data())
+    assert coordinator._suspected_degradation is None
+
+    # The next result starts a fresh detection rather than confirming
+    coordinator._check_degradation(_result(DIP))
+    assert coordinator.events == []
@@ -0,0 +1,32 @@
+"""Tests for the binary result history."""
+
+from __future__ import annotations
+
+import pytest
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.ookla_speedtest.history import RECORD, downsample_lttb, pack_result
+from custom_components.ookla_speedtest.result import SpeedtestResult
+
+
+@pytest.mark.parametrize(
+    ("server_id", "stored"),
+    [("12345", 12345), (None, 0), ("speedtest-eu-1", 0), ("99999999999", 0)],
+)
+def test_pack_result_server_id(server_id: str | None, stored: int) -> None:
+    """Server IDs that do not fit the record are stored as unknown."""
+    result = SpeedtestResult.from_dict(
+        {"timestamp": dt_util.now(), "server_id": server_id, "download": 100.0}
+    )
+
+    assert RECORD.unpack(pack_result(result))[1] == stored
+
+
+def test_downsample_keeps_end_points_below_three() -> None:
+    """Two points keep the first and last sample rather than everything."""
+    samples = [(float(index), float(index % 7)) for index in range(1000)]
+
+    assert downsample_lttb(samples, 2) == [samples[0], samples[-1]]
+    assert len(downsample_lttb(samples, 100)) == 100
+    assert downsample_lttb(samples[:5], 100) == samples[:5]
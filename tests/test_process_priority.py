@@ -0,0 +1,81 @@
+"""Tests for running the speedtest CLI at reduced priority."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from custom_components.ookla_speedtest.process_priority import (
+    log_priority_warnings,
+    parse_cpu_list,
+    priority_command,
+)
+
+# Prints the settings the child process started with
+REPORT = (
+    "import os; "
+    "print(os.getpriority(os.PRIO_PROCESS, 0)); "
+    "print(','.join(str(cpu) for cpu in sorted(os.sched_getaffinity(0))))"
+)
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "sched_setaffinity"), reason="needs Linux scheduling calls"
+)
+
+
+def _run(prefix: list[str], *cmd: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [*prefix, *cmd], capture_output=True, text=True, check=True, timeout=30
+    )
+
+
+def test_nothing_to_apply() -> None:
+    """Default settings run the CLI directly."""
+    assert priority_command(0, "none", None) == []
+
+
+def test_child_starts_with_nice_level_and_affinity() -> None:
+    """The exec'd command starts with the nice level and CPUs already set."""
+    nice = max(os.getpriority(os.PRIO_PROCESS, 0), 10)
+    cpu = min(os.sched_getaffinity(0))
+
+    output = _run(priority_command(nice, "none", {cpu}), sys.executable, "-c", REPORT)
+
+    assert output.stdout.split() == [str(nice), str(cpu)]
+    assert output.stderr == ""
+
+
+@pytest.mark.skipif(not shutil.which("ionice"), reason="needs ionice")
+def test_child_starts_with_idle_io_priority() -> None:
+    """The idle IO class is set before exec."""
+    output = _run(priority_command(0, "idle", None), "sh", "-c", "ionice -p $$")
+
+    assert output.stdout.strip() == "idle"
+
+
+def test_failed_setting_is_logged_and_command_still_runs(caplog) -> None:
+    """A setting that cannot be applied is reported, and the CLI runs anyway."""
+    unavailable = max(os.sched_getaffinity(0)) + 1024
+
+    output = _run(
+        priority_command(0, "none", {unavailable}), sys.executable, "-c", REPORT
+    )
+    log_priority_warnings(output.stderr)
+
+    assert output.stdout.split()[1] == ",".join(
+        str(cpu) for cpu in sorted(os.sched_getaffinity(0))
+    )
+    assert f"Could not pin speedtest to CPUs {unavailable}" in caplog.text
+
+
+def test_parse_cpu_list() -> None:
+    """CPU lists accept single CPUs, lists and ranges."""
+    assert parse_cpu_list("2") == {2}
+    assert parse_cpu_list("1, 3") == {1, 3}
+    assert parse_cpu_list("1-3") == {1, 2, 3}
+    with pytest.raises(ValueError):
+        parse_cpu_list("3-1")